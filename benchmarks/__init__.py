@@ -0,0 +1,16 @@
+"""
+Offline benchmark suite for LiveWeb Arena harness overhead.
+
+Measures the harness itself (browser, interceptor, cache, GT collection,
+validation plumbing) with model and network latency taken out:
+
+- mock_llm.py: OpenAI-compatible streaming server returning scripted actions
+- fixtures.py: local site fixtures (CoinGecko, Stooq, Taostats, Hacker News)
+  seeded into a throwaway page cache and served over HTTP for API clients
+- run.py: scenario runners writing JSON results that can be compared
+  between commits
+
+Usage:
+    python -m benchmarks.run --scenario evaluate --episodes 20 --concurrency 4
+    python -m benchmarks.run --scenario reset_step --compare benchmarks/results/<previous>.json
+"""
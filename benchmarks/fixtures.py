@@ -0,0 +1,302 @@
+"""
+Local site fixtures for offline benchmarks.
+
+Two sources of pages:
+- synthetic_pages(): deterministic pages generated from the plugin catalogs
+  (CoinGecko coins, Stooq instruments, Taostats subnets, HN stories) with
+  api_data in the same bulk shapes the plugins return for their homepages
+- load_captured_pages(): page.json files copied from a real cache directory
+
+seed_cache() writes either set into a cache directory so CacheInterceptor
+serves every plugin URL from disk. FixtureServer serves the same pages and
+API payloads over HTTP and can point API clients that are called during task
+generation (Taostats subnet list) at itself.
+"""
+
+import html
+import json
+import random
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from aiohttp import web
+
+from liveweb_arena.core.cache import CachedPage, normalize_url, url_to_cache_dir
+
+COINGECKO_HOME = "https://www.coingecko.com/"
+STOOQ_HOME = "https://stooq.com/"
+TAOSTATS_SUBNETS = "https://taostats.io/subnets"
+HN_HOME = "https://news.ycombinator.com/"
+
+
+def _render(title: str, columns: List[str], rows: List[List[str]]) -> tuple:
+    """HTML table page plus accessibility tree text in the cached format"""
+    head = "".join(f"<th>{html.escape(c)}</th>" for c in columns)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(v)}</td>" for v in row) + "</tr>"
+        for row in rows
+    )
+    page_html = (
+        f"<!DOCTYPE html><html><head><title>{html.escape(title)}</title></head>"
+        f"<body><h1>{html.escape(title)}</h1><table><thead><tr>{head}</tr></thead>"
+        f"<tbody>{body}</tbody></table></body></html>"
+    )
+
+    lines = [f'WebArea "{title}"', f'  heading "{title}"', '  table']
+    lines.append("    row " + " ".join(f'columnheader "{c}"' for c in columns))
+    for row in rows:
+        lines.append("    row " + " ".join(f'cell "{v}"' for v in row))
+    return page_html, "\n".join(lines)
+
+
+def _coingecko_page(rng: random.Random) -> CachedPage:
+    from liveweb_arena.plugins.coingecko.templates.price import CoinVariable
+
+    coins = {}
+    rows = []
+    for rank, coin in enumerate(CoinVariable.COINS, start=1):
+        price = round(rng.uniform(0.01, 50000.0), 4)
+        change = round(rng.uniform(-12.0, 12.0), 2)
+        supply = rng.uniform(1e6, 1e10)
+        coins[coin.coin_id] = {
+            "id": coin.coin_id,
+            "symbol": coin.symbol.lower(),
+            "name": coin.name,
+            "current_price": price,
+            "price_change_percentage_24h": change,
+            "market_cap": round(price * supply),
+            "market_cap_rank": rank,
+            "total_volume": round(price * supply * 0.05),
+        }
+        rows.append([str(rank), coin.name, coin.symbol, f"${price:,.2f}", f"{change:+.2f}%"])
+
+    page_html, tree = _render("Cryptocurrency Prices by Market Cap", ["#", "Coin", "Symbol", "Price", "24h"], rows)
+    return CachedPage(COINGECKO_HOME, page_html, {"coins": coins}, time.time(), tree, need_api=True)
+
+
+def _stooq_page(rng: random.Random) -> CachedPage:
+    from liveweb_arena.plugins.stooq.templates.variables import (
+        COMMODITIES, CURRENCIES, INDICES, US_STOCKS,
+    )
+
+    assets = {}
+    rows = []
+    for spec in [*US_STOCKS, *INDICES, *CURRENCIES, *COMMODITIES]:
+        open_price = round(rng.uniform(1.0, 5000.0), 2)
+        close = round(open_price * rng.uniform(0.95, 1.05), 2)
+        change = round(close - open_price, 2)
+        assets[spec.symbol] = {
+            "symbol": spec.symbol,
+            "open": open_price,
+            "high": round(max(open_price, close) * 1.01, 2),
+            "low": round(min(open_price, close) * 0.99, 2),
+            "close": close,
+            "daily_change": change,
+            "daily_change_pct": round(change / open_price * 100, 2),
+        }
+        rows.append([spec.symbol, spec.display_name, f"{close:.2f}", f"{change:+.2f}"])
+
+    page_html, tree = _render("Stooq", ["Symbol", "Name", "Last", "Change"], rows)
+    return CachedPage(STOOQ_HOME, page_html, {"assets": assets}, time.time(), tree, need_api=True)
+
+
+def raw_subnets(count: int = 64, seed: int = 0) -> List[dict]:
+    """Subnet rows in the TaoMarketCap API format (netuid 0 = root)"""
+    rng = random.Random(seed)
+    results = []
+    for netuid in range(count + 1):
+        price = rng.uniform(0.001, 0.5)
+        results.append({
+            "netuid": netuid,
+            "latest_snapshot": {
+                "token_symbol": f"SN{netuid}",
+                "subnet_identities_v3": {"subnetName": f"Subnet {netuid}"},
+                "subnet_tao": str(int(rng.uniform(1e3, 1e6) * 1e9)),
+                "subnet_alpha_in": str(int(rng.uniform(1e5, 1e7) * 1e9)),
+                "subnet_alpha_out": str(int(rng.uniform(1e5, 1e7) * 1e9)),
+                "subnet_volume": str(int(rng.uniform(1e2, 1e5) * 1e9)),
+                "subnet_tao_in_emission": str(int(rng.uniform(0.001, 0.05) * 1e9)),
+                "subnet_owner": f"5{netuid:047d}",
+                "price": price,
+                "dtao": {
+                    "taoLiquidity": str(int(rng.uniform(1e3, 1e6) * 1e9)),
+                    "price_diff_hour": rng.uniform(-5, 5),
+                    "price_diff_day": rng.uniform(-20, 20),
+                    "price_diff_week": rng.uniform(-40, 40),
+                    "price_diff_month": rng.uniform(-60, 60),
+                },
+            },
+        })
+    return results
+
+
+def _taostats_page(rng: random.Random) -> CachedPage:
+    from liveweb_arena.plugins.taostats.api_client import _parse_subnet_data
+
+    subnets = {
+        str(row["netuid"]): _parse_subnet_data(row)
+        for row in raw_subnets(seed=rng.randint(0, 2**31)) if row["netuid"]
+    }
+    rows = [[uid, s["name"], f"{s['price']:.4f}"] for uid, s in subnets.items()]
+    page_html, tree = _render("Subnets", ["Netuid", "Name", "Price"], rows)
+    return CachedPage(TAOSTATS_SUBNETS, page_html, {"subnets": subnets}, time.time(), tree, need_api=True)
+
+
+def _hackernews_page(rng: random.Random) -> CachedPage:
+    stories = {}
+    rows = []
+    for rank in range(1, 31):
+        story_id = 40000000 + rank
+        story = {
+            "id": story_id,
+            "rank": rank,
+            "type": "story",
+            "title": f"Fixture story {rank}",
+            "by": f"user{rng.randint(1, 500)}",
+            "score": rng.randint(1, 900),
+            "descendants": rng.randint(0, 400),
+            "time": int(time.time()) - rng.randint(0, 86400),
+            "url": f"https://example.com/{story_id}",
+        }
+        stories[str(story_id)] = story
+        rows.append([str(rank), story["title"], str(story["score"]), story["by"]])
+
+    page_html, tree = _render("Hacker News", ["Rank", "Title", "Points", "By"], rows)
+    return CachedPage(HN_HOME, page_html, {"stories": stories}, time.time(), tree, need_api=True)
+
+
+def synthetic_pages(seed: int = 0) -> Dict[str, CachedPage]:
+    """Deterministic fixture pages keyed by normalized URL"""
+    rng = random.Random(seed)
+    pages = [
+        _coingecko_page(rng),
+        _stooq_page(rng),
+        _taostats_page(rng),
+        _hackernews_page(rng),
+    ]
+    return {normalize_url(page.url): page for page in pages}
+
+
+def load_captured_pages(cache_dir: Path, domains: Optional[Iterable[str]] = None) -> Dict[str, CachedPage]:
+    """
+    Load page.json files from an existing cache directory.
+
+    Args:
+        cache_dir: Cache root (e.g. a copy of /var/lib/liveweb-arena/cache)
+        domains: Only load these domain subdirectories (default: all)
+
+    Returns:
+        {normalized_url: CachedPage}
+    """
+    cache_dir = Path(cache_dir)
+    roots = [cache_dir / d for d in domains] if domains else [cache_dir]
+    pages = {}
+    for root in roots:
+        for path in sorted(root.rglob("page.json")):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    page = CachedPage.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError):
+                continue
+            if page.is_complete():
+                pages[normalize_url(page.url)] = page
+    return pages
+
+
+def seed_cache(cache_dir: Path, pages: Dict[str, CachedPage]) -> int:
+    """
+    Write pages into a cache directory with a fresh fetched_at.
+
+    Returns:
+        Number of pages written
+    """
+    now = time.time()
+    for url, page in pages.items():
+        cache_file = url_to_cache_dir(Path(cache_dir), normalize_url(url)) / "page.json"
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        data = page.to_dict()
+        data["fetched_at"] = now
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+    return len(pages)
+
+
+class FixtureServer:
+    """
+    HTTP server for fixture pages and API payloads.
+
+    Routes:
+        GET /page?url=<site url>   cached HTML
+        GET /api?url=<site url>    cached api_data JSON
+        GET /taostats/subnets      subnet list in TaoMarketCap format
+
+    Usage:
+        server = FixtureServer(pages)
+        await server.start()
+        with server.patch_api_endpoints():
+            ...   # Taostats task generation hits the fixture server
+        await server.stop()
+    """
+
+    def __init__(self, pages: Dict[str, CachedPage], host: str = "127.0.0.1", port: int = 0, seed: int = 0):
+        self.pages = pages
+        self.host = host
+        self.port = port
+        self.seed = seed
+        self._runner: Optional[web.AppRunner] = None
+        self.requests = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/page", self._handle_page)
+        app.router.add_get("/api", self._handle_api)
+        app.router.add_get("/taostats/subnets", self._handle_subnets)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _lookup(self, request: web.Request) -> Optional[CachedPage]:
+        self.requests += 1
+        url = request.query.get("url", "")
+        return self.pages.get(normalize_url(url)) if url else None
+
+    async def _handle_page(self, request: web.Request) -> web.Response:
+        page = self._lookup(request)
+        if page is None:
+            return web.Response(status=404, text="fixture not found")
+        return web.Response(text=page.html, content_type="text/html")
+
+    async def _handle_api(self, request: web.Request) -> web.Response:
+        page = self._lookup(request)
+        if page is None or page.api_data is None:
+            return web.json_response({"error": "fixture not found"}, status=404)
+        return web.json_response(page.api_data)
+
+    async def _handle_subnets(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.json_response({"results": raw_subnets(seed=self.seed)})
+
+    @contextmanager
+    def patch_api_endpoints(self):
+        """Point API clients used during task generation at this server"""
+        from liveweb_arena.plugins.taostats import api_client as taostats_api
+
+        original = taostats_api.API_BASE_URL
+        taostats_api.API_BASE_URL = f"{self.base_url}/taostats"
+        try:
+            yield
+        finally:
+            taostats_api.API_BASE_URL = original
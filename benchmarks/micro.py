@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for hot pure-Python paths.
+
+Each case times one batch of realistic inputs (URLs, accessibility trees,
+LLM responses and API payloads from fixture or captured cache pages) and
+reports the best per-item time over several repeats. Cases whose time
+exceeds the limit in micro_thresholds.json are flagged and the run exits
+non-zero, so an optimisation (or a regression) on these paths shows up
+without a browser or network.
+
+Usage:
+    python -m benchmarks.micro
+    python -m benchmarks.micro --case normalize_url --case parse_stooq_csv
+    python -m benchmarks.micro --captured-cache /path/to/cache
+    python -m benchmarks.micro --stooq-csv aapl.csv --stooq-csv spx.csv   # real /q/d/l/ payloads
+    python -m benchmarks.micro --update-thresholds      # rebase limits on this machine
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.fixtures import load_captured_pages, synthetic_pages
+from benchmarks.run import RESULTS_DIR, compare, git_commit
+
+THRESHOLDS_FILE = Path(__file__).resolve().parent / "micro_thresholds.json"
+
+# Limit written by --update-thresholds: measured time x this factor
+THRESHOLD_HEADROOM = 3.0
+
+# A case maps to (callable running one batch, number of items in the batch)
+Case = Tuple[Callable[[], object], int]
+
+
+# ---- Inputs ----
+
+def _urls(pages) -> List[str]:
+    """Page URLs plus the query/tracking/case variants agents produce"""
+    from liveweb_arena.plugins.coingecko.templates.price import CoinVariable
+    from liveweb_arena.plugins.stooq.templates.variables import US_STOCKS
+
+    urls = [page.url for page in pages.values()]
+    urls += [f"https://www.coingecko.com/en/coins/{c.coin_id}" for c in CoinVariable.COINS]
+    urls += [f"https://stooq.com/q/?s={s.symbol.upper()}&utm_source=agent" for s in US_STOCKS]
+    urls += [f"https://stooq.com/q/d/?s={s.symbol}&i=d&c=0" for s in US_STOCKS]
+    urls += [f"https://taostats.io/subnets/{uid}/chart" for uid in range(1, 33)]
+    urls += [f"https://news.ycombinator.com/item?id={40000000 + i}" for i in range(30)]
+    urls += [
+        "https://www.google.com/search?q=bitcoin+price",
+        "https://stooq.com/favicon.ico",
+        "https://cdn.example.com/static/app.js?v=3",
+        "https://www.googletagmanager.com/gtm.js?id=GTM-X",
+        "https://stooq.com/q/l/?s=aapl.us&f=sd2t2ohlcv&h&e=csv",
+    ]
+    return urls
+
+
+def _tree_from_text(text: str) -> dict:
+    """Rebuild a Playwright-style snapshot dict from cached accessibility tree text"""
+    root = {"role": "WebArea", "name": "", "children": []}
+    stack = [(-1, root)]
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        depth = len(line) - len(line.lstrip(" \t"))
+        match = re.match(r'\s*(\S+)(?:\s+"([^"]*)")?', line)
+        node = {"role": match.group(1), "name": match.group(2) or "", "children": []}
+        while stack[-1][0] >= depth:
+            stack.pop()
+        stack[-1][1]["children"].append(node)
+        stack.append((depth, node))
+    return root
+
+
+LLM_RESPONSES = [
+    '{"action": {"type": "goto", "params": {"url": "https://stooq.com/q/?s=aapl.us"}}}',
+    (
+        "<think>The user wants the Bitcoin price. The homepage table lists it in the first row, "
+        "so I should open CoinGecko first and read the value {price} from the table.</think>\n"
+        "```json\n"
+        '{"action": {"type": "goto", "params": {"url": "https://www.coingecko.com/"}}}\n'
+        "```"
+    ),
+    (
+        "I have found all values. Summary: {a: 1} and {b: 2} were intermediate notes.\n"
+        '{"action": {"type": "stop", "params": {"format": "json", "final": {"answers": '
+        '{"answer1": "$97,412.55", "answer2": "+1.24%", "answer3": "231.40", "answer4": "SN19"}}}}}'
+    ),
+    "I am not sure what to do next. Let me think about it { more",
+]
+
+
+def _stooq_csv(days: int = 5000, seed: int = 0) -> str:
+    """Daily OHLCV history in Stooq's CSV layout (~20 years)"""
+    rng = random.Random(seed)
+    lines = ["Date,Open,High,Low,Close,Volume"]
+    price = 100.0
+    for day in range(days):
+        year, rest = divmod(day, 250)
+        month, dom = divmod(rest, 21)
+        open_price = price
+        price = max(1.0, price * (1 + rng.gauss(0, 0.015)))
+        high = max(open_price, price) * 1.005
+        low = min(open_price, price) * 0.995
+        lines.append(
+            f"{2005 + year}-{month + 1:02d}-{dom + 1:02d},"
+            f"{open_price:.2f},{high:.2f},{low:.2f},{price:.2f},{rng.randint(10**5, 10**7)}"
+        )
+    return "\r\n".join(lines) + "\r\n"
+
+
+# ---- Cases ----
+
+def build_cases(pages, stooq_csvs: Dict[str, str] = None) -> Dict[str, Case]:
+    from liveweb_arena.core.agent_policy import AgentPolicy
+    from liveweb_arena.core.cache import CacheManager, normalize_url, url_to_cache_dir
+    from liveweb_arena.core.gt_collector import GTCollector
+    from liveweb_arena.core.interceptor import CacheInterceptor
+    from liveweb_arena.core.reward import StepwiseRewardCalculator
+    from liveweb_arena.plugins import get_all_plugins
+    from liveweb_arena.plugins.stooq.api_client import _parse_stooq_csv
+
+    urls = _urls(pages)
+    cache_root = Path("/tmp/liveweb-bench-cache")
+
+    blocked_patterns = []
+    allowed_domains = set()
+    for plugin_cls in get_all_plugins().values():
+        plugin = plugin_cls()
+        blocked_patterns.extend(plugin.get_blocked_patterns())
+        allowed_domains.update(getattr(plugin, "allowed_domains", []))
+    interceptor = CacheInterceptor(
+        cached_pages={}, allowed_domains=allowed_domains, blocked_patterns=blocked_patterns,
+    )
+
+    trees = [_tree_from_text(page.accessibility_tree) for page in pages.values() if page.accessibility_tree]
+    tree_nodes = sum(page.accessibility_tree.count("\n") + 1 for page in pages.values() if page.accessibility_tree)
+    cache_manager = CacheManager(cache_root)
+
+    policy = AgentPolicy()
+    long_text = " ".join(LLM_RESPONSES) * 20
+
+    api_pages = [(page.url, page.api_data) for page in pages.values() if page.api_data]
+    collector = GTCollector(subtasks=[])
+
+    def merge_all():
+        collector._collected_api_data = {}
+        for url, api_data in api_pages:
+            collector._merge_api_data(url, api_data)
+
+    collected_ids = {f"asset{i}" for i in range(40)}
+    reward_urls = urls[:60]
+
+    def reward_episode():
+        calculator = StepwiseRewardCalculator(
+            target_assets={"bitcoin", "aapl.us", "asset3"},
+            required_domains={"www.coingecko.com", "stooq.com"},
+        )
+        for i, url in enumerate(reward_urls):
+            calculator.calculate_step_reward(url, "Success", set(list(collected_ids)[:i % 40]))
+
+    csv_text = _stooq_csv()
+    real_csvs = list((stooq_csvs or {}).items())
+
+    cases = {
+        "normalize_url": (lambda: [normalize_url(u) for u in urls], len(urls)),
+        "url_to_cache_dir": (lambda: [url_to_cache_dir(cache_root, u) for u in urls], len(urls)),
+        "interceptor_should_block": (lambda: [interceptor._should_block(u) for u in urls], len(urls)),
+        "format_accessibility_tree": (
+            lambda: [cache_manager._format_accessibility_tree(t) for t in trees], max(tree_nodes, 1),
+        ),
+        "policy_find_json_candidates": (lambda: policy._find_json_candidates(long_text), 1),
+        "policy_parse_response": (lambda: [policy.parse_response(r) for r in LLM_RESPONSES], len(LLM_RESPONSES)),
+        "gt_merge_api_data": (merge_all, len(api_pages)),
+        "reward_calculate_step_reward": (reward_episode, len(reward_urls)),
+        "parse_stooq_csv": (lambda: _parse_stooq_csv(csv_text, "aapl.us"), 1),
+    }
+    if real_csvs:
+        cases["parse_stooq_csv_real"] = (
+            lambda: [_parse_stooq_csv(text, symbol) for symbol, text in real_csvs], len(real_csvs),
+        )
+    return cases
+
+
+def measure(func: Callable[[], object], items: int, repeat: int) -> dict:
+    """Best-of-repeat per-item time in microseconds"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = timer.repeat(repeat=repeat, number=number)
+    best = min(times) / number
+    return {
+        "us_per_item": round(best / items * 1e6, 3),
+        "us_per_batch": round(best * 1e6, 3),
+        "items": items,
+        "loops": number,
+    }
+
+
+def load_thresholds(path: Path = THRESHOLDS_FILE) -> Dict[str, float]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for hot pure-Python paths")
+    parser.add_argument("--case", action="append", default=None, help="Run only this case (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repeats per case (default: 5)")
+    parser.add_argument("--captured-cache", type=str, default=None,
+                        help="Draw inputs from page.json files in this cache directory too")
+    parser.add_argument("--stooq-csv", action="append", default=None,
+                        help="Stooq daily CSV file (curl 'https://stooq.com/q/d/l/?s=aapl.us&i=d') "
+                             "for the parse_stooq_csv_real case (repeatable)")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Result JSON path (default: benchmarks/results/micro-<commit>-<time>.json)")
+    parser.add_argument("--compare", type=str, default=None, help="Baseline result JSON to diff against")
+    parser.add_argument("--update-thresholds", action="store_true",
+                        help=f"Rewrite {THRESHOLDS_FILE.name} as measured x {THRESHOLD_HEADROOM}")
+    args = parser.parse_args()
+
+    pages = synthetic_pages()
+    if args.captured_cache:
+        pages.update(load_captured_pages(Path(args.captured_cache)))
+
+    stooq_csvs = {
+        Path(path).stem: Path(path).read_text(encoding="utf-8") for path in (args.stooq_csv or [])
+    }
+    cases = build_cases(pages, stooq_csvs)
+    selected = args.case or list(cases)
+    unknown = [name for name in selected if name not in cases]
+    if unknown:
+        parser.error(f"Unknown case(s): {unknown}. Available: {list(cases)}")
+
+    thresholds = load_thresholds()
+    results = {}
+    regressions = []
+    for name in selected:
+        func, items = cases[name]
+        result = measure(func, items, args.repeat)
+        limit = thresholds.get(name)
+        result["threshold_us"] = limit
+        status = "ok"
+        if limit is not None and result["us_per_item"] > limit:
+            status = "REGRESSION"
+            regressions.append(name)
+        print(f"{name:<32} {result['us_per_item']:>12.3f} us/item   limit={limit}   {status}")
+        results[name] = result
+
+    report = {
+        "git_commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "config": {
+            "repeat": args.repeat,
+            "fixture_pages": len(pages),
+            "captured_cache": args.captured_cache,
+            "stooq_csv": args.stooq_csv,
+        },
+        "results": results,
+    }
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"micro-{report['git_commit'] or 'nogit'}-{datetime.now().strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results: {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print("\n".join(compare(json.load(f), report)))
+
+    if args.update_thresholds:
+        thresholds.update({
+            name: round(result["us_per_item"] * THRESHOLD_HEADROOM, 3) for name, result in results.items()
+        })
+        with open(THRESHOLDS_FILE, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(thresholds.items())), f, indent=2)
+            f.write("\n")
+        print(f"Thresholds written: {THRESHOLDS_FILE}", file=sys.stderr)
+        return 0
+
+    if regressions:
+        print(f"Over threshold: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Mock OpenAI-compatible chat completions server for benchmarks.
+
+Agent requests get the next action of a fixed script, chosen from the
+"**Step N/M**" marker of the step prompt, so every episode follows the same
+path regardless of concurrency. Validation requests (single or batched) are
+answered with a full score. Responses are streamed as SSE chunks with an
+optional first-token delay and per-chunk delay to model a real endpoint.
+"""
+
+import asyncio
+import json
+import re
+import time
+from typing import List, Optional
+
+from aiohttp import web
+
+STEP_PATTERN = re.compile(r"\*\*Step (\d+)/(\d+)\*\*")
+BATCH_ITEM_PATTERN = re.compile(r"^### Item (\d+)$", re.MULTILINE)
+VALIDATOR_MARKER = "You are an answer validator"
+
+
+def build_script(urls: List[str], num_answers: int = 4, answer: str = "42") -> List[dict]:
+    """Visit each URL, scroll once on the last page, then stop with answers."""
+    script = [{"type": "goto", "params": {"url": url}} for url in urls]
+    script.append({"type": "scroll", "params": {"direction": "down", "amount": 600}})
+    script.append({
+        "type": "stop",
+        "params": {"final": {"answers": {f"answer{i}": answer for i in range(1, num_answers + 1)}}},
+    })
+    return script
+
+
+class MockLLMServer:
+    """
+    Streaming chat completions endpoint with scripted agent actions.
+
+    Usage:
+        server = MockLLMServer(script=build_script(urls))
+        await server.start()
+        actor.evaluate(model="mock", base_url=server.base_url, ...)
+        await server.stop()
+    """
+
+    def __init__(
+        self,
+        script: List[dict],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        ttft: float = 0.0,
+        chunk_delay: float = 0.0,
+        chunk_chars: int = 16,
+    ):
+        """
+        Args:
+            script: Actions returned for step 1, 2, ... (last one repeats)
+            host: Bind address
+            port: Bind port (0 = pick a free port)
+            ttft: Seconds before the first chunk
+            chunk_delay: Seconds between chunks
+            chunk_chars: Characters of content per chunk
+        """
+        self.script = script
+        self.host = host
+        self.port = port
+        self.ttft = ttft
+        self.chunk_delay = chunk_delay
+        self.chunk_chars = chunk_chars
+        self._runner: Optional[web.AppRunner] = None
+
+        self.requests = 0
+        self.agent_requests = 0
+        self.validation_requests = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def respond(self, messages: List[dict]) -> str:
+        """Scripted completion text for a message list"""
+        prompt = "\n".join(str(m.get("content") or "") for m in messages)
+        if VALIDATOR_MARKER in prompt:
+            self.validation_requests += 1
+            ids = [int(i) for i in BATCH_ITEM_PATTERN.findall(prompt)]
+            if ids:
+                return json.dumps({"results": [{"id": i, "score": 1.0, "reasoning": "mock"} for i in ids]})
+            return json.dumps({"score": 1.0, "reasoning": "mock"})
+
+        self.agent_requests += 1
+        last_user = next(
+            (str(m.get("content") or "") for m in reversed(messages) if m.get("role") == "user"), "",
+        )
+        match = STEP_PATTERN.search(last_user)
+        step = int(match.group(1)) if match else 1
+        action = self.script[min(step, len(self.script)) - 1]
+        return json.dumps({"action": action})
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.requests += 1
+        model = body.get("model", "mock")
+        content = self.respond(body.get("messages", []))
+
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        if self.ttft:
+            await asyncio.sleep(self.ttft)
+
+        created = int(time.time())
+        for i in range(0, len(content), self.chunk_chars):
+            chunk = {
+                "id": "mock", "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": {"content": content[i:i + self.chunk_chars]}, "finish_reason": None}],
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            if self.chunk_delay:
+                await asyncio.sleep(self.chunk_delay)
+
+        prompt_chars = sum(len(str(m.get("content") or "")) for m in body.get("messages", []))
+        usage = {
+            "prompt_tokens": prompt_chars // 4,
+            "completion_tokens": len(content) // 4,
+            "total_tokens": prompt_chars // 4 + len(content) // 4,
+        }
+        final = {
+            "id": "mock", "object": "chat.completion.chunk", "created": created, "model": model,
+            "choices": [], "usage": usage,
+        }
+        await response.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode())
+        return response
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+Harness overhead benchmarks (offline).
+
+Scenarios:
+    evaluate    Actor.evaluate() episodes at a given concurrency
+    reset_step  Actor.reset()/step() with scripted actions (no LLM in the loop)
+
+Both run against a throwaway cache seeded with fixture pages and a local
+mock LLM, so the numbers reflect harness cost only: browser, interceptor,
+cache lookups, GT collection and validation plumbing.
+
+Usage:
+    python -m benchmarks.run --scenario evaluate --episodes 20 --concurrency 4
+    python -m benchmarks.run --scenario all --captured-cache /path/to/cache
+    python -m benchmarks.run --compare benchmarks/results/evaluate-abc1234-20260101T000000.json
+
+Results are written as JSON to benchmarks/results/ (or --output) and include
+the git commit, so runs from different commits can be diffed with --compare.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.fixtures import (  # noqa: E402
+    COINGECKO_HOME, HN_HOME, STOOQ_HOME, TAOSTATS_SUBNETS,
+    FixtureServer, load_captured_pages, seed_cache, synthetic_pages,
+)
+from benchmarks.mock_llm import MockLLMServer, build_script  # noqa: E402
+
+DEFAULT_TEMPLATES = [("coingecko", "coingecko_price"), ("stooq", "stooq_price")]
+
+# Fixture page the scripted agent visits for each plugin
+PLUGIN_START_URLS = {
+    "coingecko": COINGECKO_HOME,
+    "stooq": STOOQ_HOME,
+    "taostats": TAOSTATS_SUBNETS,
+    "hackernews": HN_HOME,
+}
+
+
+# ---- Measurement helpers ----
+
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+def latency_stats(values: List[float]) -> dict:
+    return {
+        "count": len(values),
+        "mean_ms": round(statistics.fmean(values), 3) if values else None,
+        "p50_ms": percentile(values, 50),
+        "p99_ms": percentile(values, 99),
+        "max_ms": round(max(values), 3) if values else None,
+    }
+
+
+def _find_span(node: dict, name: str) -> Optional[dict]:
+    if node.get("name") == name:
+        return node
+    for child in node.get("children", []):
+        found = _find_span(child, name)
+        if found:
+            return found
+    return None
+
+
+def step_latencies(trace: dict) -> List[float]:
+    """
+    Per-step wall time from an episode trace.
+
+    A step runs from the end of the previous action (or the start of the
+    agent loop) to the end of its own action: observation, LLM call and
+    browser action together.
+    """
+    loop = _find_span(trace, "agent_loop")
+    if not loop:
+        return []
+    boundaries = [loop["start_ms"]]
+    for child in loop.get("children", []):
+        if child["name"] == "action":
+            boundaries.append(child["start_ms"] + child["duration_ms"])
+    return [b - a for a, b in zip(boundaries, boundaries[1:])]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, timeout=10, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def find_task_id(templates: List[Tuple[str, str]]) -> int:
+    """First task_id whose template combination is exactly `templates`"""
+    from liveweb_arena.core.task_registry import TaskRegistry, max_task_id, parse_task_id
+
+    wanted = sorted(templates)
+    for task_id in range(1, max_task_id() + 1, TaskRegistry.TASK_IDS_PER_COMBO):
+        if sorted(parse_task_id(task_id)["templates"]) == wanted:
+            return task_id
+    raise ValueError(f"No task_id combination for templates {templates}")
+
+
+# ---- Scenarios ----
+
+async def bench_evaluate(actor, llm: MockLLMServer, args, templates) -> dict:
+    """N evaluate() episodes through the mock LLM at --concurrency"""
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+
+    results = await asyncio.gather(*[
+        actor.evaluate(
+            model="mock",
+            base_url=llm.base_url,
+            api_key="bench",
+            seed=args.seed + i,
+            num_subtasks=len(templates),
+            templates=templates,
+            max_concurrency=args.concurrency,
+            timeout=args.timeout,
+        )
+        for i in range(args.episodes)
+    ])
+
+    wall = time.perf_counter() - start
+    rss_after = rss_bytes()
+
+    steps: List[float] = []
+    hits = misses = 0
+    span_totals: Dict[str, float] = {}
+    for result in results:
+        extra = result.get("extra", {})
+        steps.extend(step_latencies(extra.get("trace", {})))
+        cache_stats = extra.get("cache_stats") or {}
+        hits += cache_stats.get("hits", 0)
+        misses += cache_stats.get("misses", 0)
+        for name, entry in (extra.get("trace_summary") or {}).items():
+            span_totals[name] = span_totals.get(name, 0.0) + entry["total_ms"]
+
+    errors = [r["error"].strip().splitlines()[-1] for r in results if r.get("error")]
+    episodes = len(results)
+    return {
+        "episodes": episodes,
+        "errors": len(errors),
+        "error_samples": errors[:3],
+        "wall_s": round(wall, 3),
+        "episodes_per_sec": round(episodes / wall, 4) if wall else None,
+        "episode_ms": latency_stats([r["time_taken"] * 1000 for r in results]),
+        "step_ms": latency_stats(steps),
+        "rss_mb_before": round(rss_before / 2**20, 1),
+        "rss_mb_after": round(rss_after / 2**20, 1),
+        "rss_kb_per_episode": round((rss_after - rss_before) / 1024 / episodes, 1) if episodes else None,
+        "cache": {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else None,
+        },
+        "llm_requests": llm.requests,
+        "span_mean_ms": {
+            name: round(total / episodes, 3)
+            for name, total in sorted(span_totals.items(), key=lambda kv: kv[1], reverse=True)[:15]
+        },
+    }
+
+
+async def bench_reset_step(actor, script: List[dict], args, templates) -> dict:
+    """reset() + scripted step() calls, sequentially, timed per call"""
+    from liveweb_arena.core.task_registry import parse_task_id
+
+    base_task_id = find_task_id(templates)
+    reset_ms: List[float] = []
+    step_ms: List[float] = []
+    errors = []
+
+    rss_before = rss_bytes()
+    start = time.perf_counter()
+
+    for i in range(args.episodes):
+        task_id = base_task_id + i
+        num_tasks = parse_task_id(task_id)["num_tasks"]
+        actions = script[:-1] + [build_script([], num_answers=num_tasks)[-1]]
+
+        t0 = time.perf_counter()
+        try:
+            response = await actor.reset(task_id=task_id, seed=args.seed + i)
+        except Exception as e:
+            errors.append(f"reset: {type(e).__name__}: {e}")
+            continue
+        reset_ms.append((time.perf_counter() - t0) * 1000)
+
+        episode_id = response.episode_id
+        try:
+            for action in actions:
+                t0 = time.perf_counter()
+                response = await actor.step(json.dumps({"action": action}), episode_id=episode_id)
+                step_ms.append((time.perf_counter() - t0) * 1000)
+                if response.info.get("error"):
+                    errors.append(f"step: {response.info['error']}")
+                if response.done:
+                    break
+        finally:
+            await actor.stop(episode_id)
+
+    wall = time.perf_counter() - start
+    rss_after = rss_bytes()
+    return {
+        "episodes": args.episodes,
+        "base_task_id": base_task_id,
+        "errors": len(errors),
+        "error_samples": [str(e)[:200] for e in errors[:3]],
+        "wall_s": round(wall, 3),
+        "episodes_per_sec": round(args.episodes / wall, 4) if wall else None,
+        "reset_ms": latency_stats(reset_ms),
+        "step_ms": latency_stats(step_ms),
+        "rss_mb_before": round(rss_before / 2**20, 1),
+        "rss_mb_after": round(rss_after / 2**20, 1),
+        "rss_kb_per_episode": round((rss_after - rss_before) / 1024 / args.episodes, 1) if args.episodes else None,
+    }
+
+
+async def run(args) -> dict:
+    from env import Actor
+    from liveweb_arena.utils.logger import set_verbose
+
+    set_verbose(args.verbose)
+    templates = [tuple(t.split("/", 1)) for t in args.templates.split(",")]
+    urls = list(dict.fromkeys(PLUGIN_START_URLS[plugin] for plugin, _ in templates))
+
+    pages = synthetic_pages(seed=args.seed)
+    if args.captured_cache:
+        pages.update(load_captured_pages(Path(args.captured_cache)))
+
+    scenarios = ["evaluate", "reset_step"] if args.scenario == "all" else [args.scenario]
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="liveweb-bench-") as cache_dir:
+        seed_cache(Path(cache_dir), pages)
+        script = build_script(urls, num_answers=len(templates))
+        llm = MockLLMServer(script, ttft=args.ttft, chunk_delay=args.chunk_delay)
+        fixtures = FixtureServer(pages, seed=args.seed)
+        await llm.start()
+        await fixtures.start()
+        actor = Actor(api_key="bench", cache_dir=Path(cache_dir), use_cache=True, llm_cache_mode="off")
+        try:
+            with fixtures.patch_api_endpoints():
+                for scenario in scenarios:
+                    print(f"[bench] {scenario}: {args.episodes} episodes, templates={templates}", file=sys.stderr)
+                    if scenario == "evaluate":
+                        results[scenario] = await bench_evaluate(actor, llm, args, templates)
+                    else:
+                        results[scenario] = await bench_reset_step(actor, script, args, templates)
+        finally:
+            await actor.shutdown()
+            await fixtures.stop()
+            await llm.stop()
+
+    return {
+        "git_commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "scenario": args.scenario,
+            "episodes": args.episodes,
+            "concurrency": args.concurrency,
+            "templates": [list(t) for t in templates],
+            "seed": args.seed,
+            "ttft": args.ttft,
+            "chunk_delay": args.chunk_delay,
+            "fixture_pages": len(pages),
+            "captured_cache": args.captured_cache,
+        },
+        "results": results,
+    }
+
+
+# ---- Comparison ----
+
+def _flatten(data: dict, prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(baseline: dict, current: dict) -> List[str]:
+    """One line per numeric result present in both runs"""
+    old = _flatten(baseline.get("results", {}))
+    new = _flatten(current.get("results", {}))
+    lines = [f"baseline {baseline.get('git_commit')} -> current {current.get('git_commit')}"]
+    for key in sorted(old.keys() & new.keys()):
+        before, after = old[key], new[key]
+        delta = f"{(after - before) / before * 100:+.1f}%" if before else "n/a"
+        lines.append(f"  {key:<45} {before:>12} -> {after:<12} ({delta})")
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LiveWeb Arena harness overhead benchmarks (offline)")
+    parser.add_argument("--scenario", choices=["evaluate", "reset_step", "all"], default="all",
+                        help="Scenario to run (default: all)")
+    parser.add_argument("--episodes", type=int, default=10, help="Episodes per scenario (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=2,
+                        help="Actor max_concurrency for evaluate (default: 2)")
+    parser.add_argument("--templates", type=str,
+                        default=",".join(f"{p}/{t}" for p, t in DEFAULT_TEMPLATES),
+                        help="Comma-separated plugin/template list (default: coingecko_price + stooq_price)")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed for fixtures and tasks (default: 0)")
+    parser.add_argument("--timeout", type=int, default=300, help="Per-episode timeout in seconds (default: 300)")
+    parser.add_argument("--ttft", type=float, default=0.0, help="Mock LLM time to first token in seconds")
+    parser.add_argument("--chunk-delay", type=float, default=0.0, help="Mock LLM delay between chunks in seconds")
+    parser.add_argument("--captured-cache", type=str, default=None,
+                        help="Also replay page.json files from this cache directory")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Result JSON path (default: benchmarks/results/<scenario>-<commit>-<time>.json)")
+    parser.add_argument("--compare", type=str, default=None, help="Baseline result JSON to diff against")
+    parser.add_argument("--verbose", action="store_true", help="Show harness logs")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    output = Path(args.output) if args.output else RESULTS_DIR / (
+        f"{args.scenario}-{report['git_commit'] or 'nogit'}-"
+        f"{datetime.now().strftime('%Y%m%dT%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(json.dumps(report["results"], indent=2))
+    print(f"Results: {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print("\n".join(compare(baseline, report)))
+
+    failed = any(r.get("errors") for r in report["results"].values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
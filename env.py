@@ -5,6 +5,7 @@ import os
 import random
 import time
 import uuid
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
@@ -13,6 +14,7 @@ from liveweb_arena.core.browser import BrowserEngine, BrowserSession
 from liveweb_arena.core.task_manager import TaskManager
 from liveweb_arena.core.agent_policy import AgentPolicy
 from liveweb_arena.core.agent_loop import AgentLoop, BrowserFatalError
+from liveweb_arena.core.observation_compressor import ObservationCompressor
 from liveweb_arena.core.parser import AnswerParser
 from liveweb_arena.core.gt_collector import GTCollector, set_current_gt_collector
 from liveweb_arena.core.cache import CacheManager, CachedPage, CacheFatalError, PageRequirement, normalize_url
@@ -20,10 +22,17 @@ from liveweb_arena.core.interceptor import CacheInterceptor
 from liveweb_arena.core.models import BrowserObservation, CompositeTask, TrajectoryStep
 from liveweb_arena.core.reward import StepwiseRewardCalculator, RewardConfig, RewardBreakdown
 from liveweb_arena.plugins.base import BasePlugin
+from liveweb_arena.plugins.base_client import close_http_sessions
 from liveweb_arena.plugins import get_all_plugins
 from liveweb_arena.core.validators.llm_validator import validate_answers_with_llm
+from liveweb_arena.utils.llm_cache import LLMResponseCache
 from liveweb_arena.utils.llm_client import LLMClient, LLMFatalError
 from liveweb_arena.utils.logger import log
+from liveweb_arena.utils.metrics import (
+    CACHE_FATAL_ERRORS, EPISODE_SECONDS, EPISODES, EPISODES_IN_FLIGHT, render_prometheus,
+)
+from liveweb_arena.utils.profiling import EpisodeProfiler, parse_sample_rate, should_profile
+from liveweb_arena.utils.tracing import export_trace, span, start_trace, summarize
 from urllib.parse import urlparse
 
 # Import OpenEnvResponse from affinetes
@@ -100,8 +109,10 @@ async def _handle_observation_event(interceptor, cached_pages, plugins_used, gt_
             try:
                 api_data = await plugin.fetch_api_data(url)
             except Exception as e:
+                CACHE_FATAL_ERRORS.inc(domain=urlparse(url).netloc)
                 raise CacheFatalError(f"LIVE mode API fetch failed (GT invalid): {e}", url=url)
             if not api_data:
+                CACHE_FATAL_ERRORS.inc(domain=urlparse(url).netloc)
                 raise CacheFatalError(f"LIVE mode API returned empty data (GT invalid)", url=url)
     await gt_collector.on_page_visit(url, obs.accessibility_tree, api_data=api_data)
 
@@ -152,6 +163,9 @@ class EpisodeState:
     cumulative_reward: float = 0.0
     reward_history: List[RewardBreakdown] = field(default_factory=list)
 
+    # Profiling (None unless this episode was sampled)
+    profiler: Optional[EpisodeProfiler] = None
+
 
 class Actor:
     """
@@ -170,6 +184,14 @@ class Actor:
         api_key: str = None,
         cache_dir: Optional[Path] = None,
         use_cache: bool = True,
+        llm_hedge: bool = False,
+        llm_hedge_base_url: Optional[str] = None,
+        llm_cache_mode: Optional[str] = None,
+        batch_validation: bool = False,
+        fast_validation: bool = True,
+        trace_dir: Optional[str] = None,
+        profile: Optional[float] = None,
+        profile_dir: Optional[str] = None,
     ):
         """
         Initialize Actor.
@@ -178,6 +200,19 @@ class Actor:
             api_key: API key for LLM service. Falls back to API_KEY env var.
             cache_dir: Cache directory (default: ./cache)
             use_cache: Whether to use cache (True) or live mode (False)
+            llm_hedge: Hedge LLM requests whose first token is later than the observed p95
+            llm_hedge_base_url: Fallback endpoint for hedge requests (default: same endpoint)
+            llm_cache_mode: LLM response cache mode (read_through, record, replay).
+                Falls back to LIVEWEB_LLM_CACHE_MODE; unset disables the cache.
+            batch_validation: Validate all subtask answers of an episode in one LLM request
+            fast_validation: Score clear-cut answers with deterministic validators
+                and send only ambiguous ones to the LLM judge
+            trace_dir: Write each evaluate() trace as OpenTelemetry JSON to this
+                directory (falls back to LIVEWEB_TRACE_DIR; unset = result JSON only)
+            profile: Fraction of episodes to run under a profiler (1.0 = all).
+                Falls back to LIVEWEB_PROFILE; unset disables profiling.
+            profile_dir: Directory for profile files (falls back to
+                LIVEWEB_PROFILE_DIR, then ./profiles)
         """
         self.api_key = api_key or os.getenv("API_KEY") or os.getenv("CHUTES_API_KEY")
         self.browser: Optional[BrowserEngine] = None
@@ -189,6 +224,18 @@ class Actor:
         # Episode storage for OpenEnv interface
         self._episodes: Dict[str, EpisodeState] = {}
 
+        # Long-lived LLM clients (one connection pool per endpoint + key)
+        self._llm_clients: Dict[tuple, LLMClient] = {}
+        self._llm_hedge = llm_hedge
+        self._llm_hedge_base_url = llm_hedge_base_url
+        self._batch_validation = batch_validation
+        self._fast_validation = fast_validation
+        self._trace_dir = trace_dir
+        self._profile_rate = parse_sample_rate(
+            profile if profile is not None else os.environ.get("LIVEWEB_PROFILE")
+        )
+        self._profile_dir = profile_dir
+
         # Initialize cache manager
         if cache_dir is None:
             # Check environment variable first
@@ -199,6 +246,9 @@ class Actor:
                 cache_dir = Path("/var/lib/liveweb-arena/cache")
         self.cache_manager = CacheManager(cache_dir)
 
+        # Optional on-disk LLM response cache (shared by agent and validation calls)
+        self._llm_cache = LLMResponseCache.from_env(mode=llm_cache_mode, default_dir=cache_dir / "_llm")
+
     def _collect_plugin_info(self, task: CompositeTask):
         """Collect plugins, domains, patterns from task."""
         allowed_domains: Set[str] = set()
@@ -254,6 +304,9 @@ class Actor:
         temperature: float = 0.7,
         max_concurrency: int = 2,
         task_id: Optional[int] = None,
+        conversation_mode: str = "single",
+        obs_token_budget: Optional[int] = None,
+        early_stop: bool = False,
     ) -> dict:
         """
         Run a single evaluation.
@@ -270,6 +323,12 @@ class Actor:
             temperature: LLM temperature
             max_concurrency: Container-local concurrency limit
             task_id: Optional task ID for deterministic question type
+            conversation_mode: "single" (fresh prompt per step) or "multi_turn"
+                (append-only conversation, friendly to server-side prefix caching)
+            obs_token_budget: If set, compress the accessibility tree in each step
+                prompt toward this many tokens (None = send observations unchanged)
+            early_stop: Cancel LLM generation once a complete action JSON has
+                been streamed (usage is estimated for cancelled streams)
 
         Returns:
             Evaluation result dict with scores and metadata
@@ -302,20 +361,33 @@ class Actor:
         if self._semaphore is None:
             self._semaphore = asyncio.Semaphore(max_concurrency)
 
-        async with self._semaphore:
+        with start_trace(
+            "episode", task_id=task_id, seed=seed, model=model, num_subtasks=num_subtasks,
+        ) as trace_root:
+            with span("concurrency_wait"):
+                await self._semaphore.acquire()
+            EPISODES_IN_FLIGHT.inc()
+            profiler = self._new_profiler(f"episode-{task_id}-{seed}-{trace_root.trace_id[:8]}")
             try:
-                result = await self._run_evaluation(
-                    model=model,
-                    base_url=base_url,
-                    api_key=current_api_key,
-                    seed=seed,
-                    num_subtasks=num_subtasks,
-                    templates=templates,
-                    max_steps=max_steps,
-                    timeout=timeout,
-                    temperature=temperature,
-                    task_id=task_id,
-                )
+                with profiler.running() if profiler else nullcontext():
+                    # Own task = own copy of the context: per-episode context
+                    # variables (pinned Taostats snapshot, Stooq rate-limit flag,
+                    # GT collector) never carry over to the caller's next episode
+                    result = await asyncio.ensure_future(self._run_evaluation(
+                        model=model,
+                        base_url=base_url,
+                        api_key=current_api_key,
+                        seed=seed,
+                        num_subtasks=num_subtasks,
+                        templates=templates,
+                        max_steps=max_steps,
+                        timeout=timeout,
+                        temperature=temperature,
+                        task_id=task_id,
+                        conversation_mode=conversation_mode,
+                        obs_token_budget=obs_token_budget,
+                        early_stop=early_stop,
+                    ))
             except Exception as e:
                 import traceback
                 result = {
@@ -331,8 +403,24 @@ class Actor:
                     },
                     "error": traceback.format_exc(),
                 }
+            finally:
+                EPISODES_IN_FLIGHT.dec()
+                self._semaphore.release()
 
         result["time_taken"] = time.time() - start_time
+        EPISODE_SECONDS.observe(result["time_taken"])
+        if result.get("error"):
+            EPISODES.inc(status="error")
+        else:
+            EPISODES.inc(status="success" if result.get("success") else "failure")
+        result.setdefault("extra", {})["trace"] = trace_root.to_dict()
+        result["extra"]["trace_summary"] = summarize(trace_root)
+        try:
+            export_trace(trace_root, self._trace_dir)
+        except Exception as e:
+            log("Actor", f"Trace export failed: {e}")
+        if profiler is not None:
+            result["extra"]["profile"] = self._save_profile(profiler)
         return result
 
     async def _run_evaluation(
@@ -347,15 +435,19 @@ class Actor:
         timeout: int,
         temperature: float,
         task_id: Optional[int] = None,
+        conversation_mode: str = "single",
+        obs_token_budget: Optional[int] = None,
+        early_stop: bool = False,
     ) -> dict:
         """Internal evaluation logic."""
         await self._ensure_browser()
 
-        task = await self.task_manager.generate_composite_task(
-            seed=seed,
-            num_subtasks=num_subtasks,
-            templates=templates,
-        )
+        with span("task_generation"):
+            task = await self.task_manager.generate_composite_task(
+                seed=seed,
+                num_subtasks=num_subtasks,
+                templates=templates,
+            )
         log("Actor", f"Generated {len(task.subtasks)} subtasks, seed={seed}")
         for i, subtask in enumerate(task.subtasks, 1):
             q = subtask.intent
@@ -388,14 +480,16 @@ class Actor:
 
         try:
             # Create browser session
-            session = await self.browser.new_session()
+            with span("browser_session"):
+                session = await self.browser.new_session()
 
             # Set up interceptor
-            interceptor = await self._setup_interceptor(
-                session, cached_pages, allowed_domains, blocked_patterns, plugins_used,
-            )
+            with span("interceptor_setup"):
+                interceptor = await self._setup_interceptor(
+                    session, cached_pages, allowed_domains, blocked_patterns, plugins_used,
+                )
 
-            llm_client = LLMClient(base_url=base_url, api_key=api_key)
+            llm_client = self._get_llm_client(base_url, api_key)
 
             # Initialize unified GT collector
             gt_collector = GTCollector(
@@ -419,10 +513,14 @@ class Actor:
             agent_loop = AgentLoop(
                 session=session,
                 llm_client=llm_client,
-                policy=AgentPolicy(),
+                policy=AgentPolicy(conversation_mode=conversation_mode),
                 max_steps=effective_max_steps,
                 on_navigation=on_navigation,
                 on_observation=on_observation,
+                observation_compressor=(
+                    ObservationCompressor(token_budget=obs_token_budget) if obs_token_budget else None
+                ),
+                early_stop=early_stop,
             )
 
             # Failure tracking:
@@ -440,10 +538,11 @@ class Actor:
             }
 
             try:
-                trajectory, final_answer, usage = await asyncio.wait_for(
-                    agent_loop.run(task=task, model=model, temperature=temperature, seed=seed),
-                    timeout=timeout,
-                )
+                with span("agent_loop", max_steps=effective_max_steps):
+                    trajectory, final_answer, usage = await asyncio.wait_for(
+                        agent_loop.run(task=task, model=model, temperature=temperature, seed=seed),
+                        timeout=timeout,
+                    )
                 if agent_loop.is_parse_failed():
                     failure_reason = "parse_failed"
                     log("Actor", "Parse failed - model output not valid JSON", force=True)
@@ -486,7 +585,8 @@ class Actor:
             # GT is collected in real-time via on_observation callback
             # For API_ONLY and HYBRID templates, fetch remaining API GT
             # HYBRID templates use collected api_data from page visits
-            await gt_collector.fetch_remaining_api_gt()
+            with span("gt_fetch"):
+                await gt_collector.fetch_remaining_api_gt()
 
             # Clean up GT collector reference
             set_current_gt_collector(None)
@@ -515,12 +615,17 @@ class Actor:
             parsed_answers = parser.parse_answers(final_answer, num_subtasks)
             output_format = parser.get_output_format(final_answer)
             validation_rules = {}
+            fast_validators = {}
             for subtask in task.subtasks:
                 plugin = self.task_manager.get_plugin(subtask.plugin_name)
                 if hasattr(plugin, 'get_validation_rules'):
                     validation_rules[subtask.answer_tag] = plugin.get_validation_rules(
                         subtask.validation_info
                     )
+                if self._fast_validation and hasattr(plugin, 'get_fast_validator'):
+                    fast_validators[subtask.answer_tag] = plugin.get_fast_validator(
+                        subtask.validation_info
+                    )
 
             # Handle GT extraction failures - these get 0 score immediately
             # Only validate subtasks that have GT available
@@ -547,15 +652,26 @@ class Actor:
             answer_validations = pre_failed_validations.copy()
 
             if subtasks_to_validate:
-                llm_validations = await validate_answers_with_llm(
-                    llm_client=llm_client,
-                    subtasks=subtasks_to_validate,
-                    answers=parsed_answers,
-                    ground_truths=ground_truths,
-                    validation_rules=validation_rules,
-                )
+                with span("validation", answers=len(subtasks_to_validate)):
+                    llm_validations = await validate_answers_with_llm(
+                        llm_client=llm_client,
+                        subtasks=subtasks_to_validate,
+                        answers=parsed_answers,
+                        ground_truths=ground_truths,
+                        validation_rules=validation_rules,
+                        batch=self._batch_validation,
+                        fast_validators=fast_validators,
+                    )
                 answer_validations.extend(llm_validations)
 
+            fast_count = sum(1 for v in answer_validations if v.get("validated_by") == "fast")
+            judged_count = sum(1 for v in answer_validations if "validated_by" in v)
+            validation_fast_path = {
+                "answers": judged_count,
+                "fast": fast_count,
+                "fast_path_rate": fast_count / judged_count if judged_count else 0.0,
+            }
+
             # Sort by answer_tag for consistent ordering
             answer_validations.sort(key=lambda v: v.get("answer_tag", ""))
 
@@ -602,7 +718,11 @@ class Actor:
                     "answer_details": answer_validations,
                     "conversation": conversation,
                     "failure_reason": failure_reason,
+                    # Process-wide connection, limiter and breaker counters are
+                    # cumulative across episodes; they live in Actor.metrics().
                     "cache_stats": interceptor_stats,
+                    "observation_compression": agent_loop.get_compression_stats(),
+                    "validation_fast_path": validation_fast_path,
                 },
             }
 
@@ -634,7 +754,25 @@ class Actor:
                 interceptor.cleanup()
             cached_pages.clear()
             if session is not None:
-                await session.close()
+                with span("session_close"):
+                    await session.close()
+
+    def _new_profiler(self, name: str) -> Optional[EpisodeProfiler]:
+        """Profiler for a new episode if it is sampled, else None."""
+        if not should_profile(self._profile_rate):
+            return None
+        return EpisodeProfiler(name, directory=self._profile_dir)
+
+    def _save_profile(self, profiler: EpisodeProfiler) -> Optional[dict]:
+        """Write an episode profile; failures are logged, never raised."""
+        try:
+            info = profiler.save()
+        except Exception as e:
+            log("Actor", f"Profile export failed: {e}")
+            return None
+        if info:
+            log("Actor", f"Profile saved: {info['path']}")
+        return info
 
     async def _ensure_browser(self):
         """Ensure browser is started (lazy initialization)."""
@@ -643,12 +781,49 @@ class Actor:
                 self.browser = BrowserEngine(headless=True)
                 await self.browser.start()
 
+    def _get_llm_client(self, base_url: str, api_key: str) -> LLMClient:
+        """Get the shared LLM client for an endpoint (reused across episodes)."""
+        key = (base_url.rstrip("/"), api_key)
+        client = self._llm_clients.get(key)
+        if client is None:
+            client = LLMClient(
+                base_url=base_url,
+                api_key=api_key,
+                hedge=self._llm_hedge,
+                hedge_base_url=self._llm_hedge_base_url,
+                response_cache=self._llm_cache,
+            )
+            self._llm_clients[key] = client
+        return client
+
+    def metrics(self) -> str:
+        """
+        Process-wide metrics in Prometheus text format.
+
+        Mount on the HTTP server as GET /metrics with
+        liveweb_arena.utils.metrics.CONTENT_TYPE.
+        """
+        return render_prometheus()
+
     async def shutdown(self):
         """Shutdown browser and cleanup resources."""
         if self.browser:
             await self.browser.stop()
             self.browser = None
 
+        clients = list(self._llm_clients.values())
+        self._llm_clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                log("Actor", f"Error closing LLM client: {e}")
+
+        try:
+            await close_http_sessions()
+        except Exception as e:
+            log("Actor", f"Error closing plugin HTTP sessions: {e}")
+
     def _build_conversation(
         self,
         task,
@@ -715,6 +890,22 @@ class Actor:
         Returns:
             OpenEnvResponse with initial observation
         """
+        profiler = self._new_profiler(f"reset-{task_id}-{seed}")
+        if profiler is None:
+            return await self._reset(task_id, seed)
+        with profiler.running():
+            response = await self._reset(task_id, seed, profiler=profiler)
+        # Saved by stop(); named after the episode from here on
+        profiler.name = f"episode-{response.episode_id}"
+        return response
+
+    async def _reset(
+        self,
+        task_id: Optional[int],
+        seed: Optional[int],
+        profiler: Optional[EpisodeProfiler] = None,
+    ) -> OpenEnvResponse:
+        """Internal reset logic."""
         # Generate seed if not provided
         seed = seed if seed is not None else random.randint(0, 2**32 - 1)
 
@@ -831,6 +1022,7 @@ class Actor:
                 max_steps=max_steps,
                 last_observation=obs,
                 reward_calculator=reward_calculator,
+                profiler=profiler,
             )
             self._episodes[episode_id] = episode
             episode_added = True
@@ -872,6 +1064,18 @@ class Actor:
         Returns:
             OpenEnvResponse with new observation
         """
+        episode = self._episodes.get(episode_id) if episode_id else None
+        if episode is None or episode.profiler is None:
+            return await self._step(action, episode_id)
+        with episode.profiler.running():
+            return await self._step(action, episode_id)
+
+    async def _step(
+        self,
+        action: str,
+        episode_id: Optional[str],
+    ) -> OpenEnvResponse:
+        """Internal step logic."""
         # Validate episode
         if not episode_id:
             return OpenEnvResponse(
@@ -1124,7 +1328,7 @@ class Actor:
         except Exception as e:
             log("Actor", f"Error closing session for episode {episode_id[:8]}...: {e}")
 
-        return {
+        result = {
             "status": "ok",
             "stopped": True,
             "episode_id": episode_id,
@@ -1139,6 +1343,9 @@ class Actor:
                 "cache_stats": interceptor_stats,
             },
         }
+        if episode.profiler is not None:
+            result["profile"] = self._save_profile(episode.profiler)
+        return result
 
     # ========== OpenEnv Helper Methods ==========
 
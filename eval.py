@@ -25,6 +25,7 @@ import asyncio
 import json
 import logging
 import os
+import shutil
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -92,6 +93,63 @@ async def main():
         default=0.0,
         help="LLM temperature (default: 0.0)",
     )
+    parser.add_argument(
+        "--conversation-mode",
+        type=str,
+        choices=["single", "multi_turn"],
+        default="single",
+        help="Prompt layout: single (fresh prompt per step) or multi_turn (append-only, prefix-cache friendly)",
+    )
+    parser.add_argument(
+        "--obs-token-budget",
+        type=int,
+        default=None,
+        help="Compress each step's accessibility tree toward this many tokens (default: no compression)",
+    )
+    parser.add_argument(
+        "--early-stop",
+        action="store_true",
+        help="Stop LLM generation as soon as a complete action JSON has been streamed",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Send a duplicate LLM request when the first token is slower than the observed p95",
+    )
+    parser.add_argument(
+        "--hedge-base-url",
+        type=str,
+        default=None,
+        help="Fallback endpoint for hedge requests (default: --base-url)",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        type=str,
+        choices=["read_through", "record", "replay"],
+        default=None,
+        help="On-disk LLM response cache mode (default: LIVEWEB_LLM_CACHE_MODE or disabled)",
+    )
+    parser.add_argument(
+        "--batch-validation",
+        action="store_true",
+        help="Validate all subtask answers in a single LLM request",
+    )
+    parser.add_argument(
+        "--no-fast-validation",
+        action="store_true",
+        help="Send every answer to the LLM judge (disable the deterministic fast path)",
+    )
+    parser.add_argument(
+        "--trace-dir",
+        type=str,
+        default=None,
+        help="Write per-episode latency traces as OpenTelemetry JSON to this directory",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Run the episode under a profiler and save the profile next to the result file",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -188,7 +246,17 @@ async def main():
     use_cache = not args.live
 
     # Initialize actor
-    actor = Actor(api_key=api_key, use_cache=use_cache)
+    actor = Actor(
+        api_key=api_key,
+        use_cache=use_cache,
+        llm_hedge=args.hedge or bool(args.hedge_base_url),
+        llm_hedge_base_url=args.hedge_base_url,
+        llm_cache_mode=args.llm_cache,
+        batch_validation=args.batch_validation,
+        fast_validation=not args.no_fast_validation,
+        trace_dir=args.trace_dir,
+        profile=1.0 if args.profile else None,
+    )
 
     if not use_cache:
         print("Mode: LIVE (real-time web requests, no caching)")
@@ -208,6 +276,9 @@ async def main():
             timeout=args.timeout,
             temperature=args.temperature,
             task_id=args.task_id,
+            conversation_mode=args.conversation_mode,
+            obs_token_budget=args.obs_token_budget,
+            early_stop=args.early_stop,
         )
 
         # Print results
@@ -263,6 +334,17 @@ async def main():
             timestamp = datetime.now().strftime("%Y_%m_%d_%H_%M_%S")
             output_path = eval_dir / f"{timestamp}.json"
 
+        # Move the episode profile next to the result file (same stem)
+        profile = extra.get("profile")
+        if profile and profile.get("path"):
+            profile_path = Path(profile["path"])
+            for artifact in profile_path.parent.glob(f"{profile_path.stem}.*"):
+                target = output_path.with_suffix(artifact.suffix)
+                shutil.move(str(artifact), str(target))
+                if artifact == profile_path:
+                    profile["path"] = str(target)
+            print(f"Profile saved to: {profile['path']}")
+
         tmp_path = output_path.with_suffix(".tmp")
         with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(result, f, indent=2, ensure_ascii=False)
@@ -65,9 +65,9 @@ async def run_inference(
 
     try:
         session = await browser.new_session()
+        llm_client = LLMClient(base_url=base_url, api_key=api_key)
 
         try:
-            llm_client = LLMClient(base_url=base_url, api_key=api_key)
             agent_loop = AgentLoop(
                 session=session,
                 llm_client=llm_client,
@@ -120,6 +120,7 @@ async def run_inference(
             }
 
         finally:
+            await llm_client.close()
             await session.close()
 
     finally:
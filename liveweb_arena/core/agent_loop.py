@@ -5,10 +5,12 @@ from typing import Any, Callable, List, Optional, Tuple
 
 from .browser import BrowserSession
 from .cache import CacheFatalError
-from .models import BrowserAction, CompositeTask, TrajectoryStep
+from .models import BrowserAction, BrowserObservation, CompositeTask, TrajectoryStep
 from .agent_policy import AgentPolicy
+from .observation_compressor import ObservationCompressor
 from ..utils.llm_client import LLMClient, LLMFatalError
 from ..utils.logger import log
+from ..utils.tracing import span
 
 
 class BrowserFatalError(Exception):
@@ -67,6 +69,8 @@ class AgentLoop:
         on_navigation: Optional[NavigationCallback] = None,
         on_step_complete: Optional[StepCompleteCallback] = None,
         on_observation: Optional[ObservationCallback] = None,
+        observation_compressor: Optional[ObservationCompressor] = None,
+        early_stop: bool = False,
     ):
         self._session = session
         self._llm_client = llm_client
@@ -75,11 +79,16 @@ class AgentLoop:
         self._on_navigation = on_navigation
         self._on_step_complete = on_step_complete
         self._on_observation = on_observation
+        self._compressor = observation_compressor
+        # Stop streaming as soon as a complete action arrives (skips trailing explanation).
+        # Same precedence as parse_response, see StreamingActionParser.
+        self._stream_parser = policy.create_stream_parser() if early_stop else None
 
         # Internal state for partial recovery
         self._trajectory: List[TrajectoryStep] = []
         self._total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         self._final_answer = None
+        self._compression_steps: List[dict] = []
 
     def get_trajectory(self) -> List[TrajectoryStep]:
         """Get current trajectory (for partial recovery on timeout)"""
@@ -93,6 +102,26 @@ class AgentLoop:
         """Get final answer if available"""
         return self._final_answer
 
+    def get_compression_stats(self) -> Optional[dict]:
+        """Get per-step observation compression stats (None if compression disabled)"""
+        if self._compressor is None:
+            return None
+        return {
+            "token_budget": self._compressor.token_budget,
+            "tokens_before": sum(s["tokens_before"] for s in self._compression_steps),
+            "tokens_after": sum(s["tokens_after"] for s in self._compression_steps),
+            "steps": list(self._compression_steps),
+        }
+
+    def _prompt_observation(self, obs: BrowserObservation, step: int) -> BrowserObservation:
+        """Observation as shown to the LLM (compressed if a compressor is configured)"""
+        if self._compressor is None:
+            return obs
+        tree, stats = self._compressor.compress(obs.accessibility_tree)
+        self._compression_steps.append({"step": step, **stats.to_dict()})
+        log("Agent", f"Observation compressed: {stats.tokens_before} -> {stats.tokens_after} tokens")
+        return BrowserObservation(url=obs.url, title=obs.title, accessibility_tree=tree)
+
     async def run(
         self,
         task: CompositeTask,
@@ -119,6 +148,7 @@ class AgentLoop:
         self._trajectory = []
         self._total_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
         self._final_answer = None
+        self._compression_steps = []
         self._max_steps_reached = False
         self._parse_failed = False
 
@@ -166,7 +196,8 @@ class AgentLoop:
             # Fire observation callback for real-time GT collection (before action)
             if self._on_observation:
                 try:
-                    await self._on_observation(obs)
+                    with span("observation_callback", step=effective_step):
+                        await self._on_observation(obs)
                 except CacheFatalError:
                     raise
                 except Exception as e:
@@ -178,11 +209,20 @@ class AgentLoop:
                         gt.record_observation_error(obs.url, str(e))
 
             # Pre-save observation so it's not lost if LLM call times out
+            # (trajectory keeps the raw observation; only the prompt is compressed)
             current_obs = obs
             step_num = effective_step - 1  # 0-indexed step number for trajectory
-            user_prompt = self._policy.build_step_prompt(
-                current_obs, self._trajectory, effective_step, self._max_steps
-            )
+            prompt_obs = self._prompt_observation(current_obs, effective_step)
+            if self._policy.is_multi_turn:
+                user_prompt = self._policy.build_observation_turn(
+                    prompt_obs, self._trajectory, effective_step, self._max_steps
+                )
+                messages = self._policy.build_messages(system_prompt, self._trajectory, user_prompt)
+            else:
+                user_prompt = self._policy.build_step_prompt(
+                    prompt_obs, self._trajectory, effective_step, self._max_steps
+                )
+                messages = None
 
             try:
                 raw_response, usage = await self._llm_client.chat(
@@ -191,6 +231,8 @@ class AgentLoop:
                     model=model,
                     temperature=temperature,
                     seed=seed,
+                    messages=messages,
+                    early_stop=self._stream_parser,
                 )
                 if usage:
                     for key in self._total_usage:
@@ -213,7 +255,11 @@ class AgentLoop:
                 await asyncio.sleep(1)
                 continue
 
-            action = self._policy.parse_response(raw_response)
+            if self._stream_parser is not None and self._stream_parser.complete:
+                # Stream was cut right after this object; use exactly what stopped it
+                action = self._policy.action_from_dict(self._stream_parser.action)
+            else:
+                action = self._policy.parse_response(raw_response)
 
             # Parse failed - terminate immediately
             if action is None:
@@ -260,7 +306,8 @@ class AgentLoop:
                 # Execute action - browser handles navigation errors internally
                 # and returns error pages as valid observations
                 try:
-                    obs = await self._session.execute_action(action)
+                    with span("action", step=effective_step, action_type=action.action_type):
+                        obs = await self._session.execute_action(action)
                     action_result = "Success"
 
                     # Track goto URL for error context
@@ -270,7 +317,8 @@ class AgentLoop:
                     # Fire navigation callback if URL changed
                     if self._on_navigation and obs.url != old_url:
                         try:
-                            await self._on_navigation(obs.url)
+                            with span("navigation_callback", step=effective_step):
+                                await self._on_navigation(obs.url)
                         except CacheFatalError:
                             raise  # Cache failure = browser can't load = terminate immediately
                         except Exception as e:
@@ -2,7 +2,7 @@
 
 import json
 import re
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from .models import BrowserAction, BrowserObservation, CompositeTask, TrajectoryStep
 
@@ -130,11 +130,172 @@ Title: {title}
 What is your next action? Your response must contain a JSON action object.
 """
 
+# Step prompt for multi-turn mode: history lives in prior turns, so the new
+# user turn only carries the previous action's result and the fresh page state.
+MULTI_TURN_STEP_TEMPLATE = """{previous_result}## Current Page State
+
+URL: {url}
+Title: {title}
+
+### Accessibility Tree
+```
+{accessibility_tree}
+```
+
+**Step {current_step}/{max_steps}** ({remaining_steps} steps remaining){last_step_warning}
+
+What is your next action? Your response must contain a JSON action object.
+"""
+
+# Replacement for observations dropped from multi-turn history
+ELIDED_STEP_TEMPLATE = """{previous_result}## Page State (omitted from history)
+
+URL: {url}
+Title: {title}
+"""
+
+PREVIOUS_RESULT_TEMPLATE = """### Previous Action Result
+{action_result}
+
+"""
+
+# Conversation layouts supported by AgentPolicy
+CONVERSATION_MODES = ("single", "multi_turn")
+
 LAST_STEP_WARNING = """
 
 **THIS IS YOUR LAST STEP!** You MUST use the "stop" action now and provide your best answers based on the information you have gathered. Do not attempt any other action."""
 
 
+class StreamingActionParser:
+    """
+    Incremental JSON action detector for streamed LLM output.
+
+    Fed one content delta at a time; reports as soon as a complete top-level
+    {...} object that is a valid action has been received, so the caller can
+    stop generation instead of waiting for trailing explanation tokens.
+
+    Scanning is string/escape aware (braces inside JSON strings don't count)
+    and skips <think>...</think> blocks, where models often draft actions
+    they don't commit to. Call reset() before reusing it for a new stream.
+
+    Follows AgentPolicy.parse_response precedence: an object inside a ```
+    fence is accepted, and an unfenced object only if it is the first one
+    and no fence has been opened yet. Anything else is left to the full
+    parse once the stream ends. The one remaining difference: a valid bare
+    object followed later by a fenced one stops the stream on the bare one,
+    where the full parse would have preferred the fence.
+    """
+
+    THINK_OPEN = "<think>"
+    THINK_CLOSE = "</think>"
+    FENCE = "```"
+
+    def __init__(self, validate: Callable[[dict], bool]):
+        """
+        Args:
+            validate: Returns True if a parsed JSON object is a usable action
+        """
+        self._validate = validate
+        self.reset()
+
+    def reset(self):
+        """Clear state for a new stream (e.g. a retried request)"""
+        self._buf = ""
+        self._pos = 0
+        self._depth = 0
+        self._start = 0
+        self._in_string = False
+        self._escape = False
+        self._in_think = False
+        self._in_fence = False
+        self._seen_fence = False
+        self._objects = 0
+        self.action: Optional[dict] = None
+
+    @property
+    def complete(self) -> bool:
+        return self.action is not None
+
+    def feed(self, delta: str) -> bool:
+        """Consume a streamed delta. Returns True once a valid action object is complete."""
+        if self.action is not None:
+            return True
+        self._buf += delta
+        buf = self._buf
+
+        while self._pos < len(buf):
+            pos = self._pos
+
+            if self._in_think:
+                idx = buf.find(self.THINK_CLOSE, pos)
+                if idx < 0:
+                    # Keep a tail in case the closing tag is split across deltas
+                    self._pos = max(pos, len(buf) - len(self.THINK_CLOSE) + 1)
+                    return False
+                self._in_think = False
+                self._pos = idx + len(self.THINK_CLOSE)
+                continue
+
+            char = buf[pos]
+
+            if self._depth == 0:
+                if char == "<":
+                    if buf.startswith(self.THINK_OPEN, pos):
+                        self._in_think = True
+                        self._pos = pos + len(self.THINK_OPEN)
+                        continue
+                    if self.THINK_OPEN.startswith(buf[pos:]):
+                        return False  # Possibly a split <think> tag, wait for more
+                elif char == "`":
+                    if buf.startswith(self.FENCE, pos):
+                        self._in_fence = not self._in_fence
+                        self._seen_fence = True
+                        self._pos = pos + len(self.FENCE)
+                        continue
+                    if self.FENCE.startswith(buf[pos:]):
+                        return False  # Possibly a split fence, wait for more
+                elif char == "{":
+                    self._start = pos
+                    self._depth = 1
+                self._pos = pos + 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pos = pos + 1
+                    self._objects += 1
+                    eligible = self._in_fence or (self._objects == 1 and not self._seen_fence)
+                    if eligible and self._check(buf[self._start:pos + 1]):
+                        return True
+                    continue
+            self._pos = pos + 1
+
+        return False
+
+    def _check(self, candidate: str) -> bool:
+        try:
+            parsed = json.loads(candidate)
+        except json.JSONDecodeError:
+            return False
+        if isinstance(parsed, dict) and self._validate(parsed):
+            self.action = parsed
+            return True
+        return False
+
+
 class AgentPolicy:
     """
     JSON-only policy for browser action generation and parsing.
@@ -143,10 +304,37 @@ class AgentPolicy:
     - Build system and step prompts
     - Parse LLM response to BrowserAction
     - Extract valid JSON from text (no repair of malformed JSON)
+
+    Conversation modes:
+    - single: system + one freshly built user prompt per step (history inlined)
+    - multi_turn: append-only conversation (system, prior user/assistant turns,
+      new observation). Earlier turns are never rewritten except when old
+      observations are elided, which happens in blocks of
+      max_history_observations so the prompt prefix stays byte-identical
+      between steps and server-side prefix (KV) caching can reuse it.
     """
 
-    def __init__(self, max_recent_steps: int = 5):
+    def __init__(
+        self,
+        max_recent_steps: int = 5,
+        conversation_mode: str = "single",
+        max_history_observations: int = 3,
+    ):
+        if conversation_mode not in CONVERSATION_MODES:
+            raise ValueError(
+                f"Unknown conversation_mode: {conversation_mode}. Available: {CONVERSATION_MODES}"
+            )
         self._max_recent_steps = max_recent_steps
+        self._conversation_mode = conversation_mode
+        self._max_history_observations = max(1, max_history_observations)
+
+    @property
+    def conversation_mode(self) -> str:
+        return self._conversation_mode
+
+    @property
+    def is_multi_turn(self) -> bool:
+        return self._conversation_mode == "multi_turn"
 
     def build_system_prompt(self, task: CompositeTask) -> str:
         """Build system prompt with task intent and plugin hints"""
@@ -200,6 +388,83 @@ class AgentPolicy:
             last_step_warning=last_step_warning,
         )
 
+    def build_observation_turn(
+        self,
+        obs: BrowserObservation,
+        trajectory: List[TrajectoryStep],
+        current_step: int = 1,
+        max_steps: int = 30,
+    ) -> str:
+        """Build the new user turn for multi-turn mode (previous result + current page)"""
+        remaining_steps = max_steps - current_step
+        last_step_warning = LAST_STEP_WARNING if remaining_steps == 0 else ""
+
+        return MULTI_TURN_STEP_TEMPLATE.format(
+            previous_result=self._previous_result(trajectory, len(trajectory)),
+            url=obs.url,
+            title=obs.title,
+            accessibility_tree=obs.accessibility_tree,
+            current_step=current_step,
+            max_steps=max_steps,
+            remaining_steps=remaining_steps,
+            last_step_warning=last_step_warning,
+        )
+
+    def build_messages(
+        self,
+        system_prompt: str,
+        trajectory: List[TrajectoryStep],
+        user_prompt: str,
+    ) -> List[dict]:
+        """
+        Build the append-only message list for multi-turn mode.
+
+        Each past step contributes the user turn exactly as it was sent
+        (TrajectoryStep.prompt) and the model's raw response. Old observations
+        are replaced by a short stub in blocks, so between elisions every
+        request extends the previous one without touching its prefix.
+        """
+        messages = [{"role": "system", "content": system_prompt}]
+
+        elided = self._num_elided(len(trajectory))
+        for i, step in enumerate(trajectory):
+            if i < elided or step.prompt is None:
+                content = self._elided_turn(trajectory, i)
+            else:
+                content = step.prompt
+            messages.append({"role": "user", "content": content})
+            messages.append({"role": "assistant", "content": step.raw_response or ""})
+
+        messages.append({"role": "user", "content": user_prompt})
+        return messages
+
+    def _num_elided(self, num_past_steps: int) -> int:
+        """
+        Number of leading past observations to elide.
+
+        Keeps between W and 2W-1 full past observations (W = max_history_observations)
+        and elides in multiples of W, so history is rewritten once every W steps.
+        """
+        window = self._max_history_observations
+        return max(0, (num_past_steps // window - 1) * window)
+
+    def _elided_turn(self, trajectory: List[TrajectoryStep], index: int) -> str:
+        """Deterministic stub for an elided observation turn"""
+        step = trajectory[index]
+        obs = step.observation
+        return ELIDED_STEP_TEMPLATE.format(
+            previous_result=self._previous_result(trajectory, index),
+            url=obs.url if obs else "",
+            title=obs.title if obs else "",
+        )
+
+    @staticmethod
+    def _previous_result(trajectory: List[TrajectoryStep], index: int) -> str:
+        """Result section for the step preceding trajectory[index] (empty for the first)"""
+        if index <= 0 or index > len(trajectory):
+            return ""
+        return PREVIOUS_RESULT_TEMPLATE.format(action_result=trajectory[index - 1].action_result)
+
     def parse_response(self, raw: str) -> Optional[BrowserAction]:
         """
         Parse LLM response to extract action.
@@ -217,6 +482,10 @@ class AgentPolicy:
         if parsed is None:
             return None
 
+        return self.action_from_dict(parsed)
+
+    def action_from_dict(self, parsed: dict) -> Optional[BrowserAction]:
+        """Convert a parsed response object to BrowserAction (None if not a valid action)"""
         # Extract action - strict format only
         # Required: {"action": {"type": "...", "params": {...}}}
         action_data = parsed.get("action")
@@ -231,6 +500,10 @@ class AgentPolicy:
 
         return BrowserAction(action_type=action_type, params=params)
 
+    def create_stream_parser(self) -> StreamingActionParser:
+        """Create an incremental parser that detects a complete, valid action mid-stream"""
+        return StreamingActionParser(validate=lambda parsed: self.action_from_dict(parsed) is not None)
+
     def _try_parse_json(self, text: str) -> Optional[dict]:
         """Try to parse text as JSON directly"""
         try:
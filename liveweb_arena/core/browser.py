@@ -5,6 +5,8 @@ from typing import Optional, TYPE_CHECKING
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 from .models import BrowserObservation, BrowserAction
+from ..utils.metrics import BROWSER_CONTEXTS_OPEN
+from ..utils.tracing import span, traced
 
 if TYPE_CHECKING:
     from .interceptor import CacheInterceptor
@@ -43,6 +45,8 @@ class BrowserSession:
         self._blocked_patterns = []
         self._allowed_domains = None  # None means allow all
         self._cache_interceptor: Optional["CacheInterceptor"] = None
+        self._closed = False
+        BROWSER_CONTEXTS_OPEN.inc()
 
     async def block_urls(self, patterns: list):
         """
@@ -109,10 +113,12 @@ class BrowserSession:
             url = "https://" + url
 
         try:
-            await self._page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+            with span("browser.navigate", url=url[:200]):
+                await self._page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
             # Wait a bit for dynamic content
             try:
-                await self._page.wait_for_load_state("networkidle", timeout=10000)
+                with span("browser.networkidle"):
+                    await self._page.wait_for_load_state("networkidle", timeout=10000)
             except Exception:
                 # Network idle timeout is acceptable, page may still be usable
                 pass
@@ -141,9 +147,11 @@ class BrowserSession:
                     url = "https://" + url
                 # Navigate and return observation (including error pages)
                 try:
-                    await self._page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
+                    with span("browser.navigate", url=url[:200]):
+                        await self._page.goto(url, wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT_MS)
                     try:
-                        await self._page.wait_for_load_state("networkidle", timeout=10000)
+                        with span("browser.networkidle"):
+                            await self._page.wait_for_load_state("networkidle", timeout=10000)
                     except Exception:
                         pass
                 except Exception:
@@ -459,6 +467,7 @@ class BrowserSession:
         """Get current browser observation with retry logic for navigation timing"""
         return await self._get_observation(max_retries)
 
+    @traced("browser.observation")
     async def _get_observation(self, max_retries: int = 5) -> BrowserObservation:
         """Get current browser observation with retry logic for page loading.
 
@@ -499,7 +508,8 @@ class BrowserSession:
                 # Wait for page to be fully loaded with increased timeout
                 page_loaded = False
                 try:
-                    await self._page.wait_for_load_state("networkidle", timeout=15000)
+                    with span("browser.networkidle", attempt=attempt):
+                        await self._page.wait_for_load_state("networkidle", timeout=15000)
                     page_loaded = True
                 except Exception:
                     # Network idle timeout - page might still be loading
@@ -525,7 +535,8 @@ class BrowserSession:
                     # Get accessibility tree from live page
                     a11y_tree = ""
                     try:
-                        a11y_snapshot = await self._page.accessibility.snapshot()
+                        with span("browser.a11y_snapshot"):
+                            a11y_snapshot = await self._page.accessibility.snapshot()
                         if a11y_snapshot:
                             a11y_tree = self._format_accessibility_tree(a11y_snapshot)
                     except Exception:
@@ -661,6 +672,9 @@ class BrowserSession:
         # Clear large content to release memory
         self._last_full_content = ""
         self._cache_interceptor = None
+        if not self._closed:
+            self._closed = True
+            BROWSER_CONTEXTS_OPEN.dec()
 
         try:
             await self._page.close()
@@ -27,6 +27,8 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 from urllib.parse import unquote, urlparse
 
+from liveweb_arena.utils.tracing import set_attribute, span, traced
+
 if TYPE_CHECKING:
     from liveweb_arena.plugins.base import BasePlugin
 
@@ -292,7 +294,8 @@ class CacheManager:
 
         for page_req in pages:
             normalized = normalize_url(page_req.url)
-            cached = await self._ensure_single(page_req.url, plugin, page_req.need_api)
+            with span("cache.ensure", url=url_display(normalized), need_api=page_req.need_api):
+                cached = await self._ensure_single(page_req.url, plugin, page_req.need_api)
             result[normalized] = cached
 
         return result
@@ -315,17 +318,22 @@ class CacheManager:
         cached = self._load_if_valid(cache_file, need_api)
         if cached:
             log("Cache", f"HIT {page_type} - {url_display(normalized)}")
+            set_attribute("cache", "hit")
             return cached
 
         # 2. Need update, acquire async lock (non-blocking to avoid deadlock)
-        lock_fd = await async_file_lock_acquire(lock_file)
+        with span("cache.lock_wait"):
+            lock_fd = await async_file_lock_acquire(lock_file)
         try:
             # 3. Double check (another process may have updated)
             cached = self._load_if_valid(cache_file, need_api)
             if cached:
                 log("Cache", f"HIT {page_type} (after lock) - {url_display(normalized)}")
+                set_attribute("cache", "hit_after_lock")
                 return cached
 
+            set_attribute("cache", "miss")
+
             # 4. Actually fetch - page and API in parallel when possible
             log("Cache", f"MISS {page_type} - fetching {url_display(normalized)}")
             start = time.time()
@@ -446,6 +454,7 @@ class CacheManager:
         with open(cache_file, 'w', encoding='utf-8') as f:
             json.dump(cached.to_dict(), f, ensure_ascii=False)
 
+    @traced("cache.fetch_page")
     async def _fetch_page(self, url: str, plugin=None) -> tuple:
         """
         Fetch page HTML and accessibility tree using Playwright.
@@ -16,6 +16,7 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 from liveweb_arena.core.ground_truth_trigger import TriggerConfig
 from liveweb_arena.utils.logger import log
+from liveweb_arena.utils.tracing import set_attribute, traced
 
 if TYPE_CHECKING:
     from liveweb_arena.core.task_manager import SubTask
@@ -117,6 +118,7 @@ class GTCollector:
 
         return GTSourceType.API_ONLY
 
+    @traced("gt.page_visit")
     async def on_page_visit(
         self,
         url: str,
@@ -423,9 +425,11 @@ class GTCollector:
         """Get all collected API data from page visits."""
         return self._collected_api_data
 
+    @traced("gt.api_fetch")
     async def _fetch_api_gt(self, subtask: "SubTask"):
         """Fetch GT from API for a subtask."""
         tag = subtask.answer_tag
+        set_attribute("answer_tag", tag)
 
         if self._task_manager is None:
             return
@@ -11,6 +11,7 @@ Usage:
 import asyncio
 import logging
 import re
+import time
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Set
 from urllib.parse import urlparse
@@ -19,6 +20,8 @@ from playwright.async_api import Route
 
 from liveweb_arena.core.block_patterns import TRACKING_BLOCK_PATTERNS
 from liveweb_arena.core.cache import CachedPage, CacheFatalError, CacheManager, PageRequirement, normalize_url
+from liveweb_arena.utils.metrics import CACHE_FATAL_ERRORS, CACHE_PREFETCH_SECONDS, CACHE_REQUESTS
+from liveweb_arena.utils.tracing import current_span, set_attribute, span
 
 logger = logging.getLogger(__name__)
 
@@ -117,6 +120,9 @@ class CacheInterceptor:
         self._pending_error: Optional[Exception] = None
         # Per-evaluation storage for cached accessibility trees
         self._accessibility_trees: Dict[str, str] = {}
+        # Route handlers run in Playwright's dispatch context, not the episode's,
+        # so document spans are parented explicitly
+        self._trace_parent = current_span()
 
         # Compile patterns
         all_block_patterns = list(self.BLOCK_PATTERNS)
@@ -167,7 +173,8 @@ class CacheInterceptor:
 
             # Handle by resource type
             if resource_type == "document":
-                await self._handle_document(route, url)
+                with span("intercept.document", parent=self._trace_parent, url=self._url_display(url)):
+                    await self._handle_document(route, url)
             elif resource_type in ("stylesheet", "script", "image", "font"):
                 await self._handle_static(route, url)
             elif resource_type in ("xhr", "fetch"):
@@ -197,9 +204,12 @@ class CacheInterceptor:
         """
         normalized = normalize_url(url)
         page = self._find_cached_page(url)
+        domain = urlparse(url).netloc
 
         if page:
             self.stats.hits += 1
+            CACHE_REQUESTS.inc(domain=domain, result="hit")
+            set_attribute("cache", "hit")
 
             # Store cached accessibility tree for deterministic evaluation
             if page.accessibility_tree:
@@ -214,6 +224,8 @@ class CacheInterceptor:
 
         self.stats.misses += 1
         self.stats.miss_urls.append(url)
+        CACHE_REQUESTS.inc(domain=domain, result="miss")
+        set_attribute("cache", "miss")
         log("Intercept", f"MISS document - {self._url_display(url)}")
 
         if not self._is_domain_allowed(url):
@@ -233,10 +245,14 @@ class CacheInterceptor:
                 try:
                     need_api = plugin.needs_api_data(url)
                     page_req = PageRequirement.data(url) if need_api else PageRequirement.nav(url)
-                    pages = await asyncio.wait_for(
-                        self.cache_manager.ensure_cached([page_req], plugin),
-                        timeout=PREFETCH_TIMEOUT,
-                    )
+                    prefetch_start = time.monotonic()
+                    try:
+                        pages = await asyncio.wait_for(
+                            self.cache_manager.ensure_cached([page_req], plugin),
+                            timeout=PREFETCH_TIMEOUT,
+                        )
+                    finally:
+                        CACHE_PREFETCH_SECONDS.observe(time.monotonic() - prefetch_start, domain=domain)
                     self.cached_pages.update(pages)
 
                     cached = pages.get(normalize_url(url))
@@ -253,14 +269,17 @@ class CacheInterceptor:
                     self._pending_error = CacheFatalError(
                         f"Pre-fetch timeout ({PREFETCH_TIMEOUT}s)", url=url,
                     )
+                    CACHE_FATAL_ERRORS.inc(domain=domain)
                     await route.abort("failed")
                     return
                 except CacheFatalError as e:
                     self._pending_error = e
+                    CACHE_FATAL_ERRORS.inc(domain=domain)
                     await route.abort("failed")
                     return
                 except Exception as e:
                     self._pending_error = CacheFatalError(str(e), url=url)
+                    CACHE_FATAL_ERRORS.inc(domain=domain)
                     await route.abort("failed")
                     return
 
@@ -0,0 +1,331 @@
+"""Token-budgeted compression of accessibility tree observations.
+
+Sits between BrowserSession._get_observation and the step prompt. The raw
+observation is kept for GT collection; only the text shown to the LLM is
+compressed.
+
+Passes (applied in order, later ones only while over budget):
+1. Collapse nameless wrapper nodes (generic/none/group without name or value)
+   and drop empty decorative leaves. Children are promoted one level.
+2. Replace repeated subtrees (e.g. the same menu rendered twice) with a
+   one-line reference. Table content is never deduplicated.
+3. Drop page chrome (footer, sidebars, banner, navigation) down to a one-line
+   summary, least useful first.
+
+Table rows and cells are never removed, so data the validators need stays
+visible. If the tree is still over budget after all passes it is returned
+as-is: BrowserSession already windows long pages behind view_more.
+
+Only the accessibility tree is compressed: page text after PAGE_TEXT_MARKER
+and notice lines around the tree (view_more hints) are passed through
+verbatim, and text that does not parse as a tree (page-text-only
+observations, mixed indentation, wrapped names) is returned unchanged.
+Unmodified tree lines keep their original indentation.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+# Roles that only group other nodes; dropped when they carry no name/value
+WRAPPER_ROLES = {"generic", "none", "group", "presentation", "Section", "LayoutTable", "LayoutTableRow", "LayoutTableCell"}
+
+# Nameless leaves with no information content
+EMPTY_LEAF_ROLES = {"generic", "none", "presentation", "separator", "img", "image", "LineBreak", "text"}
+
+# Table roles: never collapsed, deduplicated or dropped
+TABLE_ROLES = {"table", "grid", "treegrid", "row", "rowgroup", "cell", "gridcell", "columnheader", "rowheader"}
+
+# Chrome landmarks in the order they are dropped when over budget
+CHROME_ROLES = ["contentinfo", "complementary", "banner", "navigation"]
+
+# Minimum subtree size (lines) worth replacing with a duplicate marker
+MIN_DEDUP_LINES = 3
+
+# Separator BrowserSession inserts before raw page text; text after it is left untouched
+PAGE_TEXT_MARKER = "\n\n--- Page Text Content ---\n"
+
+# One formatted tree node: role, optionally followed by "name" and/or value="..."
+_TREE_LINE = re.compile(r'[A-Za-z][\w-]*(?: (?:"|value=").*)?')
+
+
+def estimate_tokens(text: str) -> int:
+    """Default tokenizer estimate: ~4 characters per token"""
+    return (len(text) + 3) // 4
+
+
+@dataclass
+class CompressionStats:
+    """Before/after sizes for one compressed observation"""
+    chars_before: int
+    chars_after: int
+    tokens_before: int
+    tokens_after: int
+    wrappers_collapsed: int = 0
+    duplicates_removed: int = 0
+    chrome_dropped: int = 0
+    over_budget: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "chars_before": self.chars_before,
+            "chars_after": self.chars_after,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "wrappers_collapsed": self.wrappers_collapsed,
+            "duplicates_removed": self.duplicates_removed,
+            "chrome_dropped": self.chrome_dropped,
+            "over_budget": self.over_budget,
+        }
+
+
+class _Node:
+    """Parsed tree line"""
+    __slots__ = ("text", "role", "depth", "children", "in_table")
+
+    def __init__(self, text: str, depth: int = 0):
+        self.text = text
+        self.depth = depth
+        # Role is the first token; named nodes look like: link "Home"
+        self.role = text.split(" ", 1)[0] if text else ""
+        self.children: List["_Node"] = []
+        self.in_table = False
+
+    @property
+    def is_bare(self) -> bool:
+        """Node has a role only (no name, value or other attributes)"""
+        return self.text == self.role
+
+
+class ObservationCompressor:
+    """
+    Compress accessibility tree text toward a token budget.
+
+    Usage:
+        compressor = ObservationCompressor(token_budget=3000)
+        text, stats = compressor.compress(obs.accessibility_tree)
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 4000,
+        token_estimator: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        Args:
+            token_budget: Target prompt tokens for the tree
+            token_estimator: Callable returning a token count for a string
+                (default: chars / 4). Pass a real tokenizer for exact budgets.
+        """
+        self.token_budget = token_budget
+        self._estimate = token_estimator or estimate_tokens
+
+    def compress(self, text: str) -> Tuple[str, CompressionStats]:
+        """Compress tree text. Returns (compressed_text, stats)."""
+        tokens_before = self._estimate(text)
+        stats = CompressionStats(
+            chars_before=len(text),
+            chars_after=len(text),
+            tokens_before=tokens_before,
+            tokens_after=tokens_before,
+        )
+        if not text:
+            return text, stats
+
+        tree_text, sep, page_text = text.partition(PAGE_TEXT_MARKER)
+        split = self._split_tree(tree_text)
+        if split is None:
+            return text, stats
+        head, tree_lines, tail = split
+        parsed = self._parse(tree_lines)
+        if parsed is None:
+            return text, stats
+        roots, indent_unit = parsed
+
+        def assemble() -> str:
+            body = "\n".join(head + [self._render(roots, indent_unit)] + tail)
+            return self._join(body, sep, page_text)
+
+        roots = self._collapse(roots, stats)
+        result = assemble()
+
+        if self._estimate(result) > self.token_budget:
+            roots = self._dedupe(roots, stats)
+            result = assemble()
+
+        for role in CHROME_ROLES:
+            if self._estimate(result) <= self.token_budget:
+                break
+            roots = self._drop_chrome(roots, role, stats)
+            result = assemble()
+
+        stats.chars_after = len(result)
+        stats.tokens_after = self._estimate(result)
+        stats.over_budget = stats.tokens_after > self.token_budget
+        return result, stats
+
+    @staticmethod
+    def _join(tree_text: str, sep: str, page_text: str) -> str:
+        return tree_text + sep + page_text
+
+    # ---- parsing / rendering ----
+
+    @staticmethod
+    def _indent_of(line: str) -> Tuple[int, str]:
+        """Return (indent_width, indent_char) for a line (tabs from cache, spaces from live)"""
+        stripped = line.lstrip("\t ")
+        width = len(line) - len(stripped)
+        char = line[0] if width else ""
+        return width, char
+
+    @staticmethod
+    def _is_tree_line(line: str) -> bool:
+        return _TREE_LINE.fullmatch(line.lstrip("\t ")) is not None
+
+    def _split_tree(self, text: str) -> Optional[Tuple[List[str], List[str], List[str]]]:
+        """
+        Split text into (head, tree lines, tail).
+
+        Head and tail are the non-tree lines before and after the tree (view
+        window notices, a line cut by the window); they are kept verbatim.
+        Returns None if a non-tree line sits inside the tree or no line
+        carries a name, i.e. the text is not an accessibility tree.
+        """
+        lines = text.split("\n")
+        tree_rows = [i for i, line in enumerate(lines) if self._is_tree_line(line)]
+        if not tree_rows:
+            return None
+        first, last = tree_rows[0], tree_rows[-1]
+        body = lines[first:last + 1]
+        if any(line.strip() and not self._is_tree_line(line) for line in body):
+            return None
+        if not any('"' in line for line in body):
+            return None
+        return lines[:first], body, lines[last + 1:]
+
+    def _parse(self, lines: List[str]) -> Optional[Tuple[List[_Node], str]]:
+        """
+        Parse indented tree lines into nodes. Returns (roots, indent_unit).
+
+        Returns None when the indentation is not a consistent tree (mixed
+        tabs/spaces, partial units, a line more than one level deeper than
+        the previous one), so re-rendering could not reproduce it.
+        """
+        indent_unit = "  "
+        for line in lines:
+            width, char = self._indent_of(line)
+            if width:
+                indent_unit = "\t" if char == "\t" else "  "
+                break
+        unit_width = len(indent_unit)
+
+        roots: List[_Node] = []
+        stack: List[Tuple[int, _Node]] = []
+        previous_depth: Optional[int] = None
+        for line in lines:
+            if not line.strip():
+                # Blank line: kept in place, never a parent
+                blank = _Node("", previous_depth or 0)
+                (stack[-1][1].children if stack else roots).append(blank)
+                continue
+            width, _ = self._indent_of(line)
+            indent = line[:width]
+            if width % unit_width or indent != indent_unit * (width // unit_width):
+                return None
+            depth = width // unit_width
+            if previous_depth is not None and depth > previous_depth + 1:
+                return None
+            previous_depth = depth
+
+            node = _Node(line.strip(), depth)
+            while stack and stack[-1][0] >= depth:
+                stack.pop()
+            if stack:
+                parent = stack[-1][1]
+                node.in_table = parent.in_table or parent.role in TABLE_ROLES
+                parent.children.append(node)
+            else:
+                roots.append(node)
+            stack.append((depth, node))
+        return roots, indent_unit
+
+    def _render(self, nodes: List[_Node], indent_unit: str) -> str:
+        lines: List[str] = []
+
+        def walk(node: _Node, depth: int):
+            lines.append(f"{indent_unit * depth}{node.text}" if node.text else "")
+            for child in node.children:
+                walk(child, depth + 1)
+
+        # Roots keep their original depth (a view window can start mid-tree)
+        for node in nodes:
+            walk(node, node.depth)
+        return "\n".join(lines)
+
+    # ---- passes ----
+
+    def _collapse(self, nodes: List[_Node], stats: CompressionStats) -> List[_Node]:
+        """Remove nameless wrappers (promoting children) and empty leaves"""
+        result: List[_Node] = []
+        for node in nodes:
+            node.children = self._collapse(node.children, stats)
+            protected = node.role in TABLE_ROLES
+            if not protected and node.is_bare:
+                if node.children and node.role in WRAPPER_ROLES:
+                    stats.wrappers_collapsed += 1
+                    result.extend(node.children)
+                    continue
+                if not node.children and node.role in EMPTY_LEAF_ROLES:
+                    stats.wrappers_collapsed += 1
+                    continue
+            result.append(node)
+        return result
+
+    def _dedupe(self, roots: List[_Node], stats: CompressionStats) -> List[_Node]:
+        """Replace repeated subtrees outside tables with a one-line marker"""
+        seen = set()
+
+        def signature(node: _Node) -> Tuple[str, int]:
+            parts = [node.text]
+            size = 1
+            for child in node.children:
+                child_sig, child_size = signature(child)
+                parts.append(child_sig)
+                size += child_size
+            return "(" + "\x1f".join(parts) + ")", size
+
+        def walk(nodes: List[_Node]) -> List[_Node]:
+            result = []
+            for node in nodes:
+                if node.in_table or node.role in TABLE_ROLES:
+                    result.append(node)
+                    continue
+                sig, size = signature(node)
+                if size >= MIN_DEDUP_LINES:
+                    if sig in seen:
+                        stats.duplicates_removed += 1
+                        marker = _Node(f"{node.text} [repeated content, {size} lines omitted]", node.depth)
+                        result.append(marker)
+                        continue
+                    seen.add(sig)
+                node.children = walk(node.children)
+                result.append(node)
+            return result
+
+        return walk(roots)
+
+    def _drop_chrome(self, nodes: List[_Node], role: str, stats: CompressionStats) -> List[_Node]:
+        """Replace landmark subtrees of the given role with a one-line summary"""
+        result = []
+        for node in nodes:
+            if node.role == role and node.children and not node.in_table:
+                size = self._count(node) - 1
+                stats.chrome_dropped += 1
+                result.append(_Node(f"{node.text} [{size} lines omitted]", node.depth))
+                continue
+            node.children = self._drop_chrome(node.children, role, stats)
+            result.append(node)
+        return result
+
+    def _count(self, node: _Node) -> int:
+        return 1 + sum(self._count(child) for child in node.children)
@@ -6,6 +6,8 @@ from typing import Dict, List, Optional, Type
 
 from ..plugins import DISABLED_PLUGINS
 from ..plugins.base import BasePlugin, SubTask
+from ..plugins.base_client import get_circuit_breaker, get_unhealthy_sources
+from ..utils.logger import log
 from .models import CompositeTask
 
 
@@ -36,6 +38,12 @@ class TaskManager:
             self._plugin_instances[name] = plugin_cls()
         return self._plugin_instances[name]
 
+    def unhealthy_sources(self, name: str) -> List[str]:
+        """Data sources of a plugin whose circuit breaker is open (see base_client.CircuitBreaker)"""
+        plugin_cls = self._plugin_classes.get(name)
+        sources = (getattr(plugin_cls, "data_sources", None) or [name]) if plugin_cls else [name]
+        return get_unhealthy_sources(sources)
+
     async def generate_composite_task(
         self,
         seed: int,
@@ -73,12 +81,21 @@ class TaskManager:
                 else:
                     # Already (plugin, template_name, variant)
                     selected_templates.append(t)
+            for plugin_name in set(t[0] for t in selected_templates):
+                unhealthy = self.unhealthy_sources(plugin_name)
+                if unhealthy:
+                    log("Task", f"Requested plugin '{plugin_name}' depends on failing sources: {unhealthy}", force=True)
         else:
             # Random selection from available plugins (no specific template or variant)
             available = list(self._plugin_classes.keys())
             if len(available) == 0:
                 raise ValueError("No plugins available")
             selected_templates = [(rng.choice(available), None, None) for _ in range(num_subtasks)]
+            # Fail fast if a chosen plugin's upstream API is failing (its episode would
+            # end in fetch errors). Re-rolling instead would change the task a seed maps to.
+            for plugin_name in sorted(set(t[0] for t in selected_templates)):
+                for source in self.unhealthy_sources(plugin_name):
+                    get_circuit_breaker(source).check()
 
         # Initialize plugins that will be used (some need API data before question generation)
         plugins_to_use = set(p for p, _, _ in selected_templates)
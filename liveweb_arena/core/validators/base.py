@@ -160,6 +160,23 @@ class Validator(ABC):
         """
         pass
 
+    def decide(self, answer: str, ground_truth: Any) -> Optional[ValidationResult]:
+        """
+        Decide clear-cut cases locally, without the LLM judge.
+
+        Used as the fast path of tiered validation: return a result only when
+        the outcome is unambiguous (e.g. exact match, or far outside tolerance),
+        otherwise None to escalate to the LLM validator.
+
+        Args:
+            answer: The agent's answer string
+            ground_truth: The expected correct answer
+
+        Returns:
+            ValidationResult for clear-cut cases, None if ambiguous
+        """
+        return None
+
 
 class QuestionTemplate(ABC):
     """
@@ -252,6 +269,22 @@ class QuestionTemplate(ABC):
         # Default: no special rules
         return ""
 
+    def get_fast_validator(self, validation_info: Dict[str, Any]) -> Optional[Validator]:
+        """
+        Get a deterministic validator for the fast validation path.
+
+        Override to let clear-cut answers be decided locally (Validator.decide)
+        before falling back to the LLM judge. The validator should apply the
+        same tolerance as get_validation_rules() describes.
+
+        Args:
+            validation_info: Information about the question being validated
+
+        Returns:
+            Validator, or None to always use the LLM judge
+        """
+        return None
+
     def get_ground_truth_trigger(
         self,
         validation_info: Dict[str, Any]
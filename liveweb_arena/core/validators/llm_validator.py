@@ -1,12 +1,15 @@
 """LLM-based answer validator for flexible answer matching"""
 
 from dataclasses import dataclass
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
+import asyncio
 import json
 import re
+import time
 
 from .base import ValidationResult
 from ...utils.logger import log
+from ...utils.metrics import VALIDATION_SECONDS, VALIDATIONS
 
 
 @dataclass
@@ -34,6 +37,26 @@ General Rules:
 3. Output ONLY a JSON object: {{"score": <float 0.0 to 1.0>, "reasoning": "<brief max 30 words>"}}
 """
 
+# Batched validation prompt: all subtasks of an episode in one request
+BATCH_VALIDATION_PROMPT = """You are an answer validator. For each item below, compare the expected answer (ground truth from API) with the actual answer (from agent).
+
+{items}
+
+General Rules (apply to every item, together with its own task-specific rules):
+1. Be flexible with format differences (e.g., "28°C" = "28 degrees" = "28")
+2. If agent says data unavailable but expected has a value: score 0.0
+3. Judge each item independently
+4. Output ONLY a JSON object: {{"results": [{{"id": <item id>, "score": <float 0.0 to 1.0>, "reasoning": "<brief max 30 words>"}}, ...]}} with one entry per item
+"""
+
+BATCH_ITEM_TEMPLATE = """### Item {id}
+Question: {question}
+Expected Answer (Ground Truth): {expected}
+Actual Answer (Agent Response): {actual}
+
+{task_specific_rules}
+"""
+
 # Default task-specific rules (used when template doesn't provide any)
 DEFAULT_TASK_RULES = """Task-Specific Rules:
 - Score 1.0: Answers match exactly (ignoring format)
@@ -91,25 +114,9 @@ class LLMValidator:
         Returns:
             LLMValidationResult with score and reasoning
         """
-        # Handle None values
-        if actual is None or actual == "":
-            return LLMValidationResult(
-                score=0.0,
-                is_correct=False,
-                expected=expected,
-                actual=actual,
-                reasoning="No answer provided by the agent.",
-            )
-
-        # Ground truth is required - cannot validate without it
-        if expected is None:
-            return LLMValidationResult(
-                score=0.0,
-                is_correct=False,
-                expected=None,
-                actual=actual,
-                reasoning="Ground truth unavailable - cannot validate answer.",
-            )
+        precheck = self._precheck(expected, actual)
+        if precheck is not None:
+            return precheck
 
         # Use task-specific rules or default
         rules = task_specific_rules if task_specific_rules else DEFAULT_TASK_RULES
@@ -153,6 +160,137 @@ class LLMValidator:
             f"All validation models failed. Last error: {last_error}"
         ) from last_error
 
+    async def validate_batch(
+        self,
+        items: List[Dict[str, Any]],
+        temperature: float = 0.0,
+    ) -> List[LLMValidationResult]:
+        """
+        Validate several answers with a single LLM request.
+
+        Items whose entry is missing or unparseable in the batch response
+        (or all items, if every model fails) fall back to per-item validate().
+
+        Args:
+            items: Dicts with question, expected, actual and optional task_specific_rules
+            temperature: LLM temperature (0 for deterministic)
+
+        Returns:
+            LLMValidationResult per item, in input order
+        """
+        results: List[Optional[LLMValidationResult]] = [
+            self._precheck(item["expected"], item["actual"]) for item in items
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        if len(pending) > 1:
+            prompt = BATCH_VALIDATION_PROMPT.format(items="\n".join(
+                BATCH_ITEM_TEMPLATE.format(
+                    id=i + 1,
+                    question=items[i]["question"],
+                    expected=str(items[i]["expected"]),
+                    actual=str(items[i]["actual"]),
+                    task_specific_rules=items[i].get("task_specific_rules") or DEFAULT_TASK_RULES,
+                )
+                for i in pending
+            ))
+
+            for model in VALIDATION_MODELS:
+                try:
+                    response, _ = await self._llm_client.chat(
+                        system="You are a precise answer validator. Output only valid JSON.",
+                        user=prompt,
+                        model=model,
+                        temperature=temperature,
+                    )
+                except Exception as e:
+                    log("Validator", f"Batch model {model} failed: {e}, trying next")
+                    continue
+
+                parsed = self._parse_batch_response(response)
+                for i in pending:
+                    entry = parsed.get(i + 1)
+                    if entry is not None:
+                        results[i] = LLMValidationResult(
+                            score=entry["score"],
+                            is_correct=entry["score"] >= 0.8,
+                            expected=items[i]["expected"],
+                            actual=items[i]["actual"],
+                            reasoning=entry["reasoning"],
+                        )
+                break
+
+        # Per-item fallback for anything the batch didn't resolve
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            if len(missing) < len(pending):
+                log("Validator", f"Batch response missing {len(missing)} item(s), validating individually")
+            fallback = await asyncio.gather(*[
+                self.validate(
+                    question=items[i]["question"],
+                    expected=items[i]["expected"],
+                    actual=items[i]["actual"],
+                    task_specific_rules=items[i].get("task_specific_rules", ""),
+                    temperature=temperature,
+                )
+                for i in missing
+            ])
+            for i, result in zip(missing, fallback):
+                results[i] = result
+
+        return results
+
+    @staticmethod
+    def _precheck(expected: Any, actual: Any) -> Optional[LLMValidationResult]:
+        """Results that need no LLM call (missing answer or missing ground truth)"""
+        # Handle None values
+        if actual is None or actual == "":
+            return LLMValidationResult(
+                score=0.0,
+                is_correct=False,
+                expected=expected,
+                actual=actual,
+                reasoning="No answer provided by the agent.",
+            )
+
+        # Ground truth is required - cannot validate without it
+        if expected is None:
+            return LLMValidationResult(
+                score=0.0,
+                is_correct=False,
+                expected=None,
+                actual=actual,
+                reasoning="Ground truth unavailable - cannot validate answer.",
+            )
+
+        return None
+
+    def _parse_batch_response(self, response: str) -> Dict[int, dict]:
+        """Parse batch response into item id -> {score, reasoning}; bad entries are skipped"""
+        text = response.strip()
+        data = None
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            start, end = text.find("{"), text.rfind("}")
+            if start != -1 and end > start:
+                try:
+                    data = json.loads(text[start:end + 1])
+                except json.JSONDecodeError:
+                    data = None
+
+        entries = data.get("results") if isinstance(data, dict) else data
+        if not isinstance(entries, list):
+            return {}
+
+        parsed = {}
+        for entry in entries:
+            try:
+                parsed[int(entry["id"])] = self._validate_result(entry)
+            except (KeyError, TypeError, ValueError):
+                continue
+        return parsed
+
     def _parse_response(self, response: str) -> dict:
         """Parse LLM response to extract score and reasoning"""
         # Try direct JSON parse
@@ -204,12 +342,18 @@ async def validate_answers_with_llm(
     ground_truths: dict,
     validation_rules: dict = None,
     parallel: bool = True,
+    batch: bool = False,
+    fast_validators: dict = None,
 ) -> list:
     """
     Validate multiple answers using LLM with automatic model fallback.
 
     Models are defined in VALIDATION_MODELS and tried in order per validation call.
 
+    Validation is tiered: answers a deterministic validator can decide
+    (missing answer, exact match, far outside tolerance) are scored locally,
+    and only the ambiguous rest goes to the LLM judge.
+
     Args:
         llm_client: LLM client for validation calls
         subtasks: List of SubTask objects
@@ -217,14 +361,118 @@ async def validate_answers_with_llm(
         ground_truths: Dict of answer_tag -> ground truth value
         validation_rules: Dict of answer_tag -> task-specific validation rules
         parallel: Whether to validate answers in parallel (default: True)
+        batch: Score all answers in one LLM request, falling back to
+            per-item calls only for items the batch response doesn't cover
+        fast_validators: Dict of answer_tag -> Validator for the fast path
+            (None = LLM only)
 
     Returns:
         List of validation result dicts with expected, actual, score, reasoning
+        and validated_by ("fast" or "llm"), in subtask order
     """
-    import asyncio
-
+    start = time.monotonic()
     validator = LLMValidator(llm_client)
     validation_rules = validation_rules or {}
+    fast_validators = fast_validators or {}
+
+    results: Dict[str, dict] = {}
+    llm_subtasks = []
+    for subtask in subtasks:
+        tag = subtask.answer_tag
+        decided = _decide_fast(
+            fast_validators.get(tag), ground_truths.get(tag), answers.get(tag)
+        )
+        if decided is None:
+            llm_subtasks.append(subtask)
+            continue
+        results[tag] = {
+            "question": subtask.intent,
+            "answer_tag": tag,
+            "expected": decided.expected,
+            "actual": decided.actual,
+            "score": decided.score,
+            "is_correct": decided.is_correct,
+            "reasoning": f"[fast path] {decided.reasoning}",
+            "validated_by": "fast",
+        }
+
+    if llm_subtasks:
+        llm_results = await _validate_with_llm(
+            validator, llm_subtasks, answers, ground_truths, validation_rules,
+            parallel=parallel, batch=batch,
+        )
+        for subtask, result in zip(llm_subtasks, llm_results):
+            result["validated_by"] = "llm"
+            results[subtask.answer_tag] = result
+
+    VALIDATION_SECONDS.observe(time.monotonic() - start)
+    for result in results.values():
+        VALIDATIONS.inc(validated_by=result["validated_by"])
+    return [results[subtask.answer_tag] for subtask in subtasks]
+
+
+def _decide_fast(fast_validator, expected: Any, actual: Any) -> Optional[LLMValidationResult]:
+    """Score an answer without the LLM if it is clear-cut; None to escalate"""
+    precheck = LLMValidator._precheck(expected, actual)
+    if precheck is not None:
+        return precheck
+    if fast_validator is None:
+        return None
+
+    try:
+        decided = fast_validator.decide(str(actual), expected)
+    except Exception as e:
+        log("Validator", f"Fast path error, escalating to LLM: {e}")
+        return None
+    if decided is None:
+        return None
+    return LLMValidationResult(
+        score=decided.score,
+        is_correct=decided.is_correct,
+        expected=expected,
+        actual=actual,
+        reasoning=decided.details,
+    )
+
+
+async def _validate_with_llm(
+    validator: LLMValidator,
+    subtasks: list,
+    answers: dict,
+    ground_truths: dict,
+    validation_rules: dict,
+    parallel: bool,
+    batch: bool,
+) -> list:
+    """LLM tier of validate_answers_with_llm (per-item or batched)"""
+    if batch and len(subtasks) > 1:
+        items = [
+            {
+                "question": subtask.intent,
+                "expected": ground_truths.get(subtask.answer_tag),
+                "actual": answers.get(subtask.answer_tag),
+                "task_specific_rules": validation_rules.get(subtask.answer_tag, ""),
+            }
+            for subtask in subtasks
+        ]
+        try:
+            batch_results = await validator.validate_batch(items)
+        except Exception as e:
+            # Any validation failure = evaluation invalid (can't score reliably)
+            raise RuntimeError(f"Batch validation failed: {e}") from e
+
+        return [
+            {
+                "question": subtask.intent,
+                "answer_tag": subtask.answer_tag,
+                "expected": result.expected,
+                "actual": result.actual,
+                "score": result.score,
+                "is_correct": result.is_correct,
+                "reasoning": result.reasoning,
+            }
+            for subtask, result in zip(subtasks, batch_results)
+        ]
 
     async def validate_single(subtask):
         """Validate a single subtask answer"""
@@ -5,6 +5,30 @@ from typing import Any, Optional, Tuple
 
 from .base import Validator, ValidationResult
 
+# A single, plainly formatted number: optional sign/currency/#, thousands
+# separators in groups of 3, optional unit suffix. Anything else (scale words,
+# ranges, prose) is left to the LLM judge.
+_SIMPLE_NUMBER = re.compile(
+    r"^\s*([+-]?)\s*[$€£#τ]?\s*([+-]?)((?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|\.\d+)\s*(?:%|°[CF]?|USD)?\s*$",
+    re.IGNORECASE,
+)
+
+
+def parse_simple_number(value: Any) -> Optional[float]:
+    """Parse a plainly formatted number ("$45,123.45", "+5.2%", "#5"); None otherwise"""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        return None
+    match = _SIMPLE_NUMBER.match(value)
+    if not match:
+        return None
+    number = float(match.group(3).replace(",", ""))
+    negative = (match.group(1) == "-") != (match.group(2) == "-")
+    return -number if negative else number
+
 
 class NumericToleranceValidator(Validator):
     """
@@ -16,12 +40,17 @@ class NumericToleranceValidator(Validator):
     - Zero score outside tolerance
     """
 
+    # Fast path: differences beyond partial tolerance x this factor are an obvious mismatch
+    MISMATCH_FACTOR = 2.0
+
     def __init__(
         self,
         full_tolerance: float,
         partial_tolerance: float,
         unit: str = "",
         partial_score: float = 0.5,
+        relative: bool = False,
+        require_same_sign: bool = False,
     ):
         """
         Initialize numeric validator.
@@ -31,11 +60,57 @@ class NumericToleranceValidator(Validator):
             partial_tolerance: Tolerance for partial score (e.g., 5 for ±5°C)
             unit: Unit string for display (e.g., "°C", "%", "km/h")
             partial_score: Score to award for partial match (default 0.5)
+            relative: Tolerances are fractions of the expected value (0.05 = 5%)
+            require_same_sign: Opposite signs score 0 (e.g., direction of a % change)
         """
         self.full_tolerance = full_tolerance
         self.partial_tolerance = partial_tolerance
         self.unit = unit
         self.partial_score = partial_score
+        self.relative = relative
+        self.require_same_sign = require_same_sign
+
+    def _tolerances(self, expected: float) -> Tuple[float, float]:
+        """Absolute (full, partial) tolerances for an expected value"""
+        if self.relative:
+            return self.full_tolerance * abs(expected), self.partial_tolerance * abs(expected)
+        return self.full_tolerance, self.partial_tolerance
+
+    def decide(self, answer: str, ground_truth: Any) -> Optional[ValidationResult]:
+        """Decide plainly formatted numbers: within full tolerance, or far outside it"""
+        actual = parse_simple_number(answer)
+        expected = parse_simple_number(ground_truth)
+        if actual is None or expected is None:
+            return None
+
+        if self.require_same_sign and actual * expected < 0:
+            return ValidationResult(
+                score=0.0,
+                is_correct=False,
+                expected=ground_truth,
+                actual=answer,
+                details="Opposite sign",
+            )
+
+        full, partial = self._tolerances(expected)
+        diff = abs(actual - expected)
+        if diff <= full:
+            return ValidationResult(
+                score=1.0,
+                is_correct=True,
+                expected=ground_truth,
+                actual=answer,
+                details=f"Within tolerance (diff: {diff:g})",
+            )
+        if diff > partial * self.MISMATCH_FACTOR:
+            return ValidationResult(
+                score=0.0,
+                is_correct=False,
+                expected=ground_truth,
+                actual=answer,
+                details=f"Far outside tolerance (diff: {diff:g})",
+            )
+        return None
 
     def extract_value(self, answer: str) -> Optional[float]:
         """Extract numeric value from answer string"""
@@ -98,22 +173,32 @@ class NumericToleranceValidator(Validator):
                 )
 
         diff = abs(actual - expected)
+        full_tolerance, partial_tolerance = self._tolerances(expected)
+
+        if self.require_same_sign and actual * expected < 0:
+            return ValidationResult(
+                score=0.0,
+                is_correct=False,
+                expected=expected,
+                actual=actual,
+                details="Opposite sign",
+            )
 
-        if diff <= self.full_tolerance:
+        if diff <= full_tolerance:
             return ValidationResult(
                 score=1.0,
                 is_correct=True,
                 expected=expected,
                 actual=actual,
-                details=f"Exact match within ±{self.full_tolerance}{self.unit} (diff: {diff:.1f})",
+                details=f"Exact match within ±{full_tolerance:g}{self.unit} (diff: {diff:.1f})",
             )
-        elif diff <= self.partial_tolerance:
+        elif diff <= partial_tolerance:
             return ValidationResult(
                 score=self.partial_score,
                 is_correct=False,
                 expected=expected,
                 actual=actual,
-                details=f"Partial match within ±{self.partial_tolerance}{self.unit} (diff: {diff:.1f})",
+                details=f"Partial match within ±{partial_tolerance:g}{self.unit} (diff: {diff:.1f})",
             )
         else:
             return ValidationResult(
@@ -121,7 +206,7 @@ class NumericToleranceValidator(Validator):
                 is_correct=False,
                 expected=expected,
                 actual=actual,
-                details=f"Outside tolerance ±{self.partial_tolerance}{self.unit} (diff: {diff:.1f})",
+                details=f"Outside tolerance ±{partial_tolerance:g}{self.unit} (diff: {diff:.1f})",
             )
 
 
@@ -188,6 +273,19 @@ class ExactMatchValidator(Validator):
             details="Exact match" if is_match else "No match",
         )
 
+    def decide(self, answer: str, ground_truth: Any) -> Optional[ValidationResult]:
+        """Only an exact (normalized) match is clear-cut; mismatches may be format differences"""
+        actual = self.extract_value(answer)
+        if actual is None or ground_truth is None or actual != self.extract_value(str(ground_truth)):
+            return None
+        return ValidationResult(
+            score=1.0,
+            is_correct=True,
+            expected=ground_truth,
+            actual=answer,
+            details="Exact match",
+        )
+
 
 class BooleanValidator(Validator):
     """
@@ -265,6 +363,31 @@ class BooleanValidator(Validator):
             details="Correct" if is_correct else "Incorrect",
         )
 
+    # Whole-answer tokens that are unambiguous (keyword search above is too loose for the fast path)
+    STRICT_VALUES = {"yes": True, "true": True, "no": False, "false": False}
+
+    def decide(self, answer: str, ground_truth: Any) -> Optional[ValidationResult]:
+        """Decide only bare yes/no/true/false answers"""
+        if not isinstance(answer, str):
+            return None
+        actual = self.STRICT_VALUES.get(answer.strip().rstrip(".").lower())
+        if isinstance(ground_truth, bool):
+            expected = ground_truth
+        elif isinstance(ground_truth, str):
+            expected = self.STRICT_VALUES.get(ground_truth.strip().rstrip(".").lower())
+        else:
+            expected = None
+        if actual is None or expected is None:
+            return None
+        is_correct = actual == expected
+        return ValidationResult(
+            score=1.0 if is_correct else 0.0,
+            is_correct=is_correct,
+            expected=ground_truth,
+            actual=answer,
+            details="Correct" if is_correct else "Incorrect",
+        )
+
 
 class ContainsValidator(Validator):
     """
@@ -79,6 +79,11 @@ class BasePlugin(ABC):
     allowed_domains: List[str]
     """List of allowed domain names (e.g., ['coingecko.com', 'www.coingecko.com'])"""
 
+    # ===== Optional class attributes =====
+
+    data_sources: List[str] = []
+    """API sources the plugin's data comes from (circuit breaker names); empty = [name]"""
+
     # ===== Required methods =====
 
     @abstractmethod
@@ -315,6 +320,20 @@ class BasePlugin(ABC):
             return template.get_validation_rules(validation_info)
         return ""
 
+    def get_fast_validator(self, validation_info: dict):
+        """Get deterministic fast-path validator from template (None = LLM only)."""
+        from liveweb_arena.core.validators.base import get_template
+
+        template_name = validation_info.get("template_name") or validation_info.get("_template_name")
+        if not template_name:
+            return None
+
+        template_cls = get_template(template_name)
+        if not template_cls:
+            return None
+
+        return template_cls().get_fast_validator(validation_info)
+
     def get_ground_truth_trigger(self, validation_info: dict):
         """Get ground truth trigger configuration from template."""
         from liveweb_arena.core.validators.base import get_template
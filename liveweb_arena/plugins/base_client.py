@@ -1,9 +1,34 @@
-"""Base API client with common rate limiting infrastructure."""
+"""Base API client with common rate limiting, response caching, circuit breaking and shared HTTP session infrastructure."""
 
 import asyncio
+import copy
+import functools
+import os
+import re
+import struct
+import threading
 import time
 from abc import ABC
-from typing import Any, ClassVar, Dict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, ClassVar, Dict, Hashable, List, Optional, Tuple
+
+import aiohttp
+
+from liveweb_arena.utils.logger import log
+from liveweb_arena.utils.metrics import (
+    PLUGIN_API_CACHE_REQUESTS,
+    PLUGIN_CIRCUIT_REJECTED,
+    PLUGIN_CIRCUIT_STATE,
+    PLUGIN_HTTP_CONNECTIONS,
+    PLUGIN_HTTP_REQUESTS,
+    PLUGIN_RATE_LIMIT_WAIT_SECONDS,
+)
+from liveweb_arena.utils.rate_limit import TokenBucket
+
+try:
+    import fcntl
+except ImportError:  # Windows: shared buckets fall back to per-process
+    fcntl = None
 
 
 class APIFetchError(Exception):
@@ -20,6 +45,22 @@ class APIFetchError(Exception):
         self.status_code = status_code
 
 
+class CircuitOpenError(APIFetchError):
+    """
+    Raised without sending a request while the source's circuit breaker is open.
+
+    The source failed repeatedly and is presumed down; callers should give up
+    instead of retrying.
+    """
+
+    def __init__(self, source: str, retry_in: float):
+        super().__init__(
+            f"{source} API circuit open, source is failing (next probe in {retry_in:.0f}s)",
+            source=source,
+        )
+        self.retry_in = retry_in
+
+
 def validate_api_response(data: Any, expected_type: type, context: str) -> None:
     """
     Validate API response type. Raises APIFetchError if invalid.
@@ -36,36 +77,751 @@ def validate_api_response(data: Any, expected_type: type, context: str) -> None:
         )
 
 
+class SharedTokenBucket:
+    """
+    Token bucket whose state lives in a file shared by every process on the host.
+
+    Same reservation semantics as utils.rate_limit.TokenBucket; the balance and
+    last-update wall-clock time are read and written under an exclusive flock,
+    so N worker processes together stay within one budget.
+    """
+
+    _STATE = struct.Struct("dd")
+
+    def __init__(self, path: Path, rate: float, capacity: float):
+        self.path = Path(path)
+        self.rate = rate
+        self.capacity = capacity
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take amount tokens now; return seconds to wait before using them"""
+        # Opened per call: a descriptor inherited across fork would share the lock
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            now = time.time()
+            raw = os.pread(fd, self._STATE.size, 0)
+            if len(raw) == self._STATE.size:
+                tokens, updated = self._STATE.unpack(raw)
+                tokens = min(self.capacity, tokens + max(0.0, now - updated) * self.rate)
+            else:
+                tokens = self.capacity
+            tokens -= amount
+            os.pwrite(fd, self._STATE.pack(tokens, now), 0)
+        finally:
+            os.close(fd)  # Releases the flock
+        return 0.0 if tokens >= 0 else -tokens / self.rate
+
+
 class RateLimiter:
-    """Simple rate limiter for API clients."""
+    """
+    Token-bucket rate limiter for one upstream host.
+
+    Sustained rate is one request per min_interval; up to `burst` requests
+    may go out back to back. Callers reserve a token and sleep outside any
+    lock, so waiting callers do not serialize each other beyond the budget.
+
+    With LIVEWEB_RATE_LIMIT_DIR set, limiters with a key keep their bucket in
+    <dir>/<key>.bucket (SharedTokenBucket), applying the budget across all
+    processes on the host instead of per process.
+
+    Usage:
+        _rate_limiter = RateLimiter.for_host("api.coingecko.com", min_interval=2.0)
+        await _rate_limiter.wait()
+    """
 
-    def __init__(self, min_interval: float = 0.5):
+    _registry: ClassVar[Dict[str, "RateLimiter"]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, min_interval: float = 0.5, burst: int = 1, key: Optional[str] = None):
+        """
+        Args:
+            min_interval: Seconds per request at the sustained rate
+            burst: Requests allowed back to back when the bucket is full
+            key: Host (bucket name) for metrics and the shared backend
+        """
         self.min_interval = min_interval
-        self._last_request: float = 0
-        self._lock = asyncio.Lock()
+        self.burst = max(1, burst)
+        self.key = key or "default"
+        self._bucket = None
+        self._shared_dir: Optional[str] = None
+        self._lock = threading.Lock()
+
+        self._requests = 0
+        self._waited = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    @classmethod
+    def for_host(cls, host: str, min_interval: float = 0.5, burst: int = 1) -> "RateLimiter":
+        """Process-wide limiter for a host (first caller's settings win)."""
+        with cls._registry_lock:
+            limiter = cls._registry.get(host)
+            if limiter is None:
+                limiter = cls(min_interval=min_interval, burst=burst, key=host)
+                cls._registry[host] = limiter
+            return limiter
+
+    def _get_bucket(self):
+        """Bucket for the current LIVEWEB_RATE_LIMIT_DIR (re-created if it changes)."""
+        shared_dir = os.environ.get("LIVEWEB_RATE_LIMIT_DIR") or None
+        if shared_dir and fcntl is None:
+            shared_dir = None
+        with self._lock:
+            if self._bucket is None or shared_dir != self._shared_dir:
+                rate = 1.0 / self.min_interval if self.min_interval > 0 else float("inf")
+                if shared_dir and rate != float("inf"):
+                    name = re.sub(r"[^\w.-]+", "_", self.key)
+                    self._bucket = SharedTokenBucket(Path(shared_dir) / f"{name}.bucket", rate, self.burst)
+                else:
+                    self._bucket = TokenBucket(rate, capacity=self.burst)
+                self._shared_dir = shared_dir
+            return self._bucket
 
     async def wait(self):
         """Wait if needed to respect rate limit."""
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self._last_request
-            if elapsed < self.min_interval:
-                await asyncio.sleep(self.min_interval - elapsed)
-            self._last_request = time.time()
+        if self.min_interval <= 0:
+            return
+        try:
+            delay = self._get_bucket().reserve(1)
+        except OSError as e:
+            log("RateLimit", f"Shared bucket for {self.key} unavailable ({e}), using per-process limit")
+            with self._lock:
+                self._bucket = TokenBucket(1.0 / self.min_interval, capacity=self.burst)
+            delay = self._bucket.reserve(1)
+
+        with self._lock:
+            self._requests += 1
+            if delay > 0:
+                self._waited += 1
+                self._wait_total += delay
+                self._wait_max = max(self._wait_max, delay)
+        PLUGIN_RATE_LIMIT_WAIT_SECONDS.observe(delay, host=self.key)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "min_interval": self.min_interval,
+                "burst": self.burst,
+                "shared": self._shared_dir is not None,
+                "requests": self._requests,
+                "waited": self._waited,
+                "wait_total_s": round(self._wait_total, 3),
+                "wait_avg_s": round(self._wait_total / self._requests, 3) if self._requests else 0.0,
+                "wait_max_s": round(self._wait_max, 3),
+            }
+
+
+def get_rate_limit_stats() -> Dict[str, dict]:
+    """Wait statistics for every per-host plugin rate limiter."""
+    with RateLimiter._registry_lock:
+        limiters = list(RateLimiter._registry.values())
+    return {limiter.key: limiter.get_stats() for limiter in limiters}
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one upstream data source, shared by every episode in the process.
+
+    States:
+        closed     requests pass; failure_threshold consecutive failures open the circuit
+        open       requests fail immediately with CircuitOpenError for `cooldown` seconds
+        half_open  a single probe request passes; success closes the circuit, failure
+                   reopens it with the cooldown doubled (up to MAX_COOLDOWN)
+
+    Failures are exceptions raised by a guarded request (network errors,
+    timeouts, 5xx and 429 responses). Other 4xx responses mean the source is
+    up and count as successes.
+
+    Usage:
+        @with_circuit_breaker("stooq")
+        async def _download_csv(...): ...
+
+        get_circuit_breaker("stooq").trip()   # known outage (daily limit hit)
+
+    Environment:
+        LIVEWEB_CIRCUIT_THRESHOLD   consecutive failures that open a circuit (0 = disabled)
+        LIVEWEB_CIRCUIT_COOLDOWN    seconds an opened circuit waits before a probe
+    """
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+    _STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    FAILURE_THRESHOLD = 5
+    COOLDOWN = 30.0
+    MAX_COOLDOWN = 600.0
+
+    _registry: ClassVar[Dict[str, "CircuitBreaker"]] = {}
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, source: str, failure_threshold: Optional[int] = None, cooldown: Optional[float] = None):
+        """
+        Args:
+            source: Data source name (plugin CACHE_SOURCE)
+            failure_threshold: Consecutive failures that open the circuit (default: environment, then 5)
+            cooldown: Initial open period in seconds (default: environment, then 30)
+        """
+        self.source = source
+        self.failure_threshold = int(
+            failure_threshold if failure_threshold is not None
+            else _env_float("LIVEWEB_CIRCUIT_THRESHOLD", self.FAILURE_THRESHOLD)
+        )
+        self.base_cooldown = cooldown if cooldown is not None else _env_float("LIVEWEB_CIRCUIT_COOLDOWN", self.COOLDOWN)
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._cooldown = self.base_cooldown
+        self._opened_at = 0.0
+        self._probing = False
+
+        self._opened = 0
+        self._rejected = 0
+        self._total_failures = 0
+
+    @classmethod
+    def for_source(cls, source: str) -> "CircuitBreaker":
+        """Process-wide breaker for a source."""
+        with cls._registry_lock:
+            breaker = cls._registry.get(source)
+            if breaker is None:
+                breaker = cls._registry[source] = cls(source)
+            return breaker
+
+    @property
+    def state(self) -> str:
+        """Current state (an open circuit past its cooldown reports half_open)."""
+        with self._lock:
+            if self._state == self.OPEN and self._remaining() <= 0:
+                return self.HALF_OPEN
+            return self._state
+
+    def is_available(self) -> bool:
+        """False while the circuit is open (a request would fail fast)."""
+        return self.failure_threshold <= 0 or self.state != self.OPEN
+
+    def _remaining(self) -> float:
+        return self._opened_at + self._cooldown - time.monotonic()
+
+    def _set_state(self, state: str):
+        self._state = state
+        PLUGIN_CIRCUIT_STATE.set(self._STATE_VALUES[state], source=self.source)
+
+    def _open(self, cooldown: float):
+        self._cooldown = cooldown
+        self._opened_at = time.monotonic()
+        self._probing = False
+        if self._state != self.OPEN:
+            self._opened += 1
+            log("Circuit", f"{self.source} circuit open for {cooldown:.0f}s")
+        self._set_state(self.OPEN)
+
+    def check(self):
+        """Raise CircuitOpenError while the circuit is open (does not take the half-open probe)."""
+        if not self.is_available():
+            with self._lock:
+                self._rejected += 1
+                retry_in = max(0.0, self._remaining())
+            PLUGIN_CIRCUIT_REJECTED.inc(source=self.source)
+            raise CircuitOpenError(self.source, retry_in)
+
+    def before_request(self) -> bool:
+        """
+        Admit a request or raise CircuitOpenError.
+
+        Returns:
+            True if the request is the half-open probe
+        """
+        if self.failure_threshold <= 0:
+            return False
+        with self._lock:
+            if self._state == self.CLOSED:
+                return False
+            if self._state == self.OPEN and self._remaining() <= 0:
+                self._set_state(self.HALF_OPEN)
+            if self._state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            self._rejected += 1
+            retry_in = max(0.0, self._remaining())
+        PLUGIN_CIRCUIT_REJECTED.inc(source=self.source)
+        raise CircuitOpenError(self.source, retry_in)
+
+    def record_success(self, probe: bool = False):
+        with self._lock:
+            self._failures = 0
+            if probe:
+                self._probing = False
+            if self._state == self.HALF_OPEN and probe:
+                log("Circuit", f"{self.source} circuit closed")
+                self._cooldown = self.base_cooldown
+                self._set_state(self.CLOSED)
+
+    def record_failure(self, probe: bool = False):
+        with self._lock:
+            self._failures += 1
+            self._total_failures += 1
+            if probe:
+                self._probing = False
+            if self._state == self.HALF_OPEN and probe:
+                self._open(min(self.MAX_COOLDOWN, self._cooldown * 2))
+            elif self._state == self.CLOSED and 0 < self.failure_threshold <= self._failures:
+                self._open(self.base_cooldown)
+
+    def release_probe(self):
+        """Give up the probe slot without an outcome (probe request cancelled)."""
+        with self._lock:
+            self._probing = False
+
+    def trip(self, cooldown: Optional[float] = None):
+        """Open the circuit now (the source reported an outage the caller recognizes)."""
+        with self._lock:
+            self._open(cooldown if cooldown is not None else max(self._cooldown, self.base_cooldown))
+
+    def reset(self):
+        """Close the circuit and forget recent failures."""
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            self._cooldown = self.base_cooldown
+            self._set_state(self.CLOSED)
+
+    async def call(self, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch() under the breaker (raises CircuitOpenError while open)."""
+        probe = self.before_request()
+        try:
+            result = await fetch()
+        except CircuitOpenError:
+            if probe:
+                self.release_probe()
+            raise
+        except APIFetchError as e:
+            if e.status_code is not None and 400 <= e.status_code < 500 and e.status_code != 429:
+                self.record_success(probe)
+            else:
+                self.record_failure(probe)
+            raise
+        except Exception:
+            self.record_failure(probe)
+            raise
+        except BaseException:
+            if probe:
+                self.release_probe()
+            raise
+        self.record_success(probe)
+        return result
+
+    def get_stats(self) -> dict:
+        state = self.state
+        with self._lock:
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "failures": self._total_failures,
+                "opened": self._opened,
+                "rejected": self._rejected,
+                "retry_in_s": round(max(0.0, self._remaining()), 1) if state == self.OPEN else 0.0,
+            }
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.environ.get(name)
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+    return default
+
+
+def get_circuit_breaker(source: str) -> CircuitBreaker:
+    """Process-wide circuit breaker for a data source."""
+    return CircuitBreaker.for_source(source)
+
+
+def with_circuit_breaker(source: str):
+    """Decorator running an async request function under the source's circuit breaker."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await get_circuit_breaker(source).call(lambda: func(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def is_source_healthy(source: str) -> bool:
+    """False while the source's circuit is open (sources never requested are healthy)."""
+    with CircuitBreaker._registry_lock:
+        breaker = CircuitBreaker._registry.get(source)
+    return breaker is None or breaker.is_available()
+
+
+def get_unhealthy_sources(sources: List[str]) -> List[str]:
+    """The given sources whose circuit is currently open."""
+    return [source for source in sources if not is_source_healthy(source)]
+
+
+def get_circuit_stats() -> Dict[str, dict]:
+    """State and counters of every circuit breaker."""
+    with CircuitBreaker._registry_lock:
+        breakers = list(CircuitBreaker._registry.values())
+    return {breaker.source: breaker.get_stats() for breaker in breakers}
+
+
+class HTTPSessionManager:
+    """
+    Shared aiohttp sessions for all plugin API clients.
+
+    One pooled session per event loop (aiohttp sessions are bound to the loop
+    that created them), so every request from the same loop reuses keep-alive
+    connections and cached DNS results instead of paying DNS + TCP + TLS on
+    each call. Sessions are created on first use and closed by close()
+    (Actor.shutdown closes them).
+
+    Connections per host are capped at LIMIT_PER_HOST. A client that needs
+    more parallel requests to its host registers a higher cap with
+    set_host_limit() and passes the host to get_session(); such hosts get a
+    pooled session of their own, so the cap of every other host is unchanged.
+
+    Usage:
+        session = get_http_session()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
+            ...
+
+    Environment:
+        LIVEWEB_HTTP_LIMIT_PER_HOST   default connections per host (default: 10)
+    """
+
+    # Connection pool limits
+    LIMIT = 100
+    LIMIT_PER_HOST = 10
+    # Seconds an idle connection stays in the pool
+    KEEPALIVE_TIMEOUT = 60.0
+    # Seconds a resolved host stays in the DNS cache
+    DNS_CACHE_TTL = 300
+
+    def __init__(self):
+        # Keyed by (loop, connections per host)
+        self._sessions: Dict[Tuple[asyncio.AbstractEventLoop, int], aiohttp.ClientSession] = {}
+        self._host_limits: Dict[str, int] = {}
+        self._requests = 0
+        self._connections_opened = 0
+        self._connections_reused = 0
+        self._dns_cache_hits = 0
+        self._dns_cache_misses = 0
+
+    def default_host_limit(self) -> int:
+        return int(_env_float("LIVEWEB_HTTP_LIMIT_PER_HOST", self.LIMIT_PER_HOST)) or self.LIMIT_PER_HOST
+
+    def set_host_limit(self, host: str, limit: int):
+        """Allow up to `limit` concurrent connections to host (see get_session(host))."""
+        self._host_limits[host] = max(1, limit)
+
+    def get_session(self, host: Optional[str] = None) -> aiohttp.ClientSession:
+        """
+        Pooled session for the running event loop (created on first use).
+
+        Args:
+            host: Host the requests go to; hosts registered with set_host_limit()
+                get a session with their own connection cap
+        """
+        loop = asyncio.get_running_loop()
+        limit_per_host = self._host_limits.get(host) or self.default_host_limit()
+        key = (loop, limit_per_host)
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            # Loops that are gone cannot be used to close their sessions; drop them
+            for stale in [k for k in self._sessions if k[0].is_closed()]:
+                del self._sessions[stale]
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.LIMIT,
+                    limit_per_host=limit_per_host,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=self.DNS_CACHE_TTL,
+                ),
+                trace_configs=[self._trace_config()],
+            )
+            self._sessions[key] = session
+        return session
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        """Connection/DNS callbacks feeding get_stats() and the Prometheus counters."""
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host or ""
+            self._requests += 1
+            PLUGIN_HTTP_REQUESTS.inc(host=ctx.host)
+
+        async def on_connection_create_end(session, ctx, params):
+            self._connections_opened += 1
+            PLUGIN_HTTP_CONNECTIONS.inc(host=getattr(ctx, "host", ""))
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._connections_reused += 1
+
+        async def on_dns_cache_hit(session, ctx, params):
+            self._dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, ctx, params):
+            self._dns_cache_misses += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+    async def close(self):
+        """Close the running loop's sessions and forget sessions of closed loops."""
+        loop = asyncio.get_running_loop()
+        sessions = [self._sessions.pop(k) for k in [k for k in self._sessions if k[0] is loop]]
+        for stale in [k for k in self._sessions if k[0].is_closed()]:
+            del self._sessions[stale]
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+
+    def get_stats(self) -> dict:
+        """Connection reuse statistics (cumulative for the process)."""
+        connections = self._connections_opened + self._connections_reused
+        return {
+            "requests": self._requests,
+            "connections_opened": self._connections_opened,
+            "connections_reused": self._connections_reused,
+            "reuse_rate": self._connections_reused / connections if connections else 0.0,
+            "dns_cache_hits": self._dns_cache_hits,
+            "dns_cache_misses": self._dns_cache_misses,
+            "open_sessions": sum(1 for s in self._sessions.values() if not s.closed),
+        }
+
+
+HTTP_SESSIONS = HTTPSessionManager()
+
+
+def get_http_session(host: Optional[str] = None) -> aiohttp.ClientSession:
+    """Shared pooled session for plugin API requests on the running loop."""
+    return HTTP_SESSIONS.get_session(host)
+
+
+async def close_http_sessions():
+    """Close the shared sessions of the running loop."""
+    await HTTP_SESSIONS.close()
+
+
+def get_http_stats() -> dict:
+    """Connection reuse statistics for plugin API requests."""
+    return HTTP_SESSIONS.get_stats()
+
+
+async def closing_http_session(coro):
+    """
+    Await coro, then close the running loop's shared session.
+
+    For coroutines run on a temporary event loop (asyncio.run in a worker
+    thread), whose session would otherwise be left open when the loop closes.
+    """
+    try:
+        return await coro
+    finally:
+        await close_http_sessions()
+
+
+class APIResponseCache:
+    """
+    Process-wide TTL cache of API responses with in-flight deduplication.
+
+    Entries are keyed by (source, key), where key identifies one upstream
+    response (endpoint + params, symbol, location, ...). Within the TTL a
+    repeated call returns a copy of the stored response without a request;
+    concurrent calls for the same key on one event loop share a single
+    request. Errors and None results are never stored.
+
+    Callers get deep copies, so mutating a returned response (e.g. adding a
+    rank to a story) never changes the cached one.
+
+    Environment:
+        LIVEWEB_API_CACHE_TTL           TTL in seconds for every source (0 = disabled)
+        LIVEWEB_API_CACHE_TTL_<SOURCE>  TTL for one source (e.g. LIVEWEB_API_CACHE_TTL_STOOQ)
+    """
+
+    # Default TTL per cache source (seconds); unknown sources use DEFAULT_TTL
+    SOURCE_TTLS = {
+        "coingecko": 60.0,
+        "stooq": 300.0,
+        "hackernews": 60.0,
+        "taostats": 120.0,
+        "weather": 600.0,
+    }
+    DEFAULT_TTL = 60.0
+    # Stored responses; expired entries (then oldest) are evicted past this
+    MAX_ENTRIES = 4096
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, str, Hashable], asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def ttl_for(self, source: str) -> float:
+        """TTL for a source (environment overrides, then SOURCE_TTLS)."""
+        for name in (f"LIVEWEB_API_CACHE_TTL_{source.upper()}", "LIVEWEB_API_CACHE_TTL"):
+            value = os.environ.get(name)
+            if value:
+                try:
+                    return max(0.0, float(value))
+                except ValueError:
+                    pass
+        return self.SOURCE_TTLS.get(source, self.DEFAULT_TTL)
+
+    def _count(self, source: str, result: str):
+        with self._lock:
+            stats = self._stats.setdefault(source, {"hits": 0, "misses": 0, "joined": 0})
+            stats[result] += 1
+        PLUGIN_API_CACHE_REQUESTS.inc(source=source, result=result)
+
+    def _lookup(self, entry_key: Tuple[str, Hashable]) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[entry_key]
+                return False, None
+            return True, entry[1]
+
+    def _store(self, entry_key: Tuple[str, Hashable], value: Any, ttl: float):
+        now = time.monotonic()
+        with self._lock:
+            if len(self._entries) >= self.MAX_ENTRIES:
+                for key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                    del self._entries[key]
+                while len(self._entries) >= self.MAX_ENTRIES:
+                    del self._entries[next(iter(self._entries))]
+            self._entries[entry_key] = (now + ttl, value)
+
+    async def get_or_fetch(
+        self,
+        source: str,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """
+        Cached response for (source, key), calling fetch() on a miss.
+
+        Args:
+            source: Cache source name (plugin CACHE_SOURCE)
+            key: Hashable identity of the upstream response
+            fetch: Coroutine function performing the request
+            ttl: Seconds to keep the response (default: ttl_for(source))
+
+        Returns:
+            Copy of the cached or freshly fetched response
+        """
+        ttl = self.ttl_for(source) if ttl is None else ttl
+        if ttl <= 0:
+            return await fetch()
+
+        entry_key = (source, key)
+        found, value = self._lookup(entry_key)
+        if found:
+            self._count(source, "hits")
+            return copy.deepcopy(value)
+
+        # Share one request among concurrent callers; the request runs as its
+        # own task so a cancelled caller does not cancel it for the others
+        inflight_key = (asyncio.get_running_loop(), source, key)
+        task = self._inflight.get(inflight_key)
+        if task is not None:
+            self._count(source, "joined")
+        else:
+            self._count(source, "misses")
+            task = asyncio.ensure_future(self._fetch_and_store(entry_key, fetch, ttl))
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda t: self._finish(inflight_key, t))
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _finish(self, inflight_key, task: asyncio.Future):
+        self._inflight.pop(inflight_key, None)
+        if not task.cancelled():
+            task.exception()  # Retrieved here so an error nobody awaited is not logged as lost
+
+    async def _fetch_and_store(self, entry_key, fetch, ttl: float) -> Any:
+        value = await fetch()
+        if value is not None:
+            self._store(entry_key, value, ttl)
+        return value
+
+    def clear(self, source: Optional[str] = None):
+        """Drop stored responses (all sources, or one)."""
+        with self._lock:
+            if source is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == source]:
+                    del self._entries[key]
+
+    def get_stats(self) -> dict:
+        """Hit/miss/joined counts per source (cumulative for the process)."""
+        with self._lock:
+            stats = {source: dict(counts) for source, counts in self._stats.items()}
+            entries = len(self._entries)
+        for counts in stats.values():
+            total = counts["hits"] + counts["misses"] + counts["joined"]
+            counts["hit_rate"] = (counts["hits"] + counts["joined"]) / total if total else 0.0
+        return {"entries": entries, "sources": stats}
+
+
+API_RESPONSE_CACHE = APIResponseCache()
+
+
+async def cached_api_call(
+    source: str,
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]],
+    ttl: Optional[float] = None,
+) -> Any:
+    """Fetch through the process-wide API response cache (see APIResponseCache)."""
+    return await API_RESPONSE_CACHE.get_or_fetch(source, key, fetch, ttl)
+
+
+def get_api_cache_stats() -> dict:
+    """API response cache statistics."""
+    return API_RESPONSE_CACHE.get_stats()
 
 
 class BaseAPIClient(ABC):
     """
-    Base class for API clients with rate limiting.
+    Base class for API clients with rate limiting and response caching.
 
     Subclasses should:
     1. Set _rate_limiter class variable with appropriate interval
     2. Call await self._rate_limiter.wait() before making requests
+    3. Set cache_source and wrap requests in _cached() to share responses
+       within the source's TTL
     """
 
     _rate_limiter: ClassVar[RateLimiter]
+    cache_source: ClassVar[str] = ""
 
     @classmethod
     async def _rate_limit(cls):
         """Apply rate limiting. Subclasses can override for custom behavior."""
         await cls._rate_limiter.wait()
+
+    @classmethod
+    async def _cached(
+        cls,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Run fetch() through the API response cache under this client's cache_source."""
+        return await cached_api_call(cls.cache_source or cls.__name__, key, fetch, ttl)
@@ -7,7 +7,14 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 
-from liveweb_arena.plugins.base_client import APIFetchError, BaseAPIClient, RateLimiter, validate_api_response
+from liveweb_arena.plugins.base_client import (
+    APIFetchError,
+    BaseAPIClient,
+    RateLimiter,
+    get_http_session,
+    validate_api_response,
+    with_circuit_breaker,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +32,8 @@ class CoinGeckoClient(BaseAPIClient):
     PRO_API_BASE = "https://pro-api.coingecko.com/api/v3"
 
     # Free tier: 2s interval; Pro tier uses override in _rate_limit
-    _rate_limiter = RateLimiter(min_interval=2.0)
+    _rate_limiter = RateLimiter.for_host("api.coingecko.com", min_interval=2.0)
+    cache_source = CACHE_SOURCE
 
     @classmethod
     def get_api_key(cls) -> Optional[str]:
@@ -72,35 +80,53 @@ class CoinGeckoClient(BaseAPIClient):
         Returns:
             JSON response or None on error
         """
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        return await cls._cached(key, lambda: cls._request(endpoint, params, timeout))
+
+    @classmethod
+    @with_circuit_breaker(CACHE_SOURCE)
+    async def _request(
+        cls,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        timeout: float,
+    ) -> Optional[Dict[str, Any]]:
+        """Uncached GET request (see get())."""
         await cls._rate_limit()
 
         url = f"{cls.get_base_url()}{endpoint}"
         headers = cls.get_headers()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                ) as response:
-                    if response.status == 429:
-                        # Rate limited - wait and retry once
-                        await asyncio.sleep(5)
-                        async with session.get(
-                            url,
-                            params=params,
-                            headers=headers,
-                            timeout=aiohttp.ClientTimeout(total=timeout),
-                        ) as retry_response:
-                            if retry_response.status != 200:
-                                raise APIFetchError(f"CoinGecko retry failed: {retry_response.status}")
-                            return await retry_response.json()
-
-                    if response.status != 200:
-                        raise APIFetchError(f"CoinGecko API error: {response.status}")
-                    return await response.json()
+            session = get_http_session()
+            async with session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                if response.status == 429:
+                    # Rate limited - wait and retry once
+                    await asyncio.sleep(5)
+                    async with session.get(
+                        url,
+                        params=params,
+                        headers=headers,
+                        timeout=aiohttp.ClientTimeout(total=timeout),
+                    ) as retry_response:
+                        if retry_response.status != 200:
+                            raise APIFetchError(
+                                f"CoinGecko retry failed: {retry_response.status}",
+                                source=CACHE_SOURCE,
+                                status_code=retry_response.status,
+                            )
+                        return await retry_response.json()
+
+                if response.status != 200:
+                    raise APIFetchError(
+                        f"CoinGecko API error: {response.status}", source=CACHE_SOURCE, status_code=response.status,
+                    )
+                return await response.json()
         except APIFetchError:
             raise
         except Exception as e:
@@ -122,6 +148,15 @@ class CoinGeckoClient(BaseAPIClient):
         Returns:
             List of coin market data or None
         """
+        if vs_currency == "usd":
+            # Coalesced with other coin lookups into batched /coins/markets calls
+            ids = [coin_id for coin_id in coin_ids.split(",") if coin_id]
+            results = await asyncio.gather(*[
+                cls._cached(("coin", coin_id), lambda coin_id=coin_id: COIN_BATCHER.get(coin_id))
+                for coin_id in ids
+            ])
+            return [data for data in results if data is not None]
+
         params = {
             "vs_currency": vs_currency,
             "ids": coin_ids,
@@ -131,6 +166,123 @@ class CoinGeckoClient(BaseAPIClient):
         return await cls.get("/coins/markets", params)
 
 
+class CoinMarketBatcher:
+    """
+    Coalesces single-coin /coins/markets lookups into batched requests.
+
+    /coins/markets accepts comma-separated ids, so lookups that arrive within
+    `window` seconds of the first one on the same event loop are sent as one
+    request (at most `max_batch` ids) and the response rows are fanned back
+    out per coin. Against the free tier's one request per 2 s this turns N
+    concurrent coin lookups into one rate-limit slot instead of N.
+
+    Usage:
+        data = await COIN_BATCHER.get("bitcoin")   # market row dict or None
+    """
+
+    WINDOW = 0.05
+    MAX_BATCH = 100
+
+    def __init__(self, window: float = WINDOW, max_batch: int = MAX_BATCH):
+        self.window = window
+        self.max_batch = max_batch
+        # Open batch per event loop: {coin_id: future}
+        self._open: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]] = {}
+        self.batches = 0
+        self.coins = 0
+
+    async def get(self, coin_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Market data row for one coin (vs USD, 24h/7d/30d changes).
+
+        Returns:
+            Coin market data dict, or None if CoinGecko returned no row for it
+
+        Raises:
+            APIFetchError: If the batched request fails
+        """
+        loop = asyncio.get_running_loop()
+        batch = self._open.get(loop)
+        if batch is None:
+            batch = self._open[loop] = {}
+            loop.call_later(self.window, self._flush, loop, batch)
+
+        future = batch.get(coin_id)
+        if future is None:
+            future = batch[coin_id] = loop.create_future()
+            # Mark errors as retrieved in case every waiter was cancelled
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            if len(batch) >= self.max_batch:
+                self._flush(loop, batch)
+        return await asyncio.shield(future)
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, batch: Dict[str, asyncio.Future]):
+        if self._open.get(loop) is not batch:
+            return  # Already sent (filled up before the window ended)
+        del self._open[loop]
+        loop.create_task(self._send(batch))
+
+    async def _send(self, batch: Dict[str, asyncio.Future]):
+        coin_ids = list(batch)
+        self.batches += 1
+        self.coins += len(coin_ids)
+        try:
+            rows = await self._request(coin_ids)
+            by_id = {row.get("id"): row for row in rows if isinstance(row, dict)}
+            for coin_id, future in batch.items():
+                if not future.done():
+                    future.set_result(by_id.get(coin_id))
+        except Exception as e:
+            error = e if isinstance(e, APIFetchError) else APIFetchError(
+                f"Unexpected error for {','.join(coin_ids)}: {e}", source="coingecko",
+            )
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+
+    @with_circuit_breaker(CACHE_SOURCE)
+    async def _request(self, coin_ids: List[str]) -> list:
+        session = get_http_session()
+        params = {
+            "vs_currency": "usd",
+            "ids": ",".join(coin_ids),
+            "order": "market_cap_desc",
+            "per_page": len(coin_ids),
+            "page": 1,
+            "sparkline": "false",
+            "price_change_percentage": "24h,7d,30d",
+        }
+
+        await CoinGeckoClient._rate_limit()
+
+        async with session.get(
+            f"{CoinGeckoClient.get_base_url()}/coins/markets",
+            params=params,
+            headers=CoinGeckoClient.get_headers(),
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            if response.status != 200:
+                raise APIFetchError(
+                    f"status={response.status} for coin_ids={params['ids']}",
+                    source="coingecko",
+                    status_code=response.status,
+                )
+            data = await response.json()
+
+        validate_api_response(data, list, f"coin_ids={params['ids']}")
+        return data
+
+    def get_stats(self) -> dict:
+        return {
+            "batches": self.batches,
+            "coins": self.coins,
+            "avg_batch_size": round(self.coins / self.batches, 2) if self.batches else 0.0,
+        }
+
+
+COIN_BATCHER = CoinMarketBatcher()
+
+
 
 # ============================================================
 # Cache Data Fetcher (used by snapshot_integration)
@@ -155,31 +307,35 @@ async def fetch_cache_api_data() -> Optional[Dict[str, Any]]:
     coins = [coin.coin_id for coin in CoinVariable.COINS]
     logger.info(f"Fetching CoinGecko data for {len(coins)} coins...")
 
-    try:
-        async with aiohttp.ClientSession() as session:
-            # Use CoinGeckoClient's API key if available
-            headers = CoinGeckoClient.get_headers()
-            base_url = CoinGeckoClient.get_base_url()
-
-            params = {
-                "vs_currency": "usd",
-                "ids": ",".join(coins),
-                "order": "market_cap_desc",
-                "per_page": 100,
-                "page": 1,
-                "sparkline": "false",
-                "price_change_percentage": "24h,7d,30d",
-            }
+    @with_circuit_breaker(CACHE_SOURCE)
+    async def fetch_markets():
+        session = get_http_session()
+        # Use CoinGeckoClient's API key if available
+        headers = CoinGeckoClient.get_headers()
+        base_url = CoinGeckoClient.get_base_url()
 
-            async with session.get(
-                f"{base_url}/coins/markets",
-                params=params,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                if response.status != 200:
-                    raise Exception(f"API error: {response.status}")
-                data = await response.json()
+        params = {
+            "vs_currency": "usd",
+            "ids": ",".join(coins),
+            "order": "market_cap_desc",
+            "per_page": 100,
+            "page": 1,
+            "sparkline": "false",
+            "price_change_percentage": "24h,7d,30d",
+        }
+
+        async with session.get(
+            f"{base_url}/coins/markets",
+            params=params,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as response:
+            if response.status != 200:
+                raise APIFetchError(f"API error: {response.status}", source=CACHE_SOURCE, status_code=response.status)
+            return await response.json()
+
+    try:
+        data = await CoinGeckoClient._cached(("markets", tuple(coins)), fetch_markets)
 
         # Organize by coin_id for easy lookup
         result = {
@@ -226,6 +382,7 @@ async def fetch_single_coin_data(coin_id: str) -> Dict[str, Any]:
     Fetch market data for a single coin.
 
     Used by page-based cache: each page caches its own coin's data.
+    Concurrent lookups are batched by COIN_BATCHER.
 
     Args:
         coin_id: CoinGecko coin ID (e.g., "bitcoin", "ethereum")
@@ -237,42 +394,13 @@ async def fetch_single_coin_data(coin_id: str) -> Dict[str, Any]:
         APIFetchError: If API request fails or returns invalid data
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = CoinGeckoClient.get_headers()
-            base_url = CoinGeckoClient.get_base_url()
-
-            params = {
-                "vs_currency": "usd",
-                "ids": coin_id,
-                "order": "market_cap_desc",
-                "per_page": 1,
-                "page": 1,
-                "sparkline": "false",
-                "price_change_percentage": "24h,7d,30d",
-            }
-
-            await CoinGeckoClient._rate_limit()
-
-            async with session.get(
-                f"{base_url}/coins/markets",
-                params=params,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as response:
-                if response.status != 200:
-                    raise APIFetchError(
-                        f"status={response.status} for coin_id={coin_id}",
-                        source="coingecko",
-                        status_code=response.status,
-                    )
-                data = await response.json()
+        data = await CoinGeckoClient._cached(("coin", coin_id), lambda: COIN_BATCHER.get(coin_id))
 
         if not data:
             raise APIFetchError(f"Empty response for coin_id={coin_id}", source="coingecko")
 
-        validate_api_response(data, list, f"coin_id={coin_id}")
-        validate_api_response(data[0], dict, f"coin_id={coin_id} first element")
-        return data[0]
+        validate_api_response(data, dict, f"coin_id={coin_id}")
+        return data
 
     except APIFetchError:
         raise
@@ -7,8 +7,9 @@ from enum import Enum
 from typing import Any, Dict, List, Optional
 
 from liveweb_arena.core.validators.base import (
-    QuestionTemplate, GeneratedQuestion, ValidationResult, register_template,
+    QuestionTemplate, GeneratedQuestion, ValidationResult, Validator, register_template,
 )
+from liveweb_arena.core.validators.validators import NumericToleranceValidator
 from liveweb_arena.core.ground_truth_trigger import (
     UrlPatternTrigger, TriggerConfig, GroundTruthResult
 )
@@ -239,6 +240,15 @@ class CoinGeckoPriceTemplate(QuestionTemplate):
 - Score 0.0: Values differ by more than 5%
 - Accept formats: $45,123.45, 45123.45, $45,123"""
 
+    def get_fast_validator(self, validation_info: Dict[str, Any]) -> Optional[Validator]:
+        metric_type = validation_info.get("metric_type", "current_price")
+        if validation_info.get("is_percentage", False):
+            return NumericToleranceValidator(2.0, 2.0, unit="pp", require_same_sign=True)
+        if metric_type == "market_cap":
+            # Scale words ("$1.2 trillion") need the LLM judge
+            return None
+        return NumericToleranceValidator(0.05, 0.05, relative=True)
+
     async def get_ground_truth(self, validation_info: Dict[str, Any]) -> GroundTruthResult:
         """Get price data from collected API data (no network fallback)."""
         coin_id = validation_info["coin_id"]
@@ -4,8 +4,9 @@ import random
 from typing import Any, Dict, Optional
 
 from liveweb_arena.core.validators.base import (
-    QuestionTemplate, GeneratedQuestion, ValidationResult, register_template,
+    QuestionTemplate, GeneratedQuestion, ValidationResult, Validator, register_template,
 )
+from liveweb_arena.core.validators.validators import NumericToleranceValidator
 from liveweb_arena.core.ground_truth_trigger import (
     UrlPatternTrigger, TriggerConfig, GroundTruthResult
 )
@@ -67,6 +68,9 @@ class CoinGeckoRankTemplate(QuestionTemplate):
 - Accept formats: "#5", "5", "5th", "rank 5", "ranked #5", "position 5"
 - Note: Lower rank number = higher market cap (rank 1 is highest)"""
 
+    def get_fast_validator(self, validation_info: Dict[str, Any]) -> Optional[Validator]:
+        return NumericToleranceValidator(2, 2)
+
     async def get_ground_truth(self, validation_info: Dict[str, Any]) -> GroundTruthResult:
         """Get market rank from collected API data (no network fallback)."""
         coin_id = validation_info.get("coin_id", "")
@@ -2,18 +2,27 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 import aiohttp
 
-from liveweb_arena.plugins.base_client import APIFetchError, BaseAPIClient, RateLimiter, validate_api_response
+from liveweb_arena.plugins.base_client import (
+    APIFetchError,
+    BaseAPIClient,
+    HTTP_SESSIONS,
+    RateLimiter,
+    get_http_session,
+    validate_api_response,
+    with_circuit_breaker,
+)
 
 logger = logging.getLogger(__name__)
 
 CACHE_SOURCE = "hackernews"
 
 # Firebase API base URL
-HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
+HN_API_HOST = "hacker-news.firebaseio.com"
+HN_API_BASE = f"https://{HN_API_HOST}/v0"
 
 
 class HackerNewsClient(BaseAPIClient):
@@ -30,8 +39,16 @@ class HackerNewsClient(BaseAPIClient):
     - /user/{id}.json - user details
     """
 
-    # Rate limit: 500ms between requests (HN API is quite permissive)
-    _rate_limiter = RateLimiter(min_interval=0.5)
+    # Rate limit: 20 requests/s sustained (HN API is quite permissive), bursts
+    # of MAX_CONCURRENT_ITEMS so a page's items go out in one wave; the
+    # connection cap for the host is raised to match
+    MAX_CONCURRENT_ITEMS = 30
+    _rate_limiter = RateLimiter.for_host(HN_API_HOST, min_interval=0.05, burst=MAX_CONCURRENT_ITEMS)
+    HTTP_SESSIONS.set_host_limit(HN_API_HOST, MAX_CONCURRENT_ITEMS)
+    cache_source = CACHE_SOURCE
+
+    # Item fetch bound shared by all concurrent batches, one per event loop
+    _item_semaphores: ClassVar[Dict[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
 
     @classmethod
     async def get(
@@ -49,24 +66,37 @@ class HackerNewsClient(BaseAPIClient):
         Returns:
             JSON response or None on error
         """
-        await cls._rate_limit()
-
-        url = f"{HN_API_BASE}{endpoint}"
+        return await cls._cached(endpoint, lambda: cls._request(endpoint, timeout))
 
+    @classmethod
+    async def _request(cls, endpoint: str, timeout: float) -> Optional[Any]:
+        """Uncached GET request (see get())."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(f"HN API error: status={response.status} for {endpoint}")
-                        return None
-                    return await response.json()
+            return await cls._fetch_json(endpoint, timeout)
+        except APIFetchError as e:
+            logger.warning(f"HN API error: {e}")
+            return None
         except Exception as e:
             logger.warning(f"HN API request failed for {endpoint}: {e}")
             return None
 
+    @classmethod
+    @with_circuit_breaker(CACHE_SOURCE)
+    async def _fetch_json(cls, endpoint: str, timeout: float) -> Any:
+        """GET one endpoint; raises on HTTP errors (so the circuit breaker sees them)."""
+        await cls._rate_limit()
+
+        session = get_http_session(HN_API_HOST)
+        async with session.get(
+            f"{HN_API_BASE}{endpoint}",
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            if response.status != 200:
+                raise APIFetchError(
+                    f"status={response.status} for {endpoint}", source=CACHE_SOURCE, status_code=response.status,
+                )
+            return await response.json()
+
     @classmethod
     async def get_top_stories(cls, limit: int = 30) -> List[int]:
         """
@@ -139,31 +169,42 @@ class HackerNewsClient(BaseAPIClient):
             return data
         return None
 
+    @classmethod
+    def _item_semaphore(cls) -> asyncio.Semaphore:
+        """Semaphore bounding item fetches on the running loop (created on first use)."""
+        loop = asyncio.get_running_loop()
+        semaphore = cls._item_semaphores.get(loop)
+        if semaphore is None:
+            for stale in [l for l in cls._item_semaphores if l.is_closed()]:
+                del cls._item_semaphores[stale]
+            semaphore = cls._item_semaphores[loop] = asyncio.Semaphore(cls.MAX_CONCURRENT_ITEMS)
+        return semaphore
+
     @classmethod
     async def get_items_batch(cls, item_ids: List[int]) -> Dict[int, Dict[str, Any]]:
         """
         Fetch multiple items in parallel.
 
+        All items are requested concurrently (at most MAX_CONCURRENT_ITEMS in
+        flight across all batches on the loop). Items go through the response cache, so items already
+        fetched for another page (top/ask/show/detail) cost no request, and
+        concurrent fetches of the same item share one.
+
         Args:
             item_ids: List of item IDs to fetch
 
         Returns:
             Dict mapping item_id to item data
         """
-        results = {}
-
-        # Fetch in batches to avoid overwhelming the API
-        batch_size = 10
-        for i in range(0, len(item_ids), batch_size):
-            batch = item_ids[i:i + batch_size]
-            tasks = [cls.get_item(item_id) for item_id in batch]
-            batch_results = await asyncio.gather(*tasks)
+        semaphore = cls._item_semaphore()
 
-            for item_id, data in zip(batch, batch_results):
-                if data:
-                    results[item_id] = data
+        async def fetch(item_id: int):
+            async with semaphore:
+                return await cls.get_item(item_id)
 
-        return results
+        unique_ids = list(dict.fromkeys(item_ids))
+        items = await asyncio.gather(*[fetch(item_id) for item_id in unique_ids])
+        return {item_id: data for item_id, data in zip(unique_ids, items) if data}
 
 
 async def fetch_homepage_api_data(limit: int = 30) -> Dict[str, Any]:
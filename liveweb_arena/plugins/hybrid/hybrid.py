@@ -29,6 +29,8 @@ class HybridPlugin(BasePlugin):
         "www.stooq.com",
     ]
 
+    data_sources = ["coingecko", "stooq"]
+
     def get_blocked_patterns(self) -> List[str]:
         """Block API access (same as individual plugins)."""
         return [
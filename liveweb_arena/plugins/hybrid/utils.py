@@ -10,6 +10,7 @@ import asyncio
 import time
 from typing import Any, Callable, Optional, TypeVar
 
+from liveweb_arena.plugins.base_client import CircuitOpenError
 from liveweb_arena.plugins.coingecko.api_client import CoinGeckoClient
 from liveweb_arena.plugins.stooq.api_client import StooqClient, StooqRateLimitError
 from liveweb_arena.utils.logger import log, progress, progress_done, is_verbose
@@ -34,7 +35,12 @@ async def retry_with_backoff(
     max_delay: float = 60.0,
     operation_name: str = "operation",
 ) -> T:
-    """Retry an async operation with exponential backoff."""
+    """
+    Retry an async operation with exponential backoff.
+
+    Stooq rate limits and open circuit breakers are raised immediately:
+    the source is down for every attempt, so retrying only adds waiting.
+    """
     last_exception = None
     start_time = time.time()
 
@@ -49,7 +55,7 @@ async def retry_with_backoff(
                     progress_done("GT", f"{operation_name} done in {time.time()-start_time:.1f}s")
                 return result
             raise ValueError(f"{operation_name} returned None")
-        except StooqRateLimitError:
+        except (StooqRateLimitError, CircuitOpenError):
             raise
         except Exception as e:
             last_exception = e
@@ -7,7 +7,17 @@ from typing import Any, Dict, List, Optional
 
 import aiohttp
 
-from liveweb_arena.plugins.base_client import BaseAPIClient, RateLimiter
+from liveweb_arena.plugins.base_client import (
+    APIFetchError,
+    BaseAPIClient,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimiter,
+    get_circuit_breaker,
+    get_http_session,
+    with_circuit_breaker,
+)
+from liveweb_arena.plugins.stooq.history_store import HISTORY_DAYS, get_history_store, parse_csv_rows
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +36,31 @@ class StooqRateLimitError(Exception):
     pass
 
 
+def _tail_lines(text: str, start: int, end: int, count: int) -> List[str]:
+    """
+    Last `count` lines of text[start:end], line endings normalized.
+
+    text[start] is the line break ending the header. Scans backwards in
+    growing chunks, so only the tail of a multi-decade CSV is split.
+    """
+    size = 4096
+    while True:
+        lo = max(start, end - size)
+        lines = text[lo:end].replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        if lo == start:
+            return lines[1:][-count:]  # lines[0] is the header's (empty) remainder
+        if len(lines) > count:
+            return lines[-count:]  # lines[0] may be a partial line
+        size *= 4
+
+
 def _parse_stooq_csv(csv_text: str, symbol: str = "") -> Optional[Dict[str, Any]]:
     """
     Parse Stooq CSV response into price data dict.
 
+    Only the header and the last HISTORY_DAYS rows are read (the text is
+    scanned from the end), so parse time does not grow with history length.
+
     Args:
         csv_text: Raw CSV text from Stooq API
         symbol: Optional symbol to include in result
@@ -38,13 +69,21 @@ def _parse_stooq_csv(csv_text: str, symbol: str = "") -> Optional[Dict[str, Any]
         Dict with price data or None if parsing fails.
         Includes 'history' field with recent daily data for historical queries.
     """
-    # Normalize line endings
-    csv_text = csv_text.replace("\r\n", "\n").replace("\r", "\n")
-    lines = csv_text.strip().split("\n")
-
-    if len(lines) < 2:
+    # Bounds of csv_text.strip() without copying the text
+    start, end = 0, len(csv_text)
+    while end > 0 and csv_text[end - 1].isspace():
+        end -= 1
+    while start < end and csv_text[start].isspace():
+        start += 1
+
+    header_end = start
+    while header_end < end and csv_text[header_end] not in "\r\n":
+        header_end += 1
+    if header_end == end:
         return None
 
+    lines = [csv_text[start:header_end]] + _tail_lines(csv_text, header_end, end, HISTORY_DAYS)
+
     headers = lines[0].lower().split(",")
     today_values = lines[-1].split(",")
     today_data = dict(zip(headers, today_values))
@@ -84,21 +123,27 @@ def _parse_stooq_csv(csv_text: str, symbol: str = "") -> Optional[Dict[str, Any]
         result["symbol"] = symbol
 
     # Parse historical data (last 30 days for historical queries)
+    # Column positions instead of a dict per row (last duplicate header wins,
+    # as with dict(zip(headers, values))); a missing column reads as None
     history = []
-    data_lines = lines[1:]  # Skip header
-    for line in data_lines[-30:]:  # Last 30 days
+    data_lines = lines[1:]  # Skip header; already the last HISTORY_DAYS rows
+    index = {name: i for i, name in enumerate(headers)}
+    date_i, open_i, high_i, low_i, close_i, volume_i = (
+        index.get(name, -1) for name in ("date", "open", "high", "low", "close", "volume")
+    )
+    for line in data_lines:
         values = line.split(",")
         if len(values) >= len(headers):
-            row_data = dict(zip(headers, values))
-            row_close = parse_float(row_data.get("close"))
+            values.append(None)  # values[-1] for missing columns
+            row_close = parse_float(values[close_i])
             if row_close is not None:
                 history.append({
-                    "date": row_data.get("date", ""),
-                    "open": parse_float(row_data.get("open")),
-                    "high": parse_float(row_data.get("high")),
-                    "low": parse_float(row_data.get("low")),
+                    "date": values[date_i] if date_i >= 0 else "",
+                    "open": parse_float(values[open_i]),
+                    "high": parse_float(values[high_i]),
+                    "low": parse_float(values[low_i]),
                     "close": row_close,
-                    "volume": parse_float(row_data.get("volume")),
+                    "volume": parse_float(values[volume_i]),
                 })
     result["history"] = history
 
@@ -109,7 +154,119 @@ class StooqClient(BaseAPIClient):
     """Stooq CSV API client with rate limiting."""
 
     CSV_URL = "https://stooq.com/q/d/l/"
-    _rate_limiter = RateLimiter(min_interval=0.5)
+    _rate_limiter = RateLimiter.for_host("stooq.com", min_interval=0.5)
+    cache_source = CACHE_SOURCE
+
+    @classmethod
+    async def fetch_symbol(
+        cls, symbol: str, timeout: float = 15.0, paced: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and parse the daily CSV of one symbol through the response cache.
+
+        Every Stooq code path (single asset, homepage, get_price_data) reads
+        the same CSV, so they all share one cached response per symbol. With
+        a history store configured (LIVEWEB_STOOQ_STORE_DIR), only rows since
+        the last stored day are downloaded.
+
+        Args:
+            paced: Take a host rate limit slot before downloading. Bulk callers
+                that bound concurrency themselves pass False.
+
+        Returns:
+            Parsed price data, or None if Stooq has no data for the symbol
+
+        Raises:
+            APIFetchError: If the download fails (HTTP error)
+            StooqRateLimitError: If the daily hits limit is exceeded
+        """
+        async def fetch():
+            store = get_history_store()
+            if store is not None:
+                return await cls._fetch_incremental(store, symbol, timeout, paced)
+            csv_text = await cls._download_csv(symbol, timeout, paced=paced)
+            if csv_text is None:
+                return None
+            return _parse_stooq_csv(csv_text, symbol)
+
+        return await cls._cached(symbol, fetch)
+
+    @classmethod
+    @with_circuit_breaker(CACHE_SOURCE)
+    async def _download_csv(
+        cls, symbol: str, timeout: float, start: Optional[int] = None, paced: bool = True
+    ) -> Optional[str]:
+        """
+        Daily CSV text for a symbol (rows from `start`, YYYYMMDD, if given).
+
+        Returns None only when Stooq has no data (for the range); a failed
+        download always raises, so callers can tell the two apart.
+
+        Raises:
+            APIFetchError: On non-200 responses (5xx and 429 count as circuit breaker failures)
+            StooqRateLimitError: If the daily hits limit is exceeded
+        """
+        params = {"s": symbol, "i": "d"}
+        if start is not None:
+            params["d1"] = str(start)
+
+        # Only real downloads take a rate limit slot; cached reads never wait
+        if paced:
+            await cls._rate_limit()
+
+        session = get_http_session()
+        async with session.get(
+            cls.CSV_URL,
+            params=params,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            headers={"User-Agent": "Mozilla/5.0"},
+        ) as response:
+            if response.status != 200:
+                raise APIFetchError(
+                    f"status={response.status} for symbol={symbol}",
+                    source=CACHE_SOURCE,
+                    status_code=response.status,
+                )
+            csv_text = await response.text()
+
+        if "Exceeded the daily hits limit" in csv_text:
+            # The limit applies to every episode in the process: stop them all
+            get_circuit_breaker(CACHE_SOURCE).trip(CircuitBreaker.MAX_COOLDOWN)
+            raise StooqRateLimitError(
+                "Stooq API daily limit exceeded. Wait for reset or use cached data."
+            )
+        if "No data" in csv_text:
+            return None
+        return csv_text
+
+    @classmethod
+    async def _fetch_incremental(
+        cls, store, symbol: str, timeout: float, paced: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Refresh the stored history of a symbol and build price data from its tail.
+
+        The stored rows are served only after a successful download ("No data"
+        = no new rows yet); a failed download raises instead of returning
+        stale prices.
+        """
+        last_date = await asyncio.to_thread(lambda: store.load(symbol).last_date)
+        csv_text = await cls._download_csv(symbol, timeout, start=last_date, paced=paced)
+        if csv_text is None and last_date is None:
+            return None
+
+        def update():
+            with store.locked(symbol):
+                if csv_text is not None:
+                    dates, columns = parse_csv_rows(csv_text)
+                    if last_date is None:
+                        store.replace(symbol, dates, columns)
+                    else:
+                        store.merge(symbol, dates, columns)
+                return store.load(symbol).to_price_data(symbol)
+
+        # Download succeeded; a range with no rows yet ("No data") keeps the stored history
+        return await asyncio.to_thread(update)
 
     @classmethod
     async def get_price_data(
@@ -140,6 +297,7 @@ class StooqClient(BaseAPIClient):
 
         Raises:
             StooqRateLimitError: If API rate limit is exceeded
+            CircuitOpenError: If Stooq is failing (circuit breaker open)
         """
         # If already rate limited, raise immediately
         if _rate_limited.get():
@@ -148,36 +306,21 @@ class StooqClient(BaseAPIClient):
                 "Wait for daily reset or manually populate cache."
             )
 
-        # Fall back to live API
-        await cls._rate_limit()
+        # Fail fast while Stooq is down for the whole process
+        get_circuit_breaker(CACHE_SOURCE).check()
 
         try:
-            async with aiohttp.ClientSession() as session:
-                params = {"s": symbol, "i": "d"}
-                async with session.get(
-                    cls.CSV_URL,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=timeout),
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(f"Stooq error for {symbol}: {response.status}")
-                        return None
-                    csv_text = await response.text()
-
-            # Check for rate limit error
-            if "Exceeded the daily hits limit" in csv_text:
-                _rate_limited.set(True)
-                logger.error("Stooq API daily limit exceeded!")
-                raise StooqRateLimitError(
-                    "Stooq API daily limit exceeded. Wait for reset or use cached data."
-                )
-
-            return _parse_stooq_csv(csv_text, symbol)
+            return await cls.fetch_symbol(symbol, timeout=timeout)
 
         except asyncio.TimeoutError:
             logger.warning(f"Stooq timeout for {symbol}")
             return None
+        except CircuitOpenError:
+            raise
         except StooqRateLimitError:
+            # The flag lives in this evaluation's context, not the fetch task's
+            _rate_limited.set(True)
+            logger.error("Stooq API daily limit exceeded!")
             raise
         except Exception as e:
             logger.warning(f"Stooq error for {symbol}: {e}")
@@ -225,39 +368,25 @@ async def fetch_cache_api_data() -> Optional[Dict[str, Any]]:
     }
     failed = 0
 
-    # Rate limit: max 5 concurrent requests, reuse single session
+    # Rate limit: max 5 concurrent requests over the shared session. This bound
+    # replaces the per-request host slot, which would serialize the bulk fetch.
     semaphore = asyncio.Semaphore(5)
 
-    async def fetch_one(session: aiohttp.ClientSession, symbol: str):
+    async def fetch_one(symbol: str):
         nonlocal failed
         async with semaphore:
             try:
-                url = f"https://stooq.com/q/d/l/?s={symbol}&i=d"
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as response:
-                    if response.status != 200:
-                        failed += 1
-                        return
-
-                    text = await response.text()
-                    if "Exceeded the daily hits limit" in text:
-                        failed += 1
-                        return
-
-                    parsed = _parse_stooq_csv(text, symbol)
-                    if parsed:
-                        result["assets"][symbol] = parsed
+                parsed = await StooqClient.fetch_symbol(symbol, paced=False)
+                if parsed is None:
+                    failed += 1
+                    return
+                result["assets"][symbol] = parsed
 
             except Exception:
                 failed += 1
 
-    # Fetch all with concurrency control and shared session
-    async with aiohttp.ClientSession(
-        headers={"User-Agent": "Mozilla/5.0"},
-    ) as session:
-        await asyncio.gather(*[fetch_one(session, s) for s in assets])
+    # Fetch all with concurrency control (cached symbols cost no request)
+    await asyncio.gather(*[fetch_one(s) for s in assets])
 
     result["_meta"]["asset_count"] = len(result["assets"])
     logger.info(f"Fetched {len(result['assets'])} assets from Stooq ({failed} failed)")
@@ -300,28 +429,15 @@ async def fetch_single_asset_data(symbol: str) -> Optional[Dict[str, Any]]:
 
     for sym in variants:
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"https://stooq.com/q/d/l/?s={sym}&i=d"
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=15),
-                    headers={"User-Agent": "Mozilla/5.0"},
-                ) as response:
-                    if response.status != 200:
-                        continue
-
-                    text = await response.text()
-                    if "Exceeded the daily hits limit" in text:
-                        _rate_limited.set(True)
-                        raise StooqRateLimitError("Stooq API daily limit exceeded")
-
-                    if "No data" in text:
-                        continue
-
-                    result = _parse_stooq_csv(text, sym)
-                    if result:
-                        return result
+            result = await StooqClient.fetch_symbol(sym)
+            if result:
+                return result
 
+        except StooqRateLimitError:
+            _rate_limited.set(True)
+            continue
+        except CircuitOpenError:
+            raise
         except Exception:
             continue
 
@@ -0,0 +1,272 @@
+"""
+Local per-symbol daily OHLCV store for Stooq.
+
+Instead of downloading a symbol's full daily CSV (often 20+ years) on every
+fetch, the store keeps the history on disk and each refresh only requests
+rows from the last stored date onward (`&d1=YYYYMMDD`). The last stored day
+is always re-requested, since Stooq's current-day bar changes until the close.
+
+Directory structure (columnar, append-only):
+    <store_dir>/
+    └── aapl.us/
+        ├── date.i32     # YYYYMMDD as int32
+        ├── open.f64     # float64, NaN = missing
+        ├── high.f64
+        ├── low.f64
+        ├── close.f64
+        ├── volume.f64
+        └── .lock        # flock for cross-process refreshes
+
+Columns load into stdlib array.array, so windows are contiguous slices
+found with bisect on the date column.
+
+Environment:
+    LIVEWEB_STOOQ_STORE_DIR   store directory (unset = disabled, full CSV downloads)
+"""
+
+import math
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: per-process locking only
+    fcntl = None
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Rows returned as 'history' in price data (matches _parse_stooq_csv)
+HISTORY_DAYS = 30
+
+
+def _parse_date(value: str) -> Optional[int]:
+    """'2024-01-31' -> 20240131"""
+    parts = value.strip().split("-")
+    if len(parts) != 3:
+        return None
+    try:
+        year, month, day = (int(p) for p in parts)
+    except ValueError:
+        return None
+    return year * 10000 + month * 100 + day
+
+
+def _format_date(value: int) -> str:
+    """20240131 -> '2024-01-31'"""
+    return f"{value // 10000:04d}-{value // 100 % 100:02d}-{value % 100:02d}"
+
+
+def _parse_float(value: Optional[str]) -> float:
+    try:
+        return float(value) if value else math.nan
+    except ValueError:
+        return math.nan
+
+
+def _value(x: float) -> Optional[float]:
+    return None if math.isnan(x) else x
+
+
+class SymbolHistory:
+    """Daily OHLCV columns for one symbol, sorted by date"""
+
+    def __init__(self, dates: array, columns: Dict[str, array]):
+        self.dates = dates
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def last_date(self) -> Optional[int]:
+        return self.dates[-1] if self.dates else None
+
+    def window(self, start: Optional[int] = None, end: Optional[int] = None) -> "SymbolHistory":
+        """Rows with start <= date <= end (YYYYMMDD ints, either bound optional)"""
+        lo = bisect_left(self.dates, start) if start is not None else 0
+        hi = bisect_right(self.dates, end) if end is not None else len(self.dates)
+        return SymbolHistory(self.dates[lo:hi], {name: col[lo:hi] for name, col in self.columns.items()})
+
+    def tail(self, days: int) -> "SymbolHistory":
+        """Last `days` rows"""
+        start = max(0, len(self.dates) - days)
+        return SymbolHistory(self.dates[start:], {name: col[start:] for name, col in self.columns.items()})
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """One row in the CSV-parsed format (date string, None for missing values)"""
+        result = {"date": _format_date(self.dates[index])}
+        for name in PRICE_COLUMNS:
+            result[name] = _value(self.columns[name][index])
+        return result
+
+    def to_price_data(self, symbol: str = "") -> Optional[Dict[str, Any]]:
+        """Price data dict in the same format as _parse_stooq_csv"""
+        if not self.dates:
+            return None
+        today = self.row(-1)
+        close = today["close"]
+        if close is None:
+            return None
+
+        daily_change = None
+        daily_change_pct = None
+        if len(self.dates) >= 2:
+            prev_close = _value(self.columns["close"][-2])
+            if prev_close and prev_close > 0:
+                daily_change = close - prev_close
+                daily_change_pct = (daily_change / prev_close) * 100
+
+        result = {
+            "date": today["date"],
+            "open": today["open"],
+            "high": today["high"],
+            "low": today["low"],
+            "close": close,
+            "volume": today["volume"],
+            "daily_change": daily_change,
+            "daily_change_pct": daily_change_pct,
+        }
+        if symbol:
+            result["symbol"] = symbol
+
+        recent = self.tail(HISTORY_DAYS)
+        result["history"] = [
+            recent.row(i) for i in range(len(recent)) if not math.isnan(recent.columns["close"][i])
+        ]
+        return result
+
+
+def parse_csv_rows(csv_text: str) -> Tuple[array, Dict[str, array]]:
+    """Parse a Stooq daily CSV into date/price columns (rows without a valid date are skipped)"""
+    lines = csv_text.replace("\r\n", "\n").replace("\r", "\n").strip().split("\n")
+    dates = array("i")
+    columns = {name: array("d") for name in PRICE_COLUMNS}
+    if len(lines) < 2:
+        return dates, columns
+
+    headers = lines[0].lower().split(",")
+    indexes = {name: headers.index(name) if name in headers else None for name in ("date", *PRICE_COLUMNS)}
+    if indexes["date"] is None:
+        return dates, columns
+
+    for line in lines[1:]:
+        values = line.split(",")
+        date = _parse_date(values[indexes["date"]]) if len(values) > indexes["date"] else None
+        if date is None:
+            continue
+        dates.append(date)
+        for name in PRICE_COLUMNS:
+            i = indexes[name]
+            columns[name].append(_parse_float(values[i]) if i is not None and i < len(values) else math.nan)
+    return dates, columns
+
+
+class HistoryStore:
+    """On-disk columnar daily history for Stooq symbols"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_lock = threading.Lock()
+
+    def _symbol_dir(self, symbol: str) -> Path:
+        return self.directory / re.sub(r"[^\w.^-]+", "_", symbol.lower())
+
+    @contextmanager
+    def locked(self, symbol: str):
+        """Exclusive access to one symbol's files (threads and processes)"""
+        with self._locks_lock:
+            lock = self._locks.setdefault(symbol, threading.Lock())
+        with lock:
+            path = self._symbol_dir(symbol)
+            path.mkdir(parents=True, exist_ok=True)
+            if fcntl is None:
+                yield
+                return
+            fd = os.open(path / ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
+
+    def load(self, symbol: str) -> SymbolHistory:
+        """Stored history (empty if the symbol was never fetched)"""
+        path = self._symbol_dir(symbol)
+        dates = self._read(path / "date.i32", "i")
+        columns = {name: self._read(path / f"{name}.f64", "d") for name in PRICE_COLUMNS}
+        # A write interrupted between column files leaves them uneven; keep the common prefix
+        rows = min([len(dates)] + [len(col) for col in columns.values()])
+        if rows < len(dates) or any(len(col) > rows for col in columns.values()):
+            dates = dates[:rows]
+            columns = {name: col[:rows] for name, col in columns.items()}
+        return SymbolHistory(dates, columns)
+
+    @staticmethod
+    def _read(path: Path, typecode: str) -> array:
+        values = array(typecode)
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return values
+        with open(path, "rb") as f:
+            values.fromfile(f, size // values.itemsize)
+        return values
+
+    def merge(self, symbol: str, dates: array, columns: Dict[str, array]) -> int:
+        """
+        Write fetched rows: stored rows on or after the first fetched date are
+        replaced, the rest are kept. Call inside locked(symbol).
+
+        Returns:
+            Number of rows written
+        """
+        if not dates:
+            return 0
+        path = self._symbol_dir(symbol)
+        stored = self.load(symbol)
+        keep = bisect_left(stored.dates, dates[0])
+
+        # Truncate replaced rows, then append the fetched ones (date column last,
+        # so an interrupted write never shows rows without prices)
+        for name in PRICE_COLUMNS:
+            self._write(path / f"{name}.f64", keep, columns[name])
+        self._write(path / "date.i32", keep, dates)
+        return len(dates)
+
+    @staticmethod
+    def _write(path: Path, keep_rows: int, values: array):
+        with open(path, "ab") as f:
+            f.truncate(keep_rows * values.itemsize)
+            values.tofile(f)
+
+    def replace(self, symbol: str, dates: array, columns: Dict[str, array]):
+        """Replace the whole stored history (full download). Call inside locked(symbol)."""
+        path = self._symbol_dir(symbol)
+        for name in PRICE_COLUMNS:
+            self._write(path / f"{name}.f64", 0, columns[name])
+        self._write(path / "date.i32", 0, dates)
+
+    def window(self, symbol: str, start: Optional[int] = None, end: Optional[int] = None) -> SymbolHistory:
+        """Stored rows of a symbol with start <= date <= end (YYYYMMDD ints)"""
+        return self.load(symbol).window(start, end)
+
+
+_store: Optional[HistoryStore] = None
+_store_dir: Optional[str] = None
+
+
+def get_history_store() -> Optional[HistoryStore]:
+    """Process-wide store for LIVEWEB_STOOQ_STORE_DIR (None when unset)"""
+    global _store, _store_dir
+    directory = os.environ.get("LIVEWEB_STOOQ_STORE_DIR") or None
+    if directory != _store_dir:
+        _store = HistoryStore(Path(directory)) if directory else None
+        _store_dir = directory
+    return _store
@@ -4,8 +4,9 @@ import random
 from typing import Any, Dict, List, Optional
 
 from liveweb_arena.core.validators.base import (
-    QuestionTemplate, GeneratedQuestion, ValidationResult, register_template,
+    QuestionTemplate, GeneratedQuestion, ValidationResult, Validator, register_template,
 )
+from liveweb_arena.core.validators.validators import NumericToleranceValidator
 from liveweb_arena.core.ground_truth_trigger import (
     UrlPatternTrigger, TriggerConfig, GroundTruthResult,
 )
@@ -172,6 +173,16 @@ class StooqPriceTemplate(QuestionTemplate):
 - Score 1.0: Values match within 2% tolerance
 - Score 0.0: Values differ by more than 2%"""
 
+    def get_fast_validator(self, validation_info: Dict[str, Any]) -> Optional[Validator]:
+        metric = validation_info.get("metric", "last_price")
+        if validation_info.get("is_percentage", False):
+            return NumericToleranceValidator(0.5, 0.5, unit="pp", require_same_sign=True)
+        if metric == "change_absolute":
+            # No tolerance is stated for absolute changes; leave to the LLM judge
+            return None
+        tolerance = 0.01 if metric == "last_price" else 0.02
+        return NumericToleranceValidator(tolerance, tolerance, relative=True)
+
     async def get_ground_truth(self, validation_info: Dict[str, Any]) -> GroundTruthResult:
         """Get ground truth from collected API data (no network fallback)."""
         symbol = validation_info["symbol"]
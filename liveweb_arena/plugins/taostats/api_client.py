@@ -2,10 +2,21 @@
 
 import asyncio
 import contextvars
+import copy
+import os
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 import aiohttp
 
-from liveweb_arena.plugins.base_client import APIFetchError
+from liveweb_arena.plugins.base_client import (
+    APIFetchError,
+    cached_api_call,
+    closing_http_session,
+    get_http_session,
+    with_circuit_breaker,
+)
 from liveweb_arena.utils.logger import log
 
 # Cache source name
@@ -109,33 +120,39 @@ async def fetch_all_subnets() -> Dict[str, Any]:
             }
         }
     """
+    return await cached_api_call(CACHE_SOURCE, ("subnets", API_BASE_URL), _fetch_all_subnets)
+
+
+@with_circuit_breaker(CACHE_SOURCE)
+async def _fetch_all_subnets() -> Dict[str, Any]:
+    """Uncached fetch_all_subnets()."""
     subnets = {}
 
     try:
-        async with aiohttp.ClientSession() as session:
-            # Fetch all subnets (paginated, get up to 200)
-            async with session.get(
-                f"{API_BASE_URL}/subnets",
-                params={"limit": 200},
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    raise APIFetchError(
-                        f"status={resp.status}, body={body[:500]}",
-                        source="taostats",
-                        status_code=resp.status,
-                    )
-
-                data = await resp.json()
-                results = data.get("results", [])
-
-                for subnet in results:
-                    netuid = str(subnet.get("netuid", ""))
-                    if not netuid or netuid == "0":  # Skip root network
-                        continue
-
-                    subnets[netuid] = _parse_subnet_data(subnet)
+        session = get_http_session()
+        # Fetch all subnets (paginated, get up to 200)
+        async with session.get(
+            f"{API_BASE_URL}/subnets",
+            params={"limit": 200},
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                raise APIFetchError(
+                    f"status={resp.status}, body={body[:500]}",
+                    source="taostats",
+                    status_code=resp.status,
+                )
+
+            data = await resp.json()
+            results = data.get("results", [])
+
+            for subnet in results:
+                netuid = str(subnet.get("netuid", ""))
+                if not netuid or netuid == "0":  # Skip root network
+                    continue
+
+                subnets[netuid] = _parse_subnet_data(subnet)
 
     except APIFetchError:
         raise
@@ -155,28 +172,41 @@ async def fetch_single_subnet_data(subnet_id: str) -> Dict[str, Any]:
     Args:
         subnet_id: Subnet ID (e.g., "27")
 
+    Served from the episode's subnet snapshot; subnets missing from it
+    (e.g. registered since the snapshot) are fetched from the detail endpoint.
+
     Returns:
         Dict with subnet data
 
     Raises:
         APIFetchError: If API request fails
     """
+    snapshot = await current_snapshot()
+    subnet = snapshot.subnets.get(str(subnet_id))
+    if subnet is not None:
+        return copy.deepcopy(subnet)
+    return await _fetch_subnet_detail(subnet_id)
+
+
+@with_circuit_breaker(CACHE_SOURCE)
+async def _fetch_subnet_detail(subnet_id: str) -> Dict[str, Any]:
+    """One subnet from the detail endpoint."""
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"{API_BASE_URL}/subnets/{subnet_id}",
-                timeout=aiohttp.ClientTimeout(total=30),
-            ) as resp:
-                if resp.status != 200:
-                    body = await resp.text()
-                    raise APIFetchError(
-                        f"status={resp.status} for subnet_id={subnet_id}, body={body[:200]}",
-                        source="taostats",
-                        status_code=resp.status,
-                    )
-
-                subnet = await resp.json()
-                return _parse_subnet_data(subnet)
+        session = get_http_session()
+        async with session.get(
+            f"{API_BASE_URL}/subnets/{subnet_id}",
+            timeout=aiohttp.ClientTimeout(total=30),
+        ) as resp:
+            if resp.status != 200:
+                body = await resp.text()
+                raise APIFetchError(
+                    f"status={resp.status} for subnet_id={subnet_id}, body={body[:200]}",
+                    source="taostats",
+                    status_code=resp.status,
+                )
+
+            subnet = await resp.json()
+            return _parse_subnet_data(subnet)
 
     except APIFetchError:
         raise
@@ -188,6 +218,9 @@ async def fetch_homepage_api_data() -> Dict[str, Any]:
     """
     Fetch all subnets data for homepage.
 
+    Served from the episode's subnet snapshot (same version as question
+    generation).
+
     Returns data in format compatible with cache system:
     {
         "subnets": {
@@ -196,31 +229,176 @@ async def fetch_homepage_api_data() -> Dict[str, Any]:
         }
     }
     """
-    return await fetch_all_subnets()
+    snapshot = await current_snapshot()
+    return {"subnets": copy.deepcopy(snapshot.subnets)}
 
 
 # ============================================================
-# Helper functions for templates
+# Process-wide subnet snapshot
 # ============================================================
 
-_subnet_cache: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
-    "_taostats_subnet_cache", default=None
+@dataclass(frozen=True)
+class SubnetSnapshot:
+    """One fetch of the subnet list. Never mutated once published."""
+    version: int
+    fetched_at: float
+    subnets: Dict[str, Any]   # All subnets (page API data)
+    filtered: Dict[str, Any]  # Top half by emission (question generation)
+
+
+class SubnetSnapshotStore:
+    """
+    Latest subnet snapshot shared by every episode in the process.
+
+    A new snapshot is built off to the side and published with a single
+    reference swap, so readers never see a partial update. A daemon thread
+    refreshes it every refresh interval while it is being read, and stops
+    after IDLE_STOP seconds without reads (the next read restarts it).
+    Snapshots older than twice the interval are refetched on read.
+
+    Environment:
+        LIVEWEB_TAOSTATS_REFRESH_S   refresh interval in seconds (default 120, 0 = no background refresh)
+    """
+
+    REFRESH_INTERVAL = 120.0
+    IDLE_STOP = 900.0
+
+    def __init__(self):
+        self._snapshot: Optional[SubnetSnapshot] = None
+        self._version = 0
+        self._lock = threading.Lock()
+        self._last_read = 0.0
+        self._refresher: Optional[threading.Thread] = None
+        self._inflight: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+
+    @property
+    def refresh_interval(self) -> float:
+        value = os.environ.get("LIVEWEB_TAOSTATS_REFRESH_S")
+        try:
+            return max(0.0, float(value)) if value else self.REFRESH_INTERVAL
+        except ValueError:
+            return self.REFRESH_INTERVAL
+
+    def _max_age(self) -> float:
+        return 2 * (self.refresh_interval or self.REFRESH_INTERVAL)
+
+    def publish(self, subnets: Dict[str, Any]) -> SubnetSnapshot:
+        """Build a snapshot from parsed subnets and make it the latest."""
+        filtered = _filter_by_emission(subnets)
+        with self._lock:
+            self._version += 1
+            snapshot = SubnetSnapshot(self._version, time.time(), subnets, filtered)
+            self._snapshot = snapshot
+        return snapshot
+
+    def _fresh(self) -> Optional[SubnetSnapshot]:
+        """Latest snapshot if recent enough; marks the store as read."""
+        self._last_read = time.time()
+        self._ensure_refresher()
+        snapshot = self._snapshot
+        if snapshot is not None and time.time() - snapshot.fetched_at <= self._max_age():
+            return snapshot
+        return None
+
+    async def refresh(self) -> SubnetSnapshot:
+        """Fetch the subnet list and publish it (bypasses the API response cache)."""
+        data = await _fetch_all_subnets()
+        return self.publish(data["subnets"])
+
+    async def get(self) -> SubnetSnapshot:
+        """Latest snapshot, fetching one if missing or stale (one fetch per loop at a time)."""
+        snapshot = self._fresh()
+        if snapshot is not None:
+            return snapshot
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(loop)
+        if task is None:
+            task = self._inflight[loop] = loop.create_task(self.refresh())
+            task.add_done_callback(lambda _: self._inflight.pop(loop, None))
+        return await asyncio.shield(task)
+
+    def get_sync(self) -> SubnetSnapshot:
+        """get() for synchronous callers (question generation)."""
+        snapshot = self._fresh()
+        if snapshot is not None:
+            return snapshot
+        try:
+            # Try to get existing event loop
+            loop = asyncio.get_event_loop()
+            if loop.is_running():
+                # If loop is running, fetch on a temporary loop in a worker thread
+                import concurrent.futures
+                with concurrent.futures.ThreadPoolExecutor() as executor:
+                    future = executor.submit(asyncio.run, closing_http_session(self.refresh()))
+                    return future.result(timeout=60)
+            return loop.run_until_complete(self.refresh())
+        except RuntimeError as e:
+            # Only handle "no event loop" errors, re-raise others
+            if "no current event loop" in str(e).lower() or "no running event loop" in str(e).lower():
+                return asyncio.run(closing_http_session(self.refresh()))
+            raise
+
+    def _ensure_refresher(self):
+        if self.refresh_interval <= 0:
+            return
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name="taostats-snapshot-refresher", daemon=True,
+            )
+            self._refresher.start()
+
+    def _refresh_loop(self):
+        while True:
+            interval = self.refresh_interval
+            if interval <= 0:
+                return
+            time.sleep(interval)
+            if time.time() - self._last_read > self.IDLE_STOP:
+                return
+            try:
+                snapshot = asyncio.run(closing_http_session(self.refresh()))
+                log("Taostats", f"Subnet snapshot v{snapshot.version} refreshed ({len(snapshot.subnets)} subnets)")
+            except Exception as e:
+                log("Taostats", f"Subnet snapshot refresh failed (keeping v{self._version}): {e}")
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+
+SUBNET_SNAPSHOTS = SubnetSnapshotStore()
+
+# Snapshot pinned by the current evaluation: question generation, page API
+# data and GT within one episode all read the same version
+_pinned_snapshot: contextvars.ContextVar[Optional[SubnetSnapshot]] = contextvars.ContextVar(
+    "_taostats_pinned_snapshot", default=None
 )
 
 
+async def current_snapshot() -> SubnetSnapshot:
+    """The evaluation's pinned snapshot (pins the latest one on first use)."""
+    snapshot = _pinned_snapshot.get()
+    if snapshot is None:
+        snapshot = await SUBNET_SNAPSHOTS.get()
+        _pinned_snapshot.set(snapshot)
+    return snapshot
+
+
+# ============================================================
+# Helper functions for templates
+# ============================================================
+
 async def _ensure_subnet_cache() -> Dict[str, Any]:
-    """Ensure subnet cache is loaded."""
-    cache = _subnet_cache.get()
-    if cache is None:
-        data = await fetch_all_subnets()
-        cache = data.get("subnets", {})
-        _subnet_cache.set(cache)
-    return cache
+    """Ensure subnet cache is loaded (returns a copy; the snapshot is shared)."""
+    return copy.deepcopy((await current_snapshot()).subnets)
 
 
 def get_cached_subnets() -> Dict[str, Any]:
-    """Get cached subnets (sync version for variable generation)."""
-    return _subnet_cache.get() or {}
+    """Get cached subnets (sync version for variable generation; returns a copy)."""
+    snapshot = _pinned_snapshot.get()
+    return copy.deepcopy(snapshot.filtered) if snapshot is not None else {}
 
 
 def _normalize_emission(subnets: Dict[str, Any]) -> Dict[str, Any]:
@@ -262,36 +440,12 @@ def _filter_by_emission(subnets: Dict[str, Any]) -> Dict[str, Any]:
 
 def initialize_cache():
     """
-    Initialize subnet cache synchronously.
+    Pin the current evaluation to the latest subnet snapshot.
 
-    Must be called before generating taostats questions.
-    Uses asyncio.run() to call async API.
+    Must be called before generating taostats questions. Called at the start
+    of every episode's task generation, so it always re-pins: an episode run
+    in a context that still holds an earlier episode's pin gets the latest
+    version instead. Only fetches (via asyncio.run() when called from a
+    running loop) when the process has no fresh snapshot yet.
     """
-    if _subnet_cache.get() is not None:
-        return  # Already initialized
-
-    try:
-        # Try to get existing event loop
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            # If loop is running, create a new task
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, fetch_all_subnets())
-                data = future.result(timeout=60)
-        else:
-            data = loop.run_until_complete(fetch_all_subnets())
-    except APIFetchError:
-        raise  # API errors propagate directly
-    except RuntimeError as e:
-        # Only handle "no event loop" errors, re-raise others
-        if "no current event loop" in str(e).lower() or "no running event loop" in str(e).lower():
-            data = asyncio.run(fetch_all_subnets())
-        else:
-            raise
-
-    cache = data.get("subnets", {})
-    if not cache:
-        raise APIFetchError("API returned no subnet data", source="taostats")
-
-    _subnet_cache.set(_filter_by_emission(cache))
+    _pinned_snapshot.set(SUBNET_SNAPSHOTS.get_sync())
@@ -1,17 +1,211 @@
 """Weather API client with caching support (wttr.in)"""
 
 import asyncio
+import json
 import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 import aiohttp
-from liveweb_arena.plugins.base_client import APIFetchError, BaseAPIClient, RateLimiter, validate_api_response
+from liveweb_arena.plugins.base_client import (
+    API_RESPONSE_CACHE,
+    APIFetchError,
+    closing_http_session,
+    get_http_session,
+    validate_api_response,
+    with_circuit_breaker,
+)
 
 logger = logging.getLogger(__name__)
 
 CACHE_SOURCE = "weather"
 
 
+@dataclass(frozen=True)
+class _LocationEntry:
+    body: bytes  # Raw wttr.in JSON response
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class LocationSnapshot:
+    """
+    Latest wttr.in JSON for every fetched location.
+
+    Responses are kept as raw bytes (several times smaller than the decoded
+    objects) and decoded per read, so every caller gets its own copy.
+    Entries younger than the TTL are served without a request; stale ones
+    are revalidated with If-None-Match / If-Modified-Since when wttr.in sent
+    validators (304 keeps the stored body). Concurrent reads of one location
+    on a loop share a request.
+
+    TTL: the weather source TTL of the API response cache
+    (LIVEWEB_API_CACHE_TTL_WEATHER, default 600 s).
+
+    Environment:
+        LIVEWEB_WEATHER_REFRESH_S   background refresh interval (unset/0 = off)
+    """
+
+    # wttr.in is rate-limited, use low concurrency
+    CONCURRENCY = 3
+    # Background refresher stops after this long without reads
+    IDLE_STOP = 900.0
+
+    def __init__(self):
+        self._entries: Dict[str, _LocationEntry] = {}
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._lock = threading.Lock()
+        self._last_read = 0.0
+        self._refresher: Optional[threading.Thread] = None
+        self.hits = 0
+        self.requests = 0
+        self.not_modified = 0
+
+    @property
+    def ttl(self) -> float:
+        return API_RESPONSE_CACHE.ttl_for(CACHE_SOURCE)
+
+    def is_stale(self, location: str, margin: float = 0.0) -> bool:
+        """True if the location is missing or expires within `margin` seconds."""
+        entry = self._entries.get(location)
+        return entry is None or time.time() - entry.fetched_at + margin >= self.ttl
+
+    def get_cached(self, location: str) -> Optional[Dict[str, Any]]:
+        """Weather JSON for a location if fresh, without a request."""
+        entry = self._entries.get(location)
+        if entry is None or self.is_stale(location):
+            return None
+        return json.loads(entry.body)
+
+    async def get(self, location: str) -> Dict[str, Any]:
+        """
+        Weather JSON for a location.
+
+        Raises:
+            APIFetchError: On non-200 status or invalid response
+        """
+        self._last_read = time.time()
+        self._ensure_refresher()
+        entry = self._entries.get(location)
+        if entry is not None and not self.is_stale(location):
+            self.hits += 1
+            return json.loads(entry.body)
+
+        key = (asyncio.get_running_loop(), location)
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._inflight[key] = asyncio.ensure_future(self._fetch(location))
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        entry = await asyncio.shield(task)
+        return json.loads(entry.body)
+
+    @with_circuit_breaker(CACHE_SOURCE)
+    async def _fetch(self, location: str) -> _LocationEntry:
+        previous = self._entries.get(location)
+        headers = {"User-Agent": "curl/7.64.1"}
+        if previous is not None and previous.etag:
+            headers["If-None-Match"] = previous.etag
+        if previous is not None and previous.last_modified:
+            headers["If-Modified-Since"] = previous.last_modified
+
+        self.requests += 1
+        session = get_http_session()
+        url = f"https://wttr.in/{location}?format=j1"
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=20), headers=headers) as response:
+            if response.status == 304 and previous is not None:
+                self.not_modified += 1
+                entry = _LocationEntry(previous.body, time.time(), previous.etag, previous.last_modified)
+            elif response.status == 200:
+                body = await response.read()
+                json.loads(body)  # Never store a body that cannot be served
+                entry = _LocationEntry(
+                    body, time.time(), response.headers.get("ETag"), response.headers.get("Last-Modified"),
+                )
+            else:
+                raise APIFetchError(
+                    f"status={response.status} for location={location}",
+                    source="weather",
+                    status_code=response.status,
+                )
+
+        with self._lock:
+            self._entries[location] = entry
+        return entry
+
+    async def refresh_stale(self, locations: List[str], margin: float = 0.0) -> int:
+        """
+        Refetch the locations that are stale (or expire within margin seconds).
+
+        Returns:
+            Number of locations refetched successfully
+        """
+        stale = [loc for loc in locations if self.is_stale(loc, margin)]
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+
+        async def refresh(location: str) -> bool:
+            async with semaphore:
+                try:
+                    await self._fetch(location)
+                    return True
+                except Exception as e:
+                    logger.warning(f"Weather refresh failed for {location}: {e}")
+                    return False
+
+        return sum(await asyncio.gather(*[refresh(loc) for loc in stale]))
+
+    def _ensure_refresher(self):
+        if _refresh_interval() <= 0:
+            return
+        with self._lock:
+            if self._refresher is not None and self._refresher.is_alive():
+                return
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name="weather-refresher", daemon=True,
+            )
+            self._refresher.start()
+
+    def _refresh_loop(self):
+        while True:
+            interval = _refresh_interval()
+            if interval <= 0:
+                return
+            time.sleep(interval)
+            if time.time() - self._last_read > self.IDLE_STOP:
+                return
+            try:
+                # Refresh what would expire before the next run
+                refreshed = asyncio.run(closing_http_session(
+                    self.refresh_stale(_get_all_locations(), margin=interval)
+                ))
+                logger.info(f"Weather background refresh: {refreshed} locations")
+            except Exception as e:
+                logger.warning(f"Weather background refresh failed: {e}")
+
+    def get_stats(self) -> dict:
+        return {
+            "locations": len(self._entries),
+            "bytes": sum(len(entry.body) for entry in self._entries.values()),
+            "hits": self.hits,
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+        }
+
+
+def _refresh_interval() -> float:
+    value = os.environ.get("LIVEWEB_WEATHER_REFRESH_S")
+    try:
+        return max(0.0, float(value)) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+LOCATIONS = LocationSnapshot()
+
+
 # ============================================================
 # Cache Data Fetcher (used by snapshot_integration)
 # ============================================================
@@ -53,31 +247,16 @@ async def fetch_cache_api_data() -> Optional[Dict[str, Any]]:
         },
         "locations": {},
     }
-    failed = 0
-
-    # wttr.in is rate-limited, use low concurrency
-    semaphore = asyncio.Semaphore(3)
+    # Only stale locations cost a request
+    await LOCATIONS.refresh_stale(locations)
 
-    async def fetch_one(location: str):
-        nonlocal failed
-        async with semaphore:
-            try:
-                async with aiohttp.ClientSession() as session:
-                    url = f"https://wttr.in/{location}?format=j1"
-                    async with session.get(
-                        url,
-                        timeout=aiohttp.ClientTimeout(total=20),
-                        headers={"User-Agent": "curl/7.64.1"},
-                    ) as response:
-                        if response.status != 200:
-                            failed += 1
-                            return
-                        data = await response.json()
-                        result["locations"][location] = data
-            except Exception:
-                failed += 1
-
-    await asyncio.gather(*[fetch_one(loc) for loc in locations])
+    failed = 0
+    for location in locations:
+        data = LOCATIONS.get_cached(location)
+        if data is None:
+            failed += 1
+        else:
+            result["locations"][location] = data
 
     result["_meta"]["location_count"] = len(result["locations"])
     logger.info(f"Fetched {len(result['locations'])} weather locations ({failed} failed)")
@@ -100,22 +279,9 @@ async def fetch_single_location_data(location: str) -> Dict[str, Any]:
         APIFetchError: If API request fails or returns invalid data
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            url = f"https://wttr.in/{location}?format=j1"
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=20),
-                headers={"User-Agent": "curl/7.64.1"},
-            ) as response:
-                if response.status != 200:
-                    raise APIFetchError(
-                        f"status={response.status} for location={location}",
-                        source="weather",
-                        status_code=response.status,
-                    )
-                data = await response.json()
-                validate_api_response(data, dict, f"location={location}")
-                return data
+        data = await LOCATIONS.get(location)
+        validate_api_response(data, dict, f"location={location}")
+        return data
 
     except APIFetchError:
         raise
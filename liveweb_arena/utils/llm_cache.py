@@ -0,0 +1,247 @@
+"""
+On-disk LLM response cache keyed by request content.
+
+Key: sha256 of (base_url, model, messages, temperature, seed). Re-running
+the same task/seed at temperature 0, or re-validating identical answers, then
+costs no LLM calls.
+
+Modes:
+- read_through: serve hits from disk, call the LLM on miss and store the result.
+  Only temperature 0 requests are cached; sampled requests always go to the LLM.
+- record: always call the LLM and (over)write the entry (any temperature)
+- replay: serve only from disk; a miss raises LLMCacheMissError (any temperature)
+
+Directory structure:
+    <cache_dir>/
+    └── ab/
+        └── ab12...ef.json   # {key, model, content, usage, created_at}
+
+Writes are atomic (temp file + os.replace), so concurrent processes never see
+partial entries. Entries expire after ttl seconds; when the directory grows
+past max_bytes the least recently used entries (by mtime, refreshed on hit)
+are evicted.
+
+Environment (used when not configured explicitly):
+    LIVEWEB_LLM_CACHE_MODE     read_through | record | replay (unset = disabled)
+    LIVEWEB_LLM_CACHE_DIR      cache directory (default: <page cache dir>/_llm)
+    LIVEWEB_LLM_CACHE_TTL      entry TTL in seconds (default: 7 days)
+    LIVEWEB_LLM_CACHE_MAX_MB   size cap in MB (default: 1024)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .llm_client import LLMFatalError
+from .logger import log
+
+CACHE_MODES = ("read_through", "record", "replay")
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+
+class LLMCacheMissError(LLMFatalError):
+    """Raised in replay mode when a request has no cached response."""
+
+
+class LLMResponseCache:
+    """File-per-entry response cache shared by all LLMClients that use it"""
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        mode: str = "read_through",
+        ttl: int = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown LLM cache mode: {mode}. Available: {CACHE_MODES}")
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # Lazily computed on first write
+
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_env(cls, mode: Optional[str] = None, default_dir: Optional[Path] = None) -> Optional["LLMResponseCache"]:
+        """
+        Build a cache from arguments/environment. Returns None when disabled.
+
+        Args:
+            mode: Cache mode (overrides LIVEWEB_LLM_CACHE_MODE)
+            default_dir: Directory to use when LIVEWEB_LLM_CACHE_DIR is unset
+        """
+        mode = mode or os.environ.get("LIVEWEB_LLM_CACHE_MODE", "")
+        if not mode or mode == "off":
+            return None
+
+        cache_dir = os.environ.get("LIVEWEB_LLM_CACHE_DIR")
+        if cache_dir:
+            cache_dir = Path(cache_dir)
+        elif default_dir is not None:
+            cache_dir = Path(default_dir)
+        else:
+            page_cache = Path(os.environ.get("LIVEWEB_CACHE_DIR", "/var/lib/liveweb-arena/cache"))
+            cache_dir = page_cache / "_llm"
+
+        ttl = int(os.environ.get("LIVEWEB_LLM_CACHE_TTL", DEFAULT_TTL))
+        max_mb = float(os.environ.get("LIVEWEB_LLM_CACHE_MAX_MB", DEFAULT_MAX_BYTES / (1024 * 1024)))
+        return cls(cache_dir, mode=mode, ttl=ttl, max_bytes=int(max_mb * 1024 * 1024))
+
+    @property
+    def reads(self) -> bool:
+        return self.mode in ("read_through", "replay")
+
+    @property
+    def writes(self) -> bool:
+        return self.mode in ("read_through", "record")
+
+    def applies_to(self, temperature: float) -> bool:
+        """Whether a request at this temperature goes through the cache"""
+        return self.mode != "read_through" or temperature == 0
+
+    @staticmethod
+    def make_key(
+        base_url: str, model: str, messages: List[dict], temperature: float, seed: Optional[int]
+    ) -> str:
+        payload = json.dumps(
+            {
+                "base_url": base_url,
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "seed": seed,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[dict]]]:
+        """Return (content, usage) for a fresh entry, or None"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._misses += 1
+            return None
+        except Exception as e:
+            log("LLMCache", f"Corrupted entry {path.name}: {e}")
+            self._unlink(path)
+            self._misses += 1
+            return None
+
+        if self.ttl and time.time() > entry.get("created_at", 0) + self.ttl:
+            self._unlink(path)
+            self._misses += 1
+            return None
+
+        try:
+            os.utime(path)  # Refresh LRU position
+        except OSError:
+            pass
+        self._hits += 1
+        return entry["content"], entry.get("usage")
+
+    def put(self, key: str, model: str, content: str, usage: Optional[dict]):
+        """Atomically write an entry, then enforce the size cap"""
+        path = self._path(key)
+        entry = {
+            "key": key,
+            "model": model,
+            "content": content,
+            "usage": usage,
+            "created_at": time.time(),
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".json")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except Exception as e:
+            log("LLMCache", f"Failed to write {path.name}: {e}")
+            return
+
+        self._writes += 1
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += size
+            over = self._size > self.max_bytes
+        if over:
+            self._evict()
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def _evict(self):
+        """Delete least recently used entries until 90% of max_bytes"""
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._unlink(path)
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._size = total
+            self._evictions += evicted
+        if evicted:
+            log("LLMCache", f"Evicted {evicted} entries ({total / (1024 * 1024):.1f} MB remaining)")
+
+    @staticmethod
+    def _unlink(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def get_stats(self) -> dict:
+        lookups = self._hits + self._misses
+        return {
+            "mode": self.mode,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "writes": self._writes,
+            "evictions": self._evictions,
+        }
@@ -3,12 +3,19 @@
 import asyncio
 import random
 import time
-from typing import Optional, Tuple
+from collections import deque
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
 
 import httpx
 import openai
 
 from .logger import log, progress, progress_done, is_verbose
+from .metrics import LLM_REQUESTS, LLM_TOKENS_PER_SECOND, LLM_TTFT_SECONDS
+from .rate_limit import AdaptiveLimiter, LimiterTicket, get_llm_limiter, parse_retry_after
+from .tracing import set_attribute, span, traced
+
+if TYPE_CHECKING:
+    from .llm_cache import LLMResponseCache
 
 
 class LLMFatalError(Exception):
@@ -33,10 +40,19 @@ class LLMClient:
     - Streaming support with usage tracking
     - Exponential backoff retry for recoverable errors
     - Configurable timeouts
+    - Long-lived HTTP connection pool with keep-alive (call close() when done)
+    - Optional early stop: cancel generation once a streamed action is complete
+    - Process-wide adaptive rate limiting per endpoint/model (see rate_limit.py)
+    - Optional hedging: a duplicate request (optionally to a fallback endpoint)
+      is fired when the first token is slower than the observed p95; the
+      first stream to produce a token wins and the other is cancelled
+    - Optional on-disk response cache (see llm_cache.py)
     """
 
     # Recoverable error status codes
     RETRY_STATUS_CODES = {429, 503, 502, 500}
+    # Status codes that signal endpoint overload (fed to the shared limiter)
+    OVERLOAD_STATUS_CODES = {429, 503}
 
     # Retry configuration
     MAX_RETRIES = 10  # Increased for rate limit resilience
@@ -48,7 +64,27 @@ class LLMClient:
     # Maximum chunks to receive (safety limit, ~32k chunks ≈ ~64k tokens)
     MAX_CHUNKS = 32000
 
-    def __init__(self, base_url: str, api_key: str, default_timeout: int = None):
+    # Connection pool: one client (and pool) is reused for every request
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 90.0  # seconds an idle connection stays in the pool
+
+    # Hedging: fire a second request when TTFT exceeds this quantile of history
+    HEDGE_QUANTILE = 0.95
+    HEDGE_MIN_SAMPLES = 20  # Use HEDGE_DEFAULT_DELAY until this many TTFT samples exist
+    HEDGE_DEFAULT_DELAY = 15.0  # seconds
+    HEDGE_MIN_DELAY = 1.0  # seconds, never hedge sooner than this
+    LATENCY_WINDOW = 200  # samples kept for TTFT/latency percentiles
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        default_timeout: int = None,
+        hedge: bool = False,
+        hedge_base_url: Optional[str] = None,
+        response_cache: Optional["LLMResponseCache"] = None,
+    ):
         """
         Initialize LLM client.
 
@@ -56,11 +92,135 @@ class LLMClient:
             base_url: OpenAI-compatible API base URL
             api_key: API key for authentication
             default_timeout: Default request timeout in seconds
+            hedge: Send a hedge request when the first token is late
+            hedge_base_url: Endpoint for hedge requests (default: base_url)
+            response_cache: On-disk response cache (None = always call the API)
         """
         self._base_url = base_url.rstrip("/")
         self._api_key = api_key
         self._default_timeout = default_timeout or self.DEFAULT_TIMEOUT
+        self._hedge = hedge
+        self._hedge_base_url = (hedge_base_url or base_url).rstrip("/")
+        self._response_cache = response_cache
+
+        # Created lazily on first request so the pool binds to the running loop
+        self._client: Optional[openai.AsyncOpenAI] = None
+        self._hedge_client: Optional[openai.AsyncOpenAI] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+        # Latency tracking (seconds) and hedge counters
+        self._ttft_samples: deque = deque(maxlen=self.LATENCY_WINDOW)
+        self._latency_samples: deque = deque(maxlen=self.LATENCY_WINDOW)
+        self._hedges_sent = 0
+        self._hedges_won = 0
+
+        # Connection reuse metrics
+        self._requests_sent = 0
+        self._connections_opened = 0
+        self._early_stops = 0
+        self._queue_delay_total = 0.0
+        self._queue_delay_max = 0.0
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    def _get_client(self) -> openai.AsyncOpenAI:
+        """Get the shared AsyncOpenAI client, creating it (and its pool) on first use."""
+        if self._client is None:
+            self._client = self._new_client(self._base_url)
+        return self._client
+
+    def _get_hedge_client(self) -> openai.AsyncOpenAI:
+        """Client for hedge requests (same pool; separate only if the endpoint differs)."""
+        if self._hedge_base_url == self._base_url:
+            return self._get_client()
+        if self._hedge_client is None:
+            self._hedge_client = self._new_client(self._hedge_base_url)
+        return self._hedge_client
+
+    def _new_client(self, base_url: str) -> openai.AsyncOpenAI:
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=self._timeout_config(self._default_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY,
+                ),
+                event_hooks={"request": [self._on_request]},
+            )
+        return openai.AsyncOpenAI(
+            base_url=base_url,
+            api_key=self._api_key,
+            http_client=self._http_client,
+            max_retries=0,  # We handle retries ourselves
+        )
+
+    @staticmethod
+    def _timeout_config(timeout_s: float) -> httpx.Timeout:
+        """Longer timeouts for connection and read (streams can be slow)."""
+        return httpx.Timeout(
+            connect=30.0,  # Connection timeout
+            read=timeout_s,  # Read timeout (for streaming)
+            write=30.0,  # Write timeout
+            pool=30.0,  # Pool timeout
+        )
 
+    async def _on_request(self, request: httpx.Request):
+        """httpx request hook: count requests and attach a connection trace."""
+        self._requests_sent += 1
+        request.extensions["trace"] = self._on_trace
+
+    async def _on_trace(self, event: str, info: dict):
+        """httpcore trace callback: a completed TCP connect means a new pooled connection."""
+        if event == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+
+    def get_stats(self) -> dict:
+        """Get connection reuse statistics (cumulative for this client)."""
+        reused = max(0, self._requests_sent - self._connections_opened)
+        return {
+            "requests": self._requests_sent,
+            "connections_opened": self._connections_opened,
+            "connections_reused": reused,
+            "reuse_rate": reused / self._requests_sent if self._requests_sent else 0.0,
+            "early_stops": self._early_stops,
+            "queue_delay_total_s": round(self._queue_delay_total, 3),
+            "queue_delay_max_s": round(self._queue_delay_max, 3),
+            "ttft_p50_s": self._percentile(self._ttft_samples, 0.5),
+            "ttft_p95_s": self._percentile(self._ttft_samples, 0.95),
+            "latency_p50_s": self._percentile(self._latency_samples, 0.5),
+            "latency_p95_s": self._percentile(self._latency_samples, 0.95),
+            "hedges_sent": self._hedges_sent,
+            "hedges_won": self._hedges_won,
+            "hedge_rate": self._hedges_sent / self._requests_sent if self._requests_sent else 0.0,
+            "response_cache": self._response_cache.get_stats() if self._response_cache else None,
+        }
+
+    @staticmethod
+    def _percentile(samples, q: float) -> Optional[float]:
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 3)
+
+    def _hedge_delay(self) -> float:
+        """Time to wait for the first token before hedging (p95 of recent TTFT)"""
+        if len(self._ttft_samples) < self.HEDGE_MIN_SAMPLES:
+            return self.HEDGE_DEFAULT_DELAY
+        return max(self.HEDGE_MIN_DELAY, self._percentile(self._ttft_samples, self.HEDGE_QUANTILE))
+
+    async def close(self):
+        """Close the shared client and release pooled connections."""
+        http_client = self._http_client
+        self._client = None
+        self._hedge_client = None
+        self._http_client = None
+        if http_client is not None:
+            await http_client.aclose()
+
+    @traced("llm.chat")
     async def chat(
         self,
         system: str,
@@ -69,6 +229,8 @@ class LLMClient:
         temperature: float = 0.7,
         seed: Optional[int] = None,
         timeout_s: int = None,
+        messages: Optional[List[dict]] = None,
+        early_stop: Optional[Any] = None,
     ) -> Tuple[str, Optional[dict]]:
         """
         Make a chat completion request.
@@ -80,6 +242,11 @@ class LLMClient:
             temperature: Sampling temperature
             seed: Random seed for reproducibility
             timeout_s: Request timeout in seconds (default: use client default)
+            messages: Full message list for multi-turn requests (overrides system/user)
+            early_stop: Optional stream watcher with reset() and feed(delta) -> bool
+                (e.g. StreamingActionParser). When feed() returns True the stream
+                is closed, the partial text is returned and usage is estimated
+                (marked "estimated": True) if the server hadn't sent it yet.
 
         Returns:
             Tuple of (response content, usage dict or None)
@@ -88,14 +255,46 @@ class LLMClient:
         actual_timeout = timeout_s if timeout_s is not None else self._default_timeout
 
         # Build messages
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": user})
-
-        # Retry loop with exponential backoff
+        if messages is None:
+            messages = []
+            if system:
+                messages.append({"role": "system", "content": system})
+            messages.append({"role": "user", "content": user})
+
+        cache_key = None
+        if self._response_cache is not None and self._response_cache.applies_to(temperature):
+            cache_key = self._response_cache.make_key(self._base_url, model, messages, temperature, seed)
+            cached = self._response_cache.get(cache_key) if self._response_cache.reads else None
+            if cached is not None:
+                content, usage = cached
+                set_attribute("cached", True)
+                LLM_REQUESTS.inc(model=model, outcome="cached")
+                if early_stop is not None:
+                    # Replay the stream watcher so callers see the same state as a live call
+                    early_stop.reset()
+                    early_stop.feed(content)
+                return content, dict(usage, cached=True) if usage else usage
+            if self._response_cache.mode == "replay":
+                from .llm_cache import LLMCacheMissError
+                raise LLMCacheMissError(f"No cached response for request {cache_key[:12]} (replay mode)")
+
+        # Process-wide limiter for this endpoint/model, shared by every caller
+        # (agent loop and LLM validation alike)
+        limiter = get_llm_limiter(self._base_url, model)
+        est_tokens = self._estimate_prompt_tokens(messages)
+
+        # Retry loop: rate limits are paced by the shared limiter (AIMD +
+        # Retry-After), other recoverable errors back off per call
         last_error = None
         for attempt in range(self.MAX_RETRIES):
+            with span("llm.queue", attempt=attempt):
+                ticket = await limiter.acquire(est_tokens)
+            self._queue_delay_total += ticket.queue_delay
+            self._queue_delay_max = max(self._queue_delay_max, ticket.queue_delay)
+
+            outcome = "error"
+            retry_after = None
+            tokens_used = None
             try:
                 # Wrap in total timeout to prevent runaway requests
                 content, usage = await asyncio.wait_for(
@@ -105,21 +304,25 @@ class LLMClient:
                         temperature=temperature,
                         seed=seed,
                         timeout_s=actual_timeout,
+                        early_stop=early_stop,
                     ),
                     timeout=actual_timeout,
                 )
+                outcome = "ok"
+                tokens_used = (usage or {}).get("total_tokens")
+                if cache_key is not None and self._response_cache.writes:
+                    self._response_cache.put(cache_key, model, content, usage)
                 return content, usage
 
             except asyncio.TimeoutError:
                 last_error = TimeoutError(f"LLM request timed out after {actual_timeout}s")
                 log("LLM", f"Total timeout ({actual_timeout}s) exceeded, attempt {attempt + 1}/{self.MAX_RETRIES}")
-                await self._backoff(attempt)
-                continue
 
             except openai.RateLimitError as e:
                 last_error = e
+                outcome = "rate_limited"
+                retry_after = parse_retry_after(e.response.headers if e.response is not None else None)
                 log("LLM", f"Rate limit hit, attempt {attempt + 1}/{self.MAX_RETRIES}")
-                await self._backoff(attempt)
 
             except openai.BadRequestError as e:
                 # Check for token limit errors - these are unrecoverable
@@ -137,15 +340,16 @@ class LLMClient:
             except openai.APIStatusError as e:
                 if e.status_code in self.RETRY_STATUS_CODES:
                     last_error = e
+                    if e.status_code in self.OVERLOAD_STATUS_CODES:
+                        outcome = "rate_limited"
+                        retry_after = parse_retry_after(e.response.headers if e.response is not None else None)
                     log("LLM", f"API error {e.status_code}, attempt {attempt + 1}/{self.MAX_RETRIES}")
-                    await self._backoff(attempt)
                 else:
                     raise
 
             except (httpx.TimeoutException, httpx.ConnectError) as e:
                 last_error = e
                 log("LLM", f"Connection error, attempt {attempt + 1}/{self.MAX_RETRIES}: {e}")
-                await self._backoff(attempt)
 
             except Exception as e:
                 # Check for token limit in generic exceptions too
@@ -159,6 +363,12 @@ class LLMClient:
                     )
                 last_error = e
                 log("LLM", f"Error, attempt {attempt + 1}/{self.MAX_RETRIES}: {e}")
+
+            finally:
+                limiter.release(ticket, outcome, retry_after=retry_after, tokens_used=tokens_used)
+                LLM_REQUESTS.inc(model=model, outcome=outcome)
+
+            if outcome != "rate_limited":
                 await self._backoff(attempt)
 
         # All retries exhausted
@@ -171,47 +381,151 @@ class LLMClient:
         temperature: float,
         seed: Optional[int],
         timeout_s: int,
+        early_stop: Optional[Any] = None,
     ) -> Tuple[str, Optional[dict]]:
-        """Make a single API request with streaming"""
-        # Use longer timeouts for connection and read
-        timeout_config = httpx.Timeout(
-            connect=30.0,  # Connection timeout
-            read=timeout_s,  # Read timeout (for streaming)
-            write=30.0,  # Write timeout
-            pool=30.0,  # Pool timeout
-        )
+        """Make a single API request with streaming over the shared client (hedged if enabled)"""
+        # Build request parameters
+        params = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+            "timeout": self._timeout_config(timeout_s),
+        }
+
+        if seed is not None:
+            params["seed"] = seed
+
+        limiter = get_llm_limiter(self._base_url, model)
+        hedge_ticket = None
+        if self._hedge and not limiter.is_backing_off:
+            opened, hedge_ticket = await self._open_hedged(
+                params, limiter, self._estimate_prompt_tokens(messages)
+            )
+        else:
+            opened = await self._open_stream(self._get_client(), params)
+        self._ttft_samples.append(opened.ttft)
+        set_attribute("ttft_s", round(opened.ttft, 3))
+        LLM_TTFT_SECONDS.observe(opened.ttft, model=model)
 
-        client = openai.AsyncOpenAI(
-            base_url=self._base_url,
-            api_key=self._api_key,
-            timeout=timeout_config,
-            max_retries=0,  # We handle retries ourselves
-        )
+        try:
+            content, usage = await self._consume_stream(opened, messages, timeout_s, early_stop)
+        finally:
+            if hedge_ticket is not None:
+                # Winning hedge held its own slot; outcome is counted on the primary's ticket
+                limiter.release(hedge_ticket, "error")
+
+        generation_s = time.time() - opened.start_time - opened.ttft
+        completion_tokens = (usage or {}).get("completion_tokens")
+        if completion_tokens and generation_s > 0:
+            LLM_TOKENS_PER_SECOND.observe(completion_tokens / generation_s, model=model)
+        return content, usage
+
+    @traced("llm.first_token")
+    async def _open_stream(self, client: openai.AsyncOpenAI, params: dict) -> "_OpenedStream":
+        """Start a streaming request and wait for its first chunk"""
+        start_time = time.time()
+        stream = await client.chat.completions.create(**params)
+        try:
+            iterator = stream.__aiter__()
+            try:
+                first = await iterator.__anext__()
+            except StopAsyncIteration:
+                first = None
+        except BaseException:
+            await stream.close()
+            raise
+        return _OpenedStream(stream, iterator, first, start_time, time.time() - start_time)
+
+    async def _open_hedged(
+        self, params: dict, limiter: AdaptiveLimiter, est_tokens: int
+    ) -> Tuple["_OpenedStream", Optional[LimiterTicket]]:
+        """
+        Open the primary stream; if its first chunk is later than the hedge
+        delay, open a duplicate and keep whichever produces a chunk first.
 
+        The hedge only goes out if the shared limiter has a slot free right
+        now. Returns the opened stream and, when the hedge won, its limiter
+        ticket for the caller to release once the stream is consumed. The
+        reported TTFT is always measured from the primary's start.
+        """
+        start_time = time.time()
+        primary = asyncio.ensure_future(self._open_stream(self._get_client(), params))
+        tasks = {primary}
+        winner = None
+        hedge_ticket = None
         try:
-            # Build request parameters
-            params = {
-                "model": model,
-                "messages": messages,
-                "temperature": temperature,
-                "stream": True,
-                "stream_options": {"include_usage": True},
-            }
-
-            if seed is not None:
-                params["seed"] = seed
-
-            # Make streaming request
-            start_time = time.time()
-            stream = await client.chat.completions.create(**params)
-
-            # Collect streamed content and usage
-            content_parts = []
-            usage = None
-            chunk_count = 0
-            last_progress = 0
-
-            async for chunk in stream:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay())
+            if not done:
+                hedge_ticket = limiter.try_acquire(est_tokens)
+                if hedge_ticket is None:
+                    log("LLM", f"No first token after {self._hedge_delay():.1f}s, limiter full, not hedging")
+                else:
+                    self._hedges_sent += 1
+                    log("LLM", f"No first token after {self._hedge_delay():.1f}s, sending hedge request")
+                    hedge = asyncio.ensure_future(self._open_stream(self._get_hedge_client(), params))
+                    tasks.add(hedge)
+
+            # First successful opener wins; an error only counts once both are done
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        opened = winner.result()
+                        if winner is primary:
+                            return opened, None
+                        self._hedges_won += 1
+                        opened.ttft = opened.start_time + opened.ttft - start_time
+                        opened.start_time = start_time
+                        ticket, hedge_ticket = hedge_ticket, None
+                        return opened, ticket
+            # Both failed: surface the primary's error for retry classification
+            raise primary.exception()
+        finally:
+            if hedge_ticket is not None:
+                limiter.release(hedge_ticket, "error")
+            for task in tasks:
+                if task is winner:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled() and task.exception() is None:
+                    # Loser that also opened: drop its stream to abort generation
+                    await task.result().stream.close()
+
+    @traced("llm.stream")
+    async def _consume_stream(
+        self,
+        opened: "_OpenedStream",
+        messages: list,
+        timeout_s: int,
+        early_stop: Optional[Any] = None,
+    ) -> Tuple[str, Optional[dict]]:
+        """Read an opened stream to completion (or early stop) and return (content, usage)"""
+        stream = opened.stream
+        start_time = opened.start_time
+
+        # Collect streamed content and usage
+        content_parts = []
+        usage = None
+        chunk_count = 0
+        last_progress = 0
+        stopped_early = False
+        if early_stop is not None:
+            early_stop.reset()
+
+        async def chunks():
+            if opened.first is None:
+                return
+            yield opened.first
+            async for chunk in opened.iterator:
+                yield chunk
+
+        try:
+            async for chunk in chunks():
                 chunk_count += 1
 
                 # Safety limit on chunks
@@ -220,7 +534,12 @@ class LLMClient:
                     break
 
                 if chunk.choices and chunk.choices[0].delta.content:
-                    content_parts.append(chunk.choices[0].delta.content)
+                    delta = chunk.choices[0].delta.content
+                    content_parts.append(delta)
+                    if early_stop is not None and early_stop.feed(delta):
+                        # Closing the stream aborts generation server-side
+                        stopped_early = True
+                        break
                 if chunk.usage:
                     usage = chunk.usage.model_dump()
 
@@ -229,19 +548,43 @@ class LLMClient:
                 if is_verbose() and elapsed - last_progress >= 1.0:
                     last_progress = elapsed
                     progress("LLM", elapsed, timeout_s, f"chunks:{chunk_count}")
-
-            if is_verbose() and last_progress > 0:
-                progress_done("LLM", f"Done in {time.time()-start_time:.1f}s, {chunk_count} chunks")
-
-            content = "".join(content_parts)
-            if not content:
-                raise ValueError(f"LLM returned empty response after {chunk_count} chunks")
-
-            return content.strip(), usage
         finally:
-            # CRITICAL: Close the client to release HTTP connections
-            # Without this, connections accumulate and eventually exhaust the pool
-            await client.close()
+            # Release the connection back to the pool (or drop it if the
+            # stream was abandoned mid-way); the client itself stays open.
+            await stream.close()
+
+        self._latency_samples.append(time.time() - start_time)
+        if is_verbose() and last_progress > 0:
+            progress_done("LLM", f"Done in {time.time()-start_time:.1f}s, {chunk_count} chunks")
+
+        content = "".join(content_parts)
+        if not content:
+            raise ValueError(f"LLM returned empty response after {chunk_count} chunks")
+
+        if stopped_early:
+            self._early_stops += 1
+            log("LLM", f"Early stop after {chunk_count} chunks ({time.time()-start_time:.1f}s)")
+            if usage is None:
+                usage = self._estimate_usage(messages, content)
+
+        return content.strip(), usage
+
+    @staticmethod
+    def _estimate_prompt_tokens(messages: list) -> int:
+        """Rough prompt size (~4 chars/token)"""
+        return sum(len(m.get("content") or "") for m in messages) // 4
+
+    @classmethod
+    def _estimate_usage(cls, messages: list, content: str) -> dict:
+        """Rough usage (~4 chars/token) for streams cancelled before the usage chunk"""
+        prompt_tokens = cls._estimate_prompt_tokens(messages)
+        completion_tokens = len(content) // 4
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "estimated": True,
+        }
 
     async def _backoff(self, attempt: int):
         """Exponential backoff with jitter"""
@@ -250,3 +593,15 @@ class LLMClient:
             self.MAX_DELAY
         )
         await asyncio.sleep(delay)
+
+
+class _OpenedStream:
+    """A streaming response whose first chunk has already been received"""
+    __slots__ = ("stream", "iterator", "first", "start_time", "ttft")
+
+    def __init__(self, stream, iterator, first, start_time: float, ttft: float):
+        self.stream = stream
+        self.iterator = iterator
+        self.first = first
+        self.start_time = start_time
+        self.ttft = ttft
@@ -0,0 +1,302 @@
+"""
+Process-wide metrics in Prometheus text format.
+
+Per-episode stats (InterceptorStats, GTCollector.get_stats, LLMClient.get_stats)
+end up inside individual results; the metrics here aggregate across all
+episodes of the process so a long-running server can be scraped.
+
+Usage:
+    from liveweb_arena.utils.metrics import CACHE_REQUESTS, render_prometheus
+
+    CACHE_REQUESTS.inc(domain="www.coingecko.com", result="hit")
+    body = render_prometheus()     # serve with CONTENT_TYPE at /metrics
+
+Metric types follow Prometheus semantics: Counter (monotonic), Gauge
+(up/down) and Histogram (cumulative buckets + _sum/_count). Labels are
+passed as keyword arguments and must match the declared label names.
+"""
+
+import math
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds: sub-10ms cache hits up to multi-minute LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+TOKENS_PER_SECOND_BUCKETS = (1, 5, 10, 20, 35, 50, 75, 100, 150, 250, 500, 1000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{_escape(extra[1])}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Base class: name, help text, label names and a lock"""
+
+    type_name = ""
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {_escape(self.help)}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Value that can go up and down"""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        if not self.labelnames:
+            self._values[()] = 0.0
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Distribution over fixed buckets (cumulative on export)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> ([count per bucket..., +Inf], sum)
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def get_count(self, **labels) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+            return sum(entry[0]) if entry else 0
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, key, ("le", _format_value(bound)))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics (get-or-create by name)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, *args, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    """Prometheus text exposition of a registry (default: process-wide)"""
+    return (registry or REGISTRY).render()
+
+
+# ---- Arena metrics ----
+
+EPISODES_IN_FLIGHT = REGISTRY.gauge(
+    "liveweb_episodes_in_flight", "Evaluations currently running (past the concurrency semaphore)",
+)
+EPISODES = REGISTRY.counter(
+    "liveweb_episodes_total", "Finished evaluations by status (success, failure, error)", ("status",),
+)
+EPISODE_SECONDS = REGISTRY.histogram(
+    "liveweb_episode_duration_seconds", "Wall time of evaluate() calls",
+    buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600),
+)
+
+CACHE_REQUESTS = REGISTRY.counter(
+    "liveweb_cache_requests_total", "Document requests seen by the cache interceptor", ("domain", "result"),
+)
+CACHE_PREFETCH_SECONDS = REGISTRY.histogram(
+    "liveweb_cache_prefetch_seconds", "Pre-fetch latency for interceptor cache misses", ("domain",),
+)
+CACHE_FATAL_ERRORS = REGISTRY.counter(
+    "liveweb_cache_fatal_errors_total", "CacheFatalError occurrences (page or API fetch failed)", ("domain",),
+)
+
+PLUGIN_HTTP_REQUESTS = REGISTRY.counter(
+    "liveweb_plugin_http_requests_total", "Plugin API requests sent through the shared HTTP sessions", ("host",),
+)
+PLUGIN_HTTP_CONNECTIONS = REGISTRY.counter(
+    "liveweb_plugin_http_connections_total", "New TCP connections opened for plugin API requests", ("host",),
+)
+PLUGIN_RATE_LIMIT_WAIT_SECONDS = REGISTRY.histogram(
+    "liveweb_plugin_rate_limit_wait_seconds", "Time plugin API requests waited for their host's rate limiter",
+    ("host",), buckets=(0.0, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60),
+)
+PLUGIN_API_CACHE_REQUESTS = REGISTRY.counter(
+    "liveweb_plugin_api_cache_requests_total", "Plugin API response cache lookups by result (hits, misses, joined)",
+    ("source", "result"),
+)
+PLUGIN_CIRCUIT_STATE = REGISTRY.gauge(
+    "liveweb_plugin_circuit_state", "Plugin API circuit breaker state (0 closed, 1 half-open, 2 open)", ("source",),
+)
+PLUGIN_CIRCUIT_REJECTED = REGISTRY.counter(
+    "liveweb_plugin_circuit_rejected_total", "Plugin API requests failed fast by an open circuit breaker", ("source",),
+)
+
+BROWSER_CONTEXTS_OPEN = REGISTRY.gauge(
+    "liveweb_browser_contexts_open", "Open browser sessions (context + page)",
+)
+
+LLM_REQUESTS = REGISTRY.counter(
+    "liveweb_llm_requests_total", "LLM request attempts by outcome (ok, rate_limited, error, cached)",
+    ("model", "outcome"),
+)
+LLM_TTFT_SECONDS = REGISTRY.histogram(
+    "liveweb_llm_ttft_seconds", "Time to first streamed chunk", ("model",),
+)
+LLM_TOKENS_PER_SECOND = REGISTRY.histogram(
+    "liveweb_llm_tokens_per_second", "Completion tokens per second after the first chunk", ("model",),
+    buckets=TOKENS_PER_SECOND_BUCKETS,
+)
+
+VALIDATION_SECONDS = REGISTRY.histogram(
+    "liveweb_validation_seconds", "Answer validation latency per episode",
+)
+VALIDATIONS = REGISTRY.counter(
+    "liveweb_validations_total", "Validated answers by path (fast, llm)", ("validated_by",),
+)
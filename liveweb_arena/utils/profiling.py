@@ -0,0 +1,177 @@
+"""
+On-demand per-episode profiling.
+
+An EpisodeProfiler accumulates profile data over one or more segments of an
+episode (the whole of evaluate(), or reset() plus every step() of an OpenEnv
+episode) and writes it to disk when the episode ends.
+
+Profilers:
+- pyinstrument (preferred, optional dependency): statistical sampler with
+  async_mode="enabled", so time spent awaiting is attributed to the awaiting
+  coroutine of this episode instead of to the event loop
+- cProfile (stdlib fallback): deterministic, records every coroutine step run
+  on the thread while the segment is active
+
+Only one profiler can be active per process at a time (both hook the
+interpreter's profiling callback). A segment that starts while another
+episode is being profiled is skipped and counted in skipped_segments.
+
+Usage:
+    profiler = EpisodeProfiler("episode-123", directory="/tmp/profiles")
+    with profiler.running():
+        await run_episode()
+    info = profiler.save()   # {"profiler", "path", "segments", ...}
+
+Environment:
+    LIVEWEB_PROFILE       1/true = profile every episode; 0 < x < 1 = sampled fraction
+    LIVEWEB_PROFILE_DIR   output directory (default: ./profiles)
+    LIVEWEB_PROFILER      pyinstrument or cprofile (default: pyinstrument if installed)
+"""
+
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from liveweb_arena.utils.logger import log
+
+DEFAULT_PROFILE_DIR = "profiles"
+
+# pyinstrument sampling interval (seconds)
+SAMPLE_INTERVAL = 0.001
+
+_TRUE_VALUES = {"1", "true", "yes", "on", "all"}
+_FALSE_VALUES = {"", "0", "false", "no", "off"}
+
+# Held while any profiler segment is running (see module docstring)
+_ACTIVE = threading.Lock()
+
+
+def parse_sample_rate(value) -> float:
+    """Fraction of episodes to profile from a parameter or LIVEWEB_PROFILE value"""
+    if value is None:
+        return 0.0
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return 1.0
+    if text in _FALSE_VALUES:
+        return 0.0
+    try:
+        return min(1.0, max(0.0, float(text)))
+    except ValueError:
+        log("Profile", f"Ignoring invalid profile sample rate {value!r}")
+        return 0.0
+
+
+def should_profile(sample_rate: float) -> bool:
+    """Sampling decision for one episode"""
+    return sample_rate >= 1.0 or (sample_rate > 0.0 and random.random() < sample_rate)
+
+
+def _resolve_profiler(name: Optional[str]) -> str:
+    name = (name or os.environ.get("LIVEWEB_PROFILER", "")).strip().lower()
+    if name in ("", "pyinstrument"):
+        try:
+            import pyinstrument  # noqa: F401
+            return "pyinstrument"
+        except ImportError:
+            if name:
+                log("Profile", "pyinstrument not installed, falling back to cProfile")
+    return "cprofile"
+
+
+class EpisodeProfiler:
+    """Profile data for one episode, collected over one or more segments"""
+
+    def __init__(self, name: str, directory: Optional[str] = None, profiler: Optional[str] = None):
+        """
+        Args:
+            name: File stem for the saved profile
+            directory: Output directory (default: LIVEWEB_PROFILE_DIR or ./profiles)
+            profiler: "pyinstrument" or "cprofile" (default: LIVEWEB_PROFILER / auto)
+        """
+        self.name = name
+        self.directory = Path(directory or os.environ.get("LIVEWEB_PROFILE_DIR") or DEFAULT_PROFILE_DIR)
+        self.kind = _resolve_profiler(profiler)
+        self.segments = 0
+        self.skipped_segments = 0
+        self.profiled_s = 0.0
+        self._profiler = None
+
+    def _start(self):
+        if self._profiler is None:
+            if self.kind == "pyinstrument":
+                from pyinstrument import Profiler
+                self._profiler = Profiler(interval=SAMPLE_INTERVAL, async_mode="enabled")
+            else:
+                import cProfile
+                self._profiler = cProfile.Profile()
+        if self.kind == "pyinstrument":
+            self._profiler.start()
+        else:
+            self._profiler.enable()
+
+    def _stop(self):
+        if self.kind == "pyinstrument":
+            self._profiler.stop()
+        else:
+            self._profiler.disable()
+
+    @contextmanager
+    def running(self):
+        """Profile the enclosed block (skipped if another profile is running)"""
+        if not _ACTIVE.acquire(blocking=False):
+            self.skipped_segments += 1
+            yield False
+            return
+        try:
+            self._start()
+            start = time.perf_counter()
+            try:
+                yield True
+            finally:
+                self._stop()
+                self.profiled_s += time.perf_counter() - start
+                self.segments += 1
+        finally:
+            _ACTIVE.release()
+
+    def save(self) -> Optional[dict]:
+        """
+        Write the profile to <directory>/<name>.(html|prof).
+
+        pyinstrument profiles are written as HTML plus a .pyisession file
+        (`pyinstrument --load <file>`); cProfile profiles as pstats data
+        (`python -m pstats <file>`, snakeviz, ...).
+
+        Returns:
+            Profile info for result JSON, or None if nothing was recorded
+        """
+        if self._profiler is None:
+            return None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stem = re.sub(r"[^\w.-]+", "_", self.name)
+        if self.kind == "pyinstrument":
+            path = self.directory / f"{stem}.html"
+            path.write_text(self._profiler.output_html(), encoding="utf-8")
+            session = self._profiler.last_session
+            if session is not None:
+                session.save(str(self.directory / f"{stem}.pyisession"))
+        else:
+            path = self.directory / f"{stem}.prof"
+            self._profiler.dump_stats(str(path))
+
+        return {
+            "profiler": self.kind,
+            "path": str(path),
+            "segments": self.segments,
+            "skipped_segments": self.skipped_segments,
+            "profiled_s": round(self.profiled_s, 3),
+        }
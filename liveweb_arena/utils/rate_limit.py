@@ -0,0 +1,354 @@
+"""Client-side rate limiting shared across all episodes in a process.
+
+TokenBucket is a reservation-based bucket: callers take what they need
+(the balance may go negative) and are told how long to wait, so no lock is
+held while sleeping.
+
+AdaptiveLimiter gates one LLM endpoint (base_url + model):
+- AIMD concurrency: +1/limit per success, halved on 429/503. Only requests
+  started after the last decrease can trigger another one, so a burst of
+  simultaneous 429s counts once (like TCP's once-per-window back-off)
+- Token buckets on requests/minute and tokens/minute (optional)
+- Retry-After (or an escalating shared pause) blocks all callers at once,
+  instead of every episode backing off and retrying on its own schedule
+
+Limiters are process-wide (get_llm_limiter) and safe to use from several
+event loops. Configuration via environment:
+    LIVEWEB_LLM_MAX_CONCURRENCY   upper bound on in-flight requests (default 64)
+    LIVEWEB_LLM_RPM               requests per minute (default: unlimited)
+    LIVEWEB_LLM_TPM               tokens per minute (default: unlimited)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+from .logger import log
+
+
+class TokenBucket:
+    """Reservation-based token bucket (thread-safe, never blocks)"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Burst size (default: one second worth of tokens, min 1)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take amount tokens now; return seconds to wait before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def try_take(self, amount: float = 1.0) -> bool:
+        """Take amount tokens only if they are available right now"""
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < amount:
+                return False
+            self._tokens -= amount
+            return True
+
+    def adjust(self, amount: float):
+        """Consume (positive) or refund (negative) tokens after the fact"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+
+class LimiterTicket:
+    """Handle for one admitted request (pass back to AdaptiveLimiter.release)"""
+    __slots__ = ("acquired_at", "queue_delay", "tokens_reserved")
+
+    def __init__(self, acquired_at: float, queue_delay: float, tokens_reserved: int):
+        self.acquired_at = acquired_at
+        self.queue_delay = queue_delay
+        self.tokens_reserved = tokens_reserved
+
+
+class _Waiter:
+    __slots__ = ("loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.granted = False
+
+
+def _wake(future: asyncio.Future):
+    if not future.done():
+        future.set_result(True)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency + token buckets + shared Retry-After for one endpoint.
+
+    Usage:
+        ticket = await limiter.acquire(estimated_tokens)
+        try:
+            ...request...
+        finally:
+            limiter.release(ticket, "ok" | "rate_limited" | "error", retry_after, ...)
+    """
+
+    # Shared pause after a 429 without Retry-After: BASE * 2^n, capped
+    BASE_PENALTY = 1.0
+    MAX_PENALTY = 30.0
+
+    def __init__(
+        self,
+        key: str,
+        max_concurrency: int = 64,
+        rpm: Optional[float] = None,
+        tpm: Optional[float] = None,
+    ):
+        self.key = key
+        self.max_concurrency = max(1, max_concurrency)
+        self._limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self._waiters: deque = deque()
+        self._lock = threading.Lock()
+
+        self._request_bucket = TokenBucket(rpm / 60.0, capacity=max(1.0, rpm / 60.0)) if rpm else None
+        self._token_bucket = TokenBucket(tpm / 60.0, capacity=tpm / 6.0) if tpm else None
+
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._consecutive_limited = 0
+
+        # Metrics
+        self._requests = 0
+        self._rate_limited = 0
+        self._queue_delay_total = 0.0
+        self._queue_delay_max = 0.0
+
+    @property
+    def limit(self) -> int:
+        return max(1, int(self._limit))
+
+    @property
+    def is_backing_off(self) -> bool:
+        """True while a shared pause (429 / Retry-After) is active"""
+        return time.monotonic() < self._blocked_until
+
+    async def _wait_unblocked(self):
+        while True:
+            wait = self._blocked_until - time.monotonic()
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def acquire(self, tokens: int = 0) -> LimiterTicket:
+        """Wait for a shared pause, a concurrency slot and rate budget."""
+        start = time.monotonic()
+        await self._wait_unblocked()
+        await self._acquire_slot()
+
+        try:
+            # A new pause may have started while queued for the slot
+            await self._wait_unblocked()
+
+            wait = 0.0
+            if self._request_bucket:
+                wait = max(wait, self._request_bucket.reserve(1))
+            if self._token_bucket and tokens:
+                wait = max(wait, self._token_bucket.reserve(tokens))
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._release_slot()
+            raise
+
+        now = time.monotonic()
+        delay = now - start
+        with self._lock:
+            self._requests += 1
+            self._queue_delay_total += delay
+            self._queue_delay_max = max(self._queue_delay_max, delay)
+        return LimiterTicket(acquired_at=now, queue_delay=delay, tokens_reserved=tokens)
+
+    def try_acquire(self, tokens: int = 0) -> Optional[LimiterTicket]:
+        """Take a slot and rate budget without waiting; None if any is unavailable"""
+        if self.is_backing_off:
+            return None
+        with self._lock:
+            if self._waiters or self._in_flight >= self.limit:
+                return None
+            self._in_flight += 1
+
+        if self._request_bucket and not self._request_bucket.try_take(1):
+            self._release_slot()
+            return None
+        if self._token_bucket and tokens and not self._token_bucket.try_take(tokens):
+            if self._request_bucket:
+                self._request_bucket.adjust(-1)
+            self._release_slot()
+            return None
+
+        with self._lock:
+            self._requests += 1
+        return LimiterTicket(acquired_at=time.monotonic(), queue_delay=0.0, tokens_reserved=tokens)
+
+    def release(
+        self,
+        ticket: LimiterTicket,
+        outcome: str = "ok",
+        retry_after: Optional[float] = None,
+        tokens_used: Optional[int] = None,
+    ):
+        """
+        Return the slot and feed the outcome back into the controller.
+
+        Args:
+            ticket: Ticket returned by acquire()
+            outcome: "ok", "rate_limited" (429/503) or "error" (no AIMD change)
+            retry_after: Server-provided Retry-After in seconds
+            tokens_used: Actual tokens used (corrects the token bucket)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if outcome == "ok":
+                self._limit = min(self.max_concurrency, self._limit + 1.0 / self._limit)
+                self._consecutive_limited = 0
+            elif outcome == "rate_limited":
+                self._rate_limited += 1
+                if ticket.acquired_at >= self._last_decrease:
+                    self._limit = max(1.0, self._limit / 2)
+                    self._last_decrease = now
+                    log("LLM", f"Rate limited on {self.key}: concurrency -> {self.limit}")
+                pause = retry_after if retry_after is not None else min(
+                    self.MAX_PENALTY, self.BASE_PENALTY * (2 ** self._consecutive_limited)
+                )
+                self._consecutive_limited += 1
+                self._blocked_until = max(self._blocked_until, now + pause)
+
+        if self._token_bucket and tokens_used is not None:
+            self._token_bucket.adjust(tokens_used - ticket.tokens_reserved)
+
+        self._release_slot()
+
+    async def _acquire_slot(self):
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self._in_flight < self.limit:
+                self._in_flight += 1
+                return
+            waiter = _Waiter(loop)
+            self._waiters.append(waiter)
+
+        try:
+            await waiter.future
+        except BaseException:
+            with self._lock:
+                if not waiter.granted:
+                    self._waiters.remove(waiter)
+                    return_slot = False
+                else:
+                    return_slot = True
+            if return_slot:
+                self._release_slot()
+            raise
+
+    def _release_slot(self):
+        with self._lock:
+            self._in_flight -= 1
+            while self._waiters and self._in_flight < self.limit:
+                waiter = self._waiters.popleft()
+                waiter.granted = True
+                self._in_flight += 1
+                try:
+                    waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+                except RuntimeError:
+                    # Waiter's loop is closed; give the slot to the next one
+                    self._in_flight -= 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                "concurrency_limit": self.limit,
+                "in_flight": self._in_flight,
+                "queued": len(self._waiters),
+                "requests": self._requests,
+                "rate_limited": self._rate_limited,
+                "queue_delay_total_s": round(self._queue_delay_total, 3),
+                "queue_delay_avg_s": round(self._queue_delay_total / self._requests, 3) if self._requests else 0.0,
+                "queue_delay_max_s": round(self._queue_delay_max, 3),
+            }
+
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Parse Retry-After / retry-after-ms response headers into seconds"""
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return max(0.0, float(value) / 1000.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.environ.get(name)
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+_limiters: Dict[Tuple[str, str], AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_llm_limiter(base_url: str, model: str) -> AdaptiveLimiter:
+    """Get the process-wide limiter for an endpoint/model pair"""
+    key = (base_url.rstrip("/"), model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveLimiter(
+                key=f"{key[0]} [{model}]",
+                max_concurrency=int(_env_float("LIVEWEB_LLM_MAX_CONCURRENCY") or 64),
+                rpm=_env_float("LIVEWEB_LLM_RPM"),
+                tpm=_env_float("LIVEWEB_LLM_TPM"),
+            )
+            _limiters[key] = limiter
+        return limiter
+
+
+def get_limiter_stats() -> Dict[str, dict]:
+    """Stats for every LLM limiter created in this process"""
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.key: limiter.get_stats() for limiter in limiters}
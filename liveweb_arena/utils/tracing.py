@@ -0,0 +1,319 @@
+"""
+Lightweight per-episode latency tracing.
+
+Spans nest through a contextvar, so they follow asyncio tasks (a task
+created inside a span starts with that span as parent) and sync code alike.
+Outside a trace, span() is a no-op and costs one contextvar lookup.
+
+Usage:
+    with start_trace("episode", seed=seed) as root:
+        with span("task_generation"):
+            ...
+
+    @traced("llm.chat")
+    async def chat(...):
+        set_attribute("model", model)
+
+    result["extra"]["trace"] = root.to_dict()
+    export_trace(root, "/tmp/traces")   # OpenTelemetry (OTLP/JSON) file
+
+Callbacks that run outside the episode's context (e.g. Playwright route
+handlers) capture current_span() up front and pass it as parent=.
+
+Environment:
+    LIVEWEB_TRACE_DIR   write one OTLP/JSON file per episode to this directory
+"""
+
+import contextvars
+import functools
+import inspect
+import json
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Hard cap per trace; later spans are counted but not recorded
+MAX_SPANS_PER_TRACE = 5000
+
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar(
+    "_current_span", default=None
+)
+
+
+class Span:
+    """One timed operation in a trace tree"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent", "attributes", "children",
+        "start_ns", "_start_perf", "duration_ns", "error", "_root",
+        "_span_count", "_dropped",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"] = None, attributes: Optional[dict] = None):
+        self.name = name
+        self.parent = parent
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.attributes: Dict[str, Any] = dict(attributes) if attributes else {}
+        self.children: List["Span"] = []
+        self.start_ns = time.time_ns()
+        self._start_perf = time.perf_counter_ns()
+        self.duration_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        self._root = parent._root if parent else self
+        # Only meaningful on the root span
+        self._span_count = 1
+        self._dropped = 0
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    @property
+    def finished(self) -> bool:
+        return self.duration_ns is not None
+
+    @property
+    def end_ns(self) -> int:
+        return self.start_ns + self._elapsed_ns()
+
+    @property
+    def duration_ms(self) -> float:
+        return self._elapsed_ns() / 1e6
+
+    def _elapsed_ns(self) -> int:
+        if self.duration_ns is not None:
+            return self.duration_ns
+        return time.perf_counter_ns() - self._start_perf
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def end(self):
+        if self.duration_ns is None:
+            self.duration_ns = time.perf_counter_ns() - self._start_perf
+
+    def to_dict(self) -> dict:
+        """Nested span tree; start_ms is relative to the trace root"""
+        root_start = self._root.start_ns
+        result = self._to_dict(root_start)
+        if self is self._root:
+            result["trace_id"] = self.trace_id
+            result["span_count"] = self._span_count
+            if self._dropped:
+                result["dropped_spans"] = self._dropped
+        return result
+
+    def _to_dict(self, root_start: int) -> dict:
+        data = {
+            "name": self.name,
+            "start_ms": round((self.start_ns - root_start) / 1e6, 3),
+            "duration_ms": round(self.duration_ms, 3),
+        }
+        if self.attributes:
+            data["attributes"] = dict(self.attributes)
+        if self.error:
+            data["error"] = self.error
+        if not self.finished:
+            data["unfinished"] = True
+        if self.children:
+            data["children"] = [
+                child._to_dict(root_start)
+                for child in sorted(list(self.children), key=lambda s: s.start_ns)
+            ]
+        return data
+
+    def iter_spans(self) -> Iterator["Span"]:
+        """This span and all descendants, depth-first"""
+        yield self
+        for child in list(self.children):
+            yield from child.iter_spans()
+
+
+class _NoopSpan:
+    """Returned when no trace is active (or the trace is full)"""
+
+    is_recording = False
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def current_span() -> Optional[Span]:
+    """Innermost active span, or None outside a trace"""
+    return _current_span.get()
+
+
+def set_attribute(key: str, value: Any):
+    """Set an attribute on the current span (no-op outside a trace)"""
+    active = _current_span.get()
+    if active is not None:
+        active.set_attribute(key, value)
+
+
+@contextmanager
+def _activate(active: Span):
+    token = _current_span.set(active)
+    try:
+        yield active
+    except BaseException as e:
+        active.error = f"{type(e).__name__}: {e}"[:200]
+        raise
+    finally:
+        active.end()
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # Exited from a different context than it was entered in
+            _current_span.set(active.parent)
+
+
+@contextmanager
+def start_trace(name: str, **attributes):
+    """Start a new trace; the yielded root span collects everything inside"""
+    with _activate(Span(name, attributes=attributes)) as root:
+        yield root
+
+
+@contextmanager
+def span(name: str, parent: Optional[Span] = None, **attributes):
+    """
+    Time a block as a child of the current span (or of parent=).
+
+    Yields the span (or a no-op stand-in outside a trace) so callers can
+    set_attribute() on it.
+    """
+    parent = parent if parent is not None else _current_span.get()
+    if parent is None:
+        yield _NOOP_SPAN
+        return
+
+    root = parent._root
+    if root._span_count >= MAX_SPANS_PER_TRACE:
+        root._dropped += 1
+        yield _NOOP_SPAN
+        return
+    root._span_count += 1
+
+    child = Span(name, parent=parent, attributes=attributes)
+    parent.children.append(child)
+    with _activate(child):
+        yield child
+
+
+def traced(name: Optional[str] = None):
+    """Decorator: run a function (sync or async) inside span(name)"""
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def summarize(root: Span) -> Dict[str, dict]:
+    """Per-name totals: {name: {count, total_ms, max_ms}}, slowest first"""
+    totals: Dict[str, dict] = {}
+    for item in root.iter_spans():
+        if item is root:
+            continue
+        entry = totals.setdefault(item.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        duration = item.duration_ms
+        entry["count"] += 1
+        entry["total_ms"] += duration
+        entry["max_ms"] = max(entry["max_ms"], duration)
+    for entry in totals.values():
+        entry["total_ms"] = round(entry["total_ms"], 3)
+        entry["max_ms"] = round(entry["max_ms"], 3)
+    return dict(sorted(totals.items(), key=lambda kv: kv[1]["total_ms"], reverse=True))
+
+
+# ---- OpenTelemetry export ----
+
+def _otel_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otel(root: Span, service_name: str = "liveweb-arena") -> dict:
+    """Convert a trace to OTLP/JSON (as accepted by OTel collectors' JSON receivers)"""
+    spans = []
+    for item in root.iter_spans():
+        otel_span = {
+            "traceId": item.trace_id,
+            "spanId": item.span_id,
+            "name": item.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(item.start_ns),
+            "endTimeUnixNano": str(item.end_ns),
+            "attributes": [
+                {"key": key, "value": _otel_value(value)}
+                for key, value in item.attributes.items()
+            ],
+            # STATUS_CODE_UNSET / STATUS_CODE_ERROR
+            "status": {"code": 2, "message": item.error} if item.error else {"code": 0},
+        }
+        if item.parent is not None:
+            otel_span["parentSpanId"] = item.parent.span_id
+        spans.append(otel_span)
+
+    return {
+        "resourceSpans": [{
+            "resource": {
+                "attributes": [{"key": "service.name", "value": {"stringValue": service_name}}],
+            },
+            "scopeSpans": [{
+                "scope": {"name": "liveweb_arena"},
+                "spans": spans,
+            }],
+        }],
+    }
+
+
+def export_trace(root: Span, directory: Optional[str] = None) -> Optional[Path]:
+    """
+    Write a trace as OTLP/JSON to <directory>/<trace_id>.json.
+
+    Args:
+        root: Root span from start_trace()
+        directory: Output directory (default: LIVEWEB_TRACE_DIR; None = skip)
+
+    Returns:
+        Path written, or None if no directory is configured
+    """
+    directory = directory or os.environ.get("LIVEWEB_TRACE_DIR")
+    if not directory:
+        return None
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    out = path / f"{root.trace_id}.json"
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(to_otel(root), f)
+    return out
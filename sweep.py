@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+LiveWeb Arena - Multi-Process Sweep Runner
+
+Runs a large list of task IDs across N worker processes. Each worker owns its
+own Actor (and therefore its own BrowserEngine and LLM client) while all
+workers share the same on-disk cache directory; the CacheManager's per-URL
+flock coordination keeps concurrent cache fills safe.
+
+Scheduling:
+- Task IDs are sharded round-robin across workers up front
+- Workers pull work from the coordinator one episode at a time
+- When a worker's shard is empty it steals from the tail of the largest
+  remaining shard, so a few slow episodes never stall the sweep
+- Tasks assigned to a worker that dies are requeued to a survivor that is
+  still asking for work; tasks nobody can run are reported as failed
+
+Usage:
+    python sweep.py --task-ids 1-200 --workers 8 --model "zai-org/GLM-4.7"
+
+    # Explicit IDs, 2 concurrent episodes per worker
+    python sweep.py --task-ids 50001 50002 50003 --workers 2 --concurrency 2
+
+Environment:
+    Same as eval.py (.env is loaded on startup).
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import os
+import queue
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+# Seconds to wait on the result queue, and between worker liveness checks
+_POLL_INTERVAL = 1.0
+
+# Message kinds sent from workers to the coordinator
+_MSG_READY = "ready"
+_MSG_RESULT = "result"
+_MSG_EXIT = "exit"
+
+
+@dataclass
+class SweepStats:
+    """Aggregate statistics for a sweep run."""
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    stolen: int = 0
+    requeued: int = 0
+    started_at: float = field(default_factory=time.time)
+    per_worker: Dict[int, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        elapsed = time.time() - self.started_at
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "stolen": self.stolen,
+            "requeued": self.requeued,
+            "elapsed_seconds": elapsed,
+            "episodes_per_second": self.completed / elapsed if elapsed > 0 else 0.0,
+            "per_worker": dict(self.per_worker),
+        }
+
+
+def _worker_main(
+    worker_id: int,
+    task_queue: "mp.Queue",
+    result_queue: "mp.Queue",
+    actor_kwargs: Dict[str, Any],
+    evaluate_kwargs: Dict[str, Any],
+    concurrency: int,
+):
+    """Worker process entry point: one Actor, `concurrency` episode slots."""
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    from env import Actor
+    from liveweb_arena.utils.logger import set_verbose
+
+    set_verbose(bool(actor_kwargs.pop("verbose", False)))
+
+    async def run():
+        actor = Actor(**actor_kwargs)
+        loop = asyncio.get_running_loop()
+
+        async def slot():
+            while True:
+                result_queue.put((_MSG_READY, worker_id, None, None))
+                task_id = await loop.run_in_executor(None, task_queue.get)
+                if task_id is None:
+                    return
+                try:
+                    result = await actor.evaluate(
+                        task_id=task_id,
+                        max_concurrency=concurrency,
+                        **evaluate_kwargs,
+                    )
+                except Exception as e:
+                    # evaluate() already converts episode errors into results;
+                    # anything reaching here is a harness bug worth surfacing.
+                    result = {"score": 0.0, "success": False, "error": f"{type(e).__name__}: {e}"}
+                result_queue.put((_MSG_RESULT, worker_id, task_id, result))
+
+        try:
+            await asyncio.gather(*[slot() for _ in range(concurrency)])
+        finally:
+            await actor.shutdown()
+
+    try:
+        asyncio.run(run())
+    finally:
+        result_queue.put((_MSG_EXIT, worker_id, None, None))
+
+
+def _shard(task_ids: List[int], num_workers: int) -> List[Deque[int]]:
+    """Split task IDs round-robin so every shard gets a similar template mix."""
+    shards: List[Deque[int]] = [deque() for _ in range(num_workers)]
+    for i, task_id in enumerate(task_ids):
+        shards[i % num_workers].append(task_id)
+    return shards
+
+
+def _next_task(worker_id: int, shards: List[Deque[int]], stats: SweepStats) -> Optional[int]:
+    """Pop from the worker's own shard, or steal from the tail of the largest one."""
+    own = shards[worker_id]
+    if own:
+        return own.popleft()
+    victim = max(range(len(shards)), key=lambda i: len(shards[i]))
+    if shards[victim]:
+        stats.stolen += 1
+        return shards[victim].pop()
+    return None
+
+
+def run_sweep(
+    task_ids: List[int],
+    num_workers: int,
+    evaluate_kwargs: Dict[str, Any],
+    actor_kwargs: Optional[Dict[str, Any]] = None,
+    concurrency: int = 1,
+    on_result: Optional[Callable[[int, dict], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run task IDs across worker processes with work stealing.
+
+    Args:
+        task_ids: Task IDs to evaluate (each becomes one Actor.evaluate call)
+        num_workers: Number of worker processes
+        evaluate_kwargs: Keyword arguments for Actor.evaluate (model, base_url, ...)
+        actor_kwargs: Keyword arguments for Actor() in each worker
+        concurrency: Concurrent episodes per worker
+        on_result: Optional callback (task_id, result) invoked in the coordinator
+
+    Returns:
+        {"results": {task_id: result}, "stats": {...}}
+    """
+    actor_kwargs = dict(actor_kwargs or {})
+    num_workers = max(1, min(num_workers, len(task_ids) or 1))
+
+    # Playwright and asyncio do not survive fork(); always spawn fresh interpreters
+    ctx = mp.get_context("spawn")
+    result_queue = ctx.Queue()
+    task_queues = [ctx.Queue() for _ in range(num_workers)]
+
+    shards = _shard(task_ids, num_workers)
+    stats = SweepStats(total=len(task_ids), per_worker={i: 0 for i in range(num_workers)})
+    results: Dict[int, dict] = {}
+    in_flight: Dict[int, Set[int]] = {i: set() for i in range(num_workers)}
+
+    processes = []
+    for worker_id in range(num_workers):
+        p = ctx.Process(
+            target=_worker_main,
+            args=(worker_id, task_queues[worker_id], result_queue,
+                  actor_kwargs, evaluate_kwargs, concurrency),
+            name=f"liveweb-worker-{worker_id}",
+            daemon=True,
+        )
+        p.start()
+        processes.append(p)
+
+    alive = set(range(num_workers))
+    # Slots per worker that were sent None (shut down; they ask for no more work)
+    finished_slots = {i: 0 for i in range(num_workers)}
+
+    def fail(task_id: int, error: str):
+        result = {"score": 0.0, "success": False, "error": error}
+        results[task_id] = result
+        stats.failed += 1
+        if on_result is not None:
+            on_result(task_id, result)
+
+    def retire_worker(worker_id: int):
+        alive.discard(worker_id)
+        lost = in_flight[worker_id]
+        in_flight[worker_id] = set()
+        # Only workers with slots still asking for work will run requeued tasks
+        accepting = [i for i in alive if finished_slots[i] < concurrency]
+        if lost and accepting:
+            # Requeue onto the shortest accepting shard
+            target = min(accepting, key=lambda i: len(shards[i]))
+            shards[target].extend(lost)
+            stats.requeued += len(lost)
+        else:
+            for task_id in lost:
+                fail(task_id, "worker process died")
+
+    last_liveness_check = time.monotonic()
+
+    def handle_dead_workers():
+        nonlocal last_liveness_check
+        last_liveness_check = time.monotonic()
+        for worker_id in list(alive):
+            if processes[worker_id].exitcode is not None:
+                retire_worker(worker_id)
+
+    try:
+        while alive:
+            # Checked on a timer too: a busy queue never times out, and a crashed
+            # worker's in-flight tasks must not wait for the other workers to go quiet
+            if time.monotonic() - last_liveness_check >= _POLL_INTERVAL:
+                handle_dead_workers()
+                if not alive:
+                    break
+            try:
+                kind, worker_id, task_id, payload = result_queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                handle_dead_workers()
+                continue
+
+            if kind == _MSG_READY:
+                if worker_id not in alive:
+                    continue  # Posted before the worker was found dead
+                next_id = _next_task(worker_id, shards, stats)
+                if next_id is not None:
+                    in_flight[worker_id].add(next_id)
+                else:
+                    finished_slots[worker_id] += 1
+                task_queues[worker_id].put(next_id)
+            elif kind == _MSG_RESULT:
+                in_flight[worker_id].discard(task_id)
+                if worker_id not in alive:
+                    # Finished before the worker died; don't run the requeued copy
+                    for shard in shards:
+                        if task_id in shard:
+                            shard.remove(task_id)
+                            stats.requeued -= 1
+                payload["worker_id"] = worker_id
+                results[task_id] = payload
+                stats.completed += 1
+                stats.per_worker[worker_id] += 1
+                if payload.get("error"):
+                    stats.failed += 1
+                if on_result is not None:
+                    on_result(task_id, payload)
+            elif kind == _MSG_EXIT:
+                processes[worker_id].join(timeout=10)
+                if worker_id in alive:
+                    retire_worker(worker_id)
+                handle_dead_workers()
+
+        # Tasks nobody was left to run (every worker exited or shut down its slots)
+        for shard in shards:
+            while shard:
+                fail(shard.popleft(), "no workers left")
+    finally:
+        for p in processes:
+            if p.is_alive():
+                p.terminate()
+            p.join(timeout=5)
+
+    return {"results": results, "stats": stats.to_dict()}
+
+
+def _parse_task_ids(values: List[str]) -> List[int]:
+    """Parse task IDs from '1 2 3' and/or range syntax '100-200' (inclusive)."""
+    task_ids: List[int] = []
+    for value in values:
+        for part in value.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            if "-" in part:
+                start, end = part.split("-", 1)
+                task_ids.extend(range(int(start), int(end) + 1))
+            else:
+                task_ids.append(int(part))
+    return task_ids
+
+
+def main() -> int:
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(
+        description="LiveWeb Arena - Multi-process sweep over task IDs"
+    )
+    parser.add_argument(
+        "--task-ids",
+        type=str,
+        nargs="+",
+        required=True,
+        help="Task IDs, e.g. '1 2 3', '1-100', '1-50,60-70'",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Concurrent episodes per worker (default: 1)",
+    )
+    parser.add_argument("--model", type=str, default="zai-org/GLM-4.7", help="LLM model name")
+    parser.add_argument("--base-url", type=str, default="https://llm.chutes.ai/v1", help="LLM API base URL")
+    parser.add_argument("--api-key", type=str, default=None, help="API key (default: from API_KEY env var)")
+    parser.add_argument("--timeout", type=int, default=3600, help="Per-episode timeout in seconds")
+    parser.add_argument("--temperature", type=float, default=0.0, help="LLM temperature (default: 0.0)")
+    parser.add_argument(
+        "--conversation-mode",
+        type=str,
+        choices=["single", "multi_turn"],
+        default="single",
+        help="Prompt layout (multi_turn keeps an append-only, prefix-cache friendly history)",
+    )
+    parser.add_argument(
+        "--obs-token-budget",
+        type=int,
+        default=None,
+        help="Compress each step's accessibility tree toward this many tokens",
+    )
+    parser.add_argument(
+        "--early-stop",
+        action="store_true",
+        help="Stop LLM generation as soon as a complete action JSON has been streamed",
+    )
+    parser.add_argument("--hedge", action="store_true", help="Hedge LLM requests with a late first token")
+    parser.add_argument("--hedge-base-url", type=str, default=None, help="Fallback endpoint for hedge requests")
+    parser.add_argument(
+        "--llm-cache",
+        type=str,
+        choices=["read_through", "record", "replay"],
+        default=None,
+        help="On-disk LLM response cache mode",
+    )
+    parser.add_argument(
+        "--batch-validation",
+        action="store_true",
+        help="Validate all subtask answers in a single LLM request",
+    )
+    parser.add_argument(
+        "--no-fast-validation",
+        action="store_true",
+        help="Send every answer to the LLM judge (disable the deterministic fast path)",
+    )
+    parser.add_argument(
+        "--trace-dir",
+        type=str,
+        default=None,
+        help="Write per-episode latency traces as OpenTelemetry JSON to this directory",
+    )
+    parser.add_argument("--cache-dir", type=str, default=None, help="Shared cache directory")
+    parser.add_argument("--live", action="store_true", help="Use live mode (no caching)")
+    parser.add_argument("--verbose", action="store_true", help="Verbose worker logs")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="JSONL output file (default: eval/sweep_yyyy_mm_dd_hh_mm_ss.jsonl)",
+    )
+    args = parser.parse_args()
+
+    api_key = args.api_key or os.getenv("API_KEY") or os.getenv("CHUTES_API_KEY")
+    if not api_key:
+        print("Error: API key required. Set API_KEY or use --api-key")
+        return 1
+
+    task_ids = _parse_task_ids(args.task_ids)
+    if not task_ids:
+        print("Error: no task IDs given")
+        return 1
+
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        from datetime import datetime
+        eval_dir = Path(__file__).parent / "eval"
+        eval_dir.mkdir(exist_ok=True)
+        output_path = eval_dir / f"sweep_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.jsonl"
+
+    actor_kwargs = {
+        "api_key": api_key,
+        "use_cache": not args.live,
+        "verbose": args.verbose,
+        "llm_hedge": args.hedge or bool(args.hedge_base_url),
+        "llm_hedge_base_url": args.hedge_base_url,
+        "llm_cache_mode": args.llm_cache,
+        "batch_validation": args.batch_validation,
+        "fast_validation": not args.no_fast_validation,
+        "trace_dir": args.trace_dir,
+    }
+    if args.cache_dir:
+        actor_kwargs["cache_dir"] = Path(args.cache_dir)
+
+    evaluate_kwargs = {
+        "model": args.model,
+        "base_url": args.base_url,
+        "timeout": args.timeout,
+        "temperature": args.temperature,
+        "conversation_mode": args.conversation_mode,
+        "obs_token_budget": args.obs_token_budget,
+        "early_stop": args.early_stop,
+    }
+
+    print(f"Sweep: {len(task_ids)} tasks, {args.workers} workers x {args.concurrency} slots")
+    print(f"Output: {output_path}")
+    print("-" * 50)
+
+    with open(output_path, "a", encoding="utf-8") as out:
+        def on_result(task_id: int, result: dict):
+            out.write(json.dumps({"task_id": task_id, **result}, ensure_ascii=False) + "\n")
+            out.flush()
+            status = "ERR" if result.get("error") else f"{result.get('score', 0.0):.2f}"
+            print(f"[Sweep] task {task_id} worker {result.get('worker_id')} -> {status}")
+
+        summary = run_sweep(
+            task_ids=task_ids,
+            num_workers=args.workers,
+            evaluate_kwargs=evaluate_kwargs,
+            actor_kwargs=actor_kwargs,
+            concurrency=args.concurrency,
+            on_result=on_result,
+        )
+
+    stats = summary["stats"]
+    scores = [r.get("score", 0.0) for r in summary["results"].values()]
+    print("=" * 50)
+    print(f"Completed: {stats['completed']}/{stats['total']} ({stats['failed']} errors)")
+    print(f"Stolen: {stats['stolen']}, requeued: {stats['requeued']}")
+    print(f"Throughput: {stats['episodes_per_second']:.3f} episodes/s")
+    if scores:
+        print(f"Mean score: {sum(scores) / len(scores):.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())